@@ -0,0 +1,2828 @@
+# tree model, searches and step simulator of the alpha beta visualizer, without GUI dependencies
+# (multiprocessing, the slowest import, is only imported by the functions using a process pool)
+
+import ast
+import functools
+import hashlib
+import json
+import math
+import mmap
+import os
+import random
+import re
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from itertools import accumulate, chain, compress, count, repeat
+from operator import add
+
+NAN = float('nan')
+
+class TreeNode:
+    def __init__(self, is_max):
+        self.is_max = is_max
+        self.children = []
+        self.value = None
+        self.alpha = None
+        self.beta = None
+
+    def is_leaf(self):
+        return len(self.children) == 0
+    
+    def set_value(self, oth):
+        if self.value is not None:
+            v1, v2 = self.value, oth.value
+            self.value = max(v1, v2) if self.is_max else min(v1, v2)
+        else:
+            self.value = oth.value
+    
+    def alpha_beta_propagate_up(self, child):
+        if self.is_max:
+            self.alpha = max(self.alpha, child.value)
+        else:
+            self.beta = min(self.beta, child.value)
+
+    def alpha_beta_propagate_down(self, parent):
+        self.alpha = parent.alpha
+        self.beta = parent.beta
+
+        if self.is_leaf():
+            if self.is_max:
+                self.alpha = self.value
+            else:
+                self.beta = self.value
+    
+    def value_string(self):
+        if self.value is not None:
+            return str(int(self.value)) if self.value.is_integer() else str(self.value)
+        else:
+            return ""
+    
+    # equation is (alpha or beta before the child moved up, child value) to show how the bound was updated
+    def alpha_beta_string(self, equation=None):
+        if self.alpha is None or self.beta is None:
+            return ""
+        
+        # the engines' null window bounds lie one ulp off a value or next to infinity, so bounds are
+        # rounded to 12 digits and the largest floats are shown as infinity
+        def to_string(f):
+            if abs(f) >= sys.float_info.max:
+                return "\u221E" if f > 0 else "-\u221E"
+            return f"{f:.12g}"
+
+        if self.is_max and equation is not None:
+            alpha_string = f"max({to_string(equation[0])}, {to_string(equation[1])}) = {to_string(self.alpha)}"
+        else:
+            alpha_string = to_string(self.alpha)
+        
+        if not self.is_max and equation is not None:
+            beta_string = f"min({to_string(equation[0])}, {to_string(equation[1])}) = {to_string(self.beta)}"
+        else:
+            beta_string = to_string(self.beta)
+
+        return f"\u03B1: {alpha_string}\n\u03B2: {beta_string}"
+            
+    # creates TreeNode structure from the given structure and leaf values
+    def generate_tree(tree_structure_lst, leaf_values):
+        root = TreeNode(True)
+        prev_layer = [root]
+        
+        for layer_degrees in tree_structure_lst:
+            curr_layer = []
+            for i, degree in enumerate(layer_degrees):
+                prev_layer[i].children = [TreeNode(not prev_layer[i].is_max) for d in range(degree)]
+                curr_layer.extend(prev_layer[i].children)
+            prev_layer = curr_layer
+        
+        # set leaf values
+        for i, node in enumerate(prev_layer):
+            node.value = leaf_values[i]
+
+        return root
+
+    # sets the values of the leaves below the node from left to right
+    def set_leaf_values(self, leaf_values):
+        leaf_values = iter(leaf_values)
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf():
+                node.value = next(leaf_values)
+            else:
+                stack.extend(reversed(node.children))
+
+    # sets nodes positions (on canvas), returns x of the next leaf
+    def set_position(self, curr_x, curr_y, margin_x, margin_y):
+        return TreeLayout(self, curr_x, curr_y, margin_x, margin_y).next_x
+
+    # sets node positions to match the center of the canvas
+    def center_node(self, offset_x, offset_y):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.x -= offset_x
+            node.y -= offset_y
+            stack.extend(node.children)
+
+    # traverses the tree and returns sets of possible x and y
+    def get_possible_coords(self, set_x, set_y):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            set_x.add(node.x)
+            set_y.add(node.y)
+            stack.extend(node.children)
+
+    # returns number of nodes in the subtree
+    def subtree_size(self):
+        size = 0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            size += 1
+            stack.extend(node.children)
+        return size
+
+    # resets alpha, beta and inner values of all nodes visited by a search
+    def reset_search_state(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.alpha is None and node.beta is None:
+                continue
+            node.alpha = None
+            node.beta = None
+            if not node.is_leaf():
+                node.value = None
+                stack.extend(node.children)
+
+# positions nodes on canvas in one iterative pass (leaves left to right, parents centered above
+# their children) and keeps per-layer y values and the bounding box of the tree
+class TreeLayout:
+    def __init__(self, root_node, curr_x, curr_y, margin_x, margin_y):
+        self.root_node = root_node
+        max_depth = 0
+
+        # leaves are the leftmost and rightmost nodes
+        self.min_x = curr_x
+
+        # post-order traversal, expanded marks nodes whose children are already placed
+        stack = [(root_node, 0, False)]
+        while stack:
+            node, depth, expanded = stack.pop()
+
+            if node.is_leaf():
+                node.x = curr_x
+                curr_x += margin_x
+            elif not expanded:
+                stack.append((node, depth, True))
+                stack.extend((child, depth + 1, False) for child in reversed(node.children))
+                continue
+            else:
+                children = node.children
+                node.x = sum(child.x for child in children) / len(children)
+
+            node.y = curr_y + depth * margin_y
+            max_depth = max(max_depth, depth)
+
+        self.next_x = curr_x
+        self.max_x = curr_x - margin_x
+        self.layer_ys = [curr_y + depth * margin_y for depth in range(max_depth + 1)]
+        self.min_y, self.max_y = self.layer_ys[0], self.layer_ys[-1]
+
+    # moves the whole tree by the given offset
+    def center(self, offset_x, offset_y):
+        self.root_node.center_node(offset_x, offset_y)
+
+        self.min_x -= offset_x
+        self.max_x -= offset_x
+        self.min_y -= offset_y
+        self.max_y -= offset_y
+        self.layer_ys = [layer_y - offset_y for layer_y in self.layer_ys]
+
+# flat, array-backed tree store (breadth-first node order, root has index 0)
+class ArrayTree:
+    def __init__(self, degrees, leaf_values):
+        # degrees of internal nodes in breadth-first order, leaves follow them
+        self.no_internal = len(degrees)
+        self.no_nodes = self.no_internal + len(leaf_values)
+
+        # arrays and memoryviews (e.g. memory-mapped input) are used without copying
+        self.degrees = degrees if isinstance(degrees, (array, memoryview)) else array('i', degrees)
+        # children of node i are child_offsets[i], ..., child_offsets[i] + degrees[i] - 1
+        self.child_offsets = array('q', accumulate(self.degrees, initial=1))
+
+        # one is_max flag per node, layers alternate between max and min
+        self.is_max = bytearray(self.no_nodes)
+        layer_start, layer_size, max_layer = 0, 1, True
+        while layer_size > 0:
+            if max_layer:
+                self.is_max[layer_start:layer_start + layer_size] = b"\x01" * layer_size
+            next_start = layer_start + layer_size
+            layer_size = self.child_offsets[min(next_start, self.no_internal)] - next_start
+            layer_start, max_layer = next_start, not max_layer
+
+        # None is stored as NaN, leaf values are kept in a separate buffer
+        self.values = array('d', [NAN]) * self.no_internal
+        self.leaf_values = leaf_values if isinstance(leaf_values, (array, memoryview)) else array('d', leaf_values)
+        self.alpha = array('d', [NAN]) * self.no_nodes
+        self.beta = array('d', [NAN]) * self.no_nodes
+
+        # node positions on canvas
+        self.x = array('d', bytes(8 * self.no_nodes))
+        self.y = array('d', bytes(8 * self.no_nodes))
+
+        self.root = ArrayNode(self, 0)
+
+    # creates ArrayTree from the given structure and leaf values, returns its root node
+    def generate_tree(tree_structure_lst, leaf_values):
+        return ArrayTree(array('i', chain.from_iterable(tree_structure_lst)), leaf_values).root
+
+    # approximate memory used by the arrays (in bytes)
+    def memory_usage(self):
+        arrays = [self.degrees, self.child_offsets, self.values, self.leaf_values, self.alpha, self.beta, self.x, self.y]
+        return len(self.is_max) + sum(arr.itemsize * len(arr) for arr in arrays)
+
+# property reading and writing one entry of a tree array, NaN meaning None
+def array_property(name):
+    def get(node):
+        value = getattr(node.tree, name)[node.idx]
+        return None if value != value else value
+
+    def set(node, value):
+        getattr(node.tree, name)[node.idx] = NAN if value is None else value
+
+    return property(get, set)
+
+# lightweight view of a node inside ArrayTree, behaves like TreeNode
+class ArrayNode(TreeNode):
+    def __init__(self, tree, idx):
+        self.tree = tree
+        self.idx = idx
+
+    @property
+    def value(self):
+        if self.idx >= self.tree.no_internal:
+            return self.tree.leaf_values[self.idx - self.tree.no_internal]
+        value = self.tree.values[self.idx]
+        return None if value != value else value
+
+    @value.setter
+    def value(self, value):
+        if self.idx >= self.tree.no_internal:
+            self.tree.leaf_values[self.idx - self.tree.no_internal] = value
+        else:
+            self.tree.values[self.idx] = NAN if value is None else value
+
+    alpha = array_property("alpha")
+    beta = array_property("beta")
+    x = array_property("x")
+    y = array_property("y")
+
+    @property
+    def is_max(self):
+        return self.tree.is_max[self.idx] == 1
+
+    @property
+    def children(self):
+        if self.idx >= self.tree.no_internal:
+            return []
+        offset = self.tree.child_offsets[self.idx]
+        return [ArrayNode(self.tree, i) for i in range(offset, offset + self.tree.degrees[self.idx])]
+
+    def is_leaf(self):
+        return self.idx >= self.tree.no_internal
+
+    # the root moves the whole x and y arrays at once
+    def center_node(self, offset_x, offset_y):
+        if self.idx != 0:
+            return TreeNode.center_node(self, offset_x, offset_y)
+        self.tree.x = array('d', (x - offset_x for x in self.tree.x))
+        self.tree.y = array('d', (y - offset_y for y in self.tree.y))
+
+    # the root takes over the whole leaf values buffer
+    def set_leaf_values(self, leaf_values):
+        if self.idx != 0:
+            return TreeNode.set_leaf_values(self, leaf_values)
+        self.tree.leaf_values = leaf_values if isinstance(leaf_values, (array, memoryview)) else array('d', leaf_values)
+
+    # subtree of a node covers one contiguous index range per layer
+    def subtree_size(self):
+        size = 0
+        first, last = self.idx, self.idx + 1
+        while True:
+            size += last - first
+            if first >= self.tree.no_internal:
+                return size
+            first, last = self.tree.child_offsets[first], self.tree.child_offsets[last]
+
+    def __eq__(self, oth):
+        return isinstance(oth, ArrayNode) and self.idx == oth.idx and self.tree is oth.tree
+
+    def __hash__(self):
+        return hash((id(self.tree), self.idx))
+
+# digest of the contents of a sequence of arrays (lists are converted to typecode arrays),
+# used as cache key of inputs too large to be kept as keys themselves
+def array_digest(arrays, typecode):
+    digest = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        digest.update(arr if isinstance(arr, (array, memoryview)) else array(typecode, arr))
+    return digest.digest()
+
+# least recently used cache of built trees with their layouts, keyed by kind of tree store and
+# structure (degrees in breadth-first order determine the tree), holding at most max_nodes nodes
+# (the last tree is kept even if it is larger); a cached tree is reused for other leaf values,
+# which are written into it, so neither the tree nor its layout is built again
+class TreeCache:
+    def __init__(self, max_nodes=2000000):
+        self.max_nodes = max_nodes
+        # (kind, structure digest) -> [root node, layout, leaf values digest, number of nodes,
+        # results derived from searching the tree with these leaf values]
+        self.entries = OrderedDict()
+        self.no_nodes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # root node and layout of a tree: cached ones get their search state cleared and the given
+    # leaf values if they differ, otherwise build() creates the root node and layout(root_node) lays it out
+    def get(self, kind, structure, leaf_values, build, layout):
+        key = (kind, array_digest(structure, 'i'))
+        leaves_key = array_digest([leaf_values], 'd')
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            root_node = entry[0]
+            root_node.reset_search_state()
+            if entry[2] != leaves_key:
+                root_node.set_leaf_values(leaf_values)
+                entry[2] = leaves_key
+                entry[4].clear()
+            return root_node, entry[1]
+
+        self.misses += 1
+        root_node = build()
+        entry = [root_node, layout(root_node), leaves_key, root_node.subtree_size(), {}]
+        self.entries[key] = entry
+        self.no_nodes += entry[3]
+
+        while self.no_nodes > self.max_nodes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.no_nodes -= evicted[3]
+        return root_node, entry[1]
+
+    def find(self, root_node):
+        for entry in self.entries.values():
+            if entry[0] is root_node:
+                return entry
+        return None
+
+    # dict for results derived from searching a cached tree (step counts, engine stats, minimax values), emptied
+    # when its leaf values change; None if the tree is not cached
+    def results(self, root_node):
+        entry = self.find(root_node)
+        return None if entry is None else entry[4]
+
+    # a leaf of a cached tree was changed in place: the next get() writes the given leaf values
+    # again, even if they are the ones the tree was cached with
+    def leaves_changed(self, root_node):
+        entry = self.find(root_node)
+        if entry is not None:
+            entry[2] = None
+            entry[4].clear()
+
+    def clear(self):
+        self.entries.clear()
+        self.no_nodes = 0
+
+# array formats of supported .npy dtypes
+NPY_FORMATS = {"<i4": "i", "<i8": "q", "<f8": "d"}
+
+# maps a binary array file (raw values in raw_format or .npy) into memory and returns
+# a memoryview over its values, nothing is copied and writes never reach the file
+def map_array_file(path, raw_format):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path} is empty")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    view = memoryview(data)
+    fmt, offset = raw_format, 0
+
+    if view[:6] == b"\x93NUMPY":
+        # .npy header: magic, version, header length and a python dict literal
+        if view[6] == 1:
+            header_len, offset = int.from_bytes(view[8:10], "little"), 10
+        else:
+            header_len, offset = int.from_bytes(view[8:12], "little"), 12
+        header = ast.literal_eval(bytes(view[offset:offset + header_len]).decode("latin1"))
+        offset += header_len
+
+        if header["descr"] not in NPY_FORMATS:
+            raise ValueError(f"{path}: unsupported dtype {header['descr']}")
+        if len(header["shape"]) != 1:
+            raise ValueError(f"{path}: expected a 1-D array, got shape {header['shape']}")
+        fmt = NPY_FORMATS[header["descr"]]
+
+    if (len(view) - offset) % struct.calcsize(fmt) != 0:
+        raise ValueError(f"{path}: size is not a multiple of {struct.calcsize(fmt)} bytes")
+
+    return view[offset:].cast(fmt)
+
+# checks binary input (degrees of internal nodes in breadth-first order and leaf values),
+# raises ValueError describing the first problem
+def validate_binary_input(degrees, leaf_values):
+    if len(degrees) == 0:
+        raise ValueError("tree structure is empty")
+    if min(degrees) <= 0:
+        raise ValueError("all degrees must be positive")
+
+    # degree sum of each layer is the size of the next layer
+    layer_start, layer_size = 0, 1
+    while layer_start < len(degrees):
+        layer_degrees = degrees[layer_start:layer_start + layer_size]
+        if len(layer_degrees) != layer_size:
+            raise ValueError(f"last layer has {len(layer_degrees)} degrees, expected {layer_size}")
+        layer_start, layer_size = layer_start + layer_size, sum(layer_degrees)
+
+    if len(leaf_values) != layer_size:
+        raise ValueError(f"got {len(leaf_values)} leaf values, tree structure needs {layer_size}")
+    if any(map(math.isnan, leaf_values)):
+        raise ValueError("leaf values contain NaN")
+
+# invalid text input, field is "structure" or "leaves", position is the index of the
+# offending character in the input string
+class InputError(ValueError):
+    def __init__(self, message, field, position=None):
+        ValueError.__init__(self, message)
+        self.field = field
+        self.position = position
+
+# tokens of the text input (whitespace around them is skipped); runs of tokens separated by bare
+# commas are taken at once up to their stop character and converted by split and map
+SPACE = re.compile(r"\s*")
+INTEGER = re.compile(r"[0-9]+")
+INTEGER_RUN_STOP = re.compile(r"[^0-9,]")
+NUMBER_RUN_STOP = re.compile(r"[\s*|]")
+# degrees are stored as int32
+MAX_DEGREE = 2 ** 31 - 1
+# larger trees would not fit into memory when built (and shorthands would expand into huge arrays)
+MAX_NODES = 2 ** 25
+
+# reads one field of the text input from left to right, errors report the column they were found at
+class InputScanner:
+    def __init__(self, text, field):
+        self.text = text
+        self.field = field
+        self.pos = SPACE.match(text).end()
+
+    def error(self, message, pos=None):
+        pos = self.pos if pos is None else pos
+        return InputError(f"{message} at column {pos + 1}", self.field, pos)
+
+    def expected(self, what):
+        found = repr(self.text[self.pos]) if self.pos < len(self.text) else "end of input"
+        return self.error(f"expected {what}, found {found}")
+
+    # consumes the given token if it comes next
+    def accept(self, token):
+        if not self.text.startswith(token, self.pos):
+            return False
+        self.skip(self.pos + len(token))
+        return True
+
+    def expect_end(self, expected):
+        if self.pos != len(self.text):
+            raise self.expected(expected)
+
+    def skip(self, end):
+        self.pos = SPACE.match(self.text, end).end()
+
+    def integer(self, what, minimum=1):
+        match = INTEGER.match(self.text, self.pos)
+        if match is None:
+            raise self.expected(what)
+        value = int(match.group())
+        if value < minimum:
+            raise self.error(f"{what} {value} is out of range")
+        self.skip(match.end())
+        return value
+
+    # tokens from the current position up to the stop character, returns (start, tokens);
+    # the runs below also return the converted values
+    def run(self, stop, what):
+        start = self.pos
+        match = stop.search(self.text, start)
+        end = len(self.text) if match is None else match.start()
+        tokens = self.text[start:end].split(",")
+
+        # a trailing comma is left to the caller (whitespace follows it)
+        if len(tokens) > 1 and tokens[-1] == "":
+            tokens.pop()
+            end -= 1
+        if "" in tokens:
+            self.pos = token_position(start, tokens, tokens.index(""))
+            raise self.expected(what)
+
+        self.skip(end)
+        return start, tokens
+
+    def integer_run(self, what, minimum=1, maximum=None):
+        start, tokens = self.run(INTEGER_RUN_STOP, what)
+        values = list(map(int, tokens))
+
+        if min(values) < minimum or maximum is not None and max(values) > maximum:
+            i = next(i for i, value in enumerate(values) if value < minimum or maximum is not None and value > maximum)
+            raise self.error(f"{what} {values[i]} is out of range", token_position(start, tokens, i))
+        return start, tokens, values
+
+    # NaN is rejected, the step log and array trees store None as NaN
+    def number_run(self):
+        start, tokens = self.run(NUMBER_RUN_STOP, "a leaf value")
+        try:
+            values = array('d', map(float, tokens))
+        except ValueError:
+            for i, token in enumerate(tokens):
+                try:
+                    float(token)
+                except ValueError:
+                    raise self.error(f"leaf value '{token}' is not a number", token_position(start, tokens, i))
+        for i, value in enumerate(values):
+            if value != value:
+                raise self.error(f"leaf value '{tokens[i]}' is not a number", token_position(start, tokens, i))
+        return start, tokens, values
+
+# position of the index-th of the comma separated tokens starting at start
+def token_position(start, tokens, index):
+    return start + sum(map(len, tokens[:index])) + index
+
+# parses the tree structure of the text input in one pass: comma separated degrees of every layer,
+# layers separated by '|' (e.g. "2|2,2"), where "3*1000" repeats a degree 1000 times,
+# or "b^d" for a uniform tree of branching b and depth d; layers are int32 arrays, trees of more
+# than MAX_NODES nodes are rejected before they are expanded
+def parse_tree_structure(tree_structure_str):
+    scanner = InputScanner(tree_structure_str, "structure")
+    run_start, tokens, degrees = scanner.integer_run("degree", maximum=MAX_DEGREE)
+
+    if len(degrees) == 1 and scanner.accept("^"):
+        depth_start = scanner.pos
+        depth = scanner.integer("depth")
+        scanner.expect_end("end of input after the depth")
+
+        # with branching of at least 2, 64 layers are more than the limit
+        if degrees[0] == 1:
+            no_nodes = depth + 1
+        else:
+            no_nodes, layer_size = 1, 1
+            for _ in range(min(depth, 64)):
+                layer_size *= degrees[0]
+                no_nodes += layer_size
+        if no_nodes > MAX_NODES:
+            raise scanner.error(f"tree has more than {MAX_NODES} nodes", depth_start)
+        # the layers are repeated degrees, so they are built without expanding the input
+        return [array('i', degrees) * degrees[0] ** l for l in range(depth)]
+
+    tree_structure_lst = []
+    layer_degrees = array('i')
+    layer_start = run_start
+    # degree counts from upper layers should match with current layer
+    expected_no_nodes = 1
+    no_nodes = 1
+
+    while True:
+        if len(layer_degrees) + len(degrees) > expected_no_nodes:
+            raise scanner.error(f"layer {len(tree_structure_lst) + 1} has more than {expected_no_nodes} degrees",
+                                token_position(run_start, tokens, expected_no_nodes - len(layer_degrees)))
+        layer_degrees.extend(degrees)
+
+        # repeat count of the last degree
+        if scanner.accept("*"):
+            count_start = scanner.pos
+            count = scanner.integer("repeat count")
+            if len(layer_degrees) + count - 1 > expected_no_nodes:
+                raise scanner.error(f"layer {len(tree_structure_lst) + 1} has more than {expected_no_nodes} degrees", count_start)
+            layer_degrees.extend(array('i', degrees[-1:]) * (count - 1))
+
+        if scanner.accept(","):
+            run_start, tokens, degrees = scanner.integer_run("degree", maximum=MAX_DEGREE)
+            continue
+
+        if len(layer_degrees) != expected_no_nodes:
+            raise scanner.error(f"layer {len(tree_structure_lst) + 1} has {len(layer_degrees)} degrees, expected {expected_no_nodes}")
+        tree_structure_lst.append(layer_degrees)
+
+        # the next layer (or the leaves) must not exceed the node limit, checked before it is read
+        expected_no_nodes = sum(layer_degrees)
+        no_nodes += expected_no_nodes
+        if no_nodes > MAX_NODES:
+            raise scanner.error(f"tree has more than {MAX_NODES} nodes", layer_start)
+
+        if not scanner.accept("|"):
+            scanner.expect_end("',', '|' or end of input")
+            return tree_structure_lst
+
+        layer_degrees = array('i')
+        layer_start = scanner.pos
+        run_start, tokens, degrees = scanner.integer_run("degree", maximum=MAX_DEGREE)
+
+# parses the leaf values of the text input in one pass: comma separated numbers, where "2.5*100"
+# repeats a value 100 times, "range" numbers the leaves 0, 1, 2, ... and "seed:<n>" draws
+# integer values in -128..127 from a random generator seeded with n (one random byte per leaf); returns a float64 array of no_leaves values
+def parse_leaf_values(leaf_values_str, no_leaves):
+    scanner = InputScanner(leaf_values_str, "leaves")
+
+    if scanner.accept("range"):
+        scanner.expect_end("end of input after 'range'")
+        return array('d', range(no_leaves))
+
+    if scanner.accept("seed"):
+        if not scanner.accept(":"):
+            raise scanner.expected("':' after 'seed'")
+        rnd = random.Random(scanner.integer("seed", 0))
+        scanner.expect_end("end of input after the seed")
+        return array('d', array('b', rnd.randbytes(no_leaves)))
+
+    leaf_values = array('d')
+    while True:
+        run_start, tokens, values = scanner.number_run()
+        # number of leafs should match degree count from last layer
+        if len(leaf_values) + len(values) > no_leaves:
+            raise scanner.error(f"more than {no_leaves} leaf values", token_position(run_start, tokens, no_leaves - len(leaf_values)))
+        leaf_values.extend(values)
+
+        # repeat count of the last value
+        if scanner.accept("*"):
+            count_start = scanner.pos
+            count = scanner.integer("repeat count")
+            if len(leaf_values) + count - 1 > no_leaves:
+                raise scanner.error(f"more than {no_leaves} leaf values", count_start)
+            leaf_values.extend(values[-1:] * (count - 1))
+
+        if not scanner.accept(","):
+            scanner.expect_end("',' or end of input")
+            break
+
+    if len(leaf_values) != no_leaves:
+        raise scanner.error(f"{len(leaf_values)} leaf values, expected {no_leaves}")
+    return leaf_values
+
+# parses the text input of the app (see parse_tree_structure and parse_leaf_values),
+# returns (tree_structure_lst, leaf_values) or raises InputError at the first error
+def parse_tree_input(tree_structure_str, leaf_values_str):
+    tree_structure_lst = parse_tree_structure(tree_structure_str)
+    return tree_structure_lst, parse_leaf_values(leaf_values_str, sum(tree_structure_lst[-1]))
+
+# tree whose nodes are only created once the search descends into their parent,
+# leaf values come from a callable (leaf_values(i)) or an indexed source (leaf_values[i])
+class LazyTree:
+    def __init__(self, tree_structure_lst, leaf_values):
+        self.tree_structure_lst = tree_structure_lst
+        self.depth = len(tree_structure_lst)
+        self.leaf_value = leaf_values if callable(leaf_values) else leaf_values.__getitem__
+
+        # index (within the next layer) of the first child of every node
+        self.child_offsets = [array('q', accumulate(layer_degrees, initial=0)) for layer_degrees in tree_structure_lst]
+
+        self.no_nodes = 1 + sum(offsets[-1] for offsets in self.child_offsets)
+        self.no_materialized = 1
+
+        self.root = LazyTreeNode(self, True, 0, 0)
+
+    # creates LazyTree from the given structure and leaf value source, returns its root node
+    def generate_tree(tree_structure_lst, leaf_values):
+        return LazyTree(tree_structure_lst, leaf_values).root
+
+# TreeNode that creates its children on first access
+class LazyTreeNode(TreeNode):
+    def __init__(self, tree, is_max, layer, idx):
+        self.tree = tree
+        self.is_max = is_max
+        self.layer = layer
+        self.idx = idx
+        self.materialized_children = None
+
+        self.value = tree.leaf_value(idx) if layer == tree.depth else None
+        self.alpha = None
+        self.beta = None
+
+    @property
+    def children(self):
+        if self.materialized_children is None:
+            if self.is_leaf():
+                self.materialized_children = []
+            else:
+                offsets = self.tree.child_offsets[self.layer]
+                first, last = offsets[self.idx], offsets[self.idx + 1]
+                self.materialized_children = [LazyTreeNode(self.tree, not self.is_max, self.layer + 1, i) for i in range(first, last)]
+                self.tree.no_materialized += last - first
+
+        return self.materialized_children
+
+    def is_leaf(self):
+        return self.layer == self.tree.depth
+
+    # counts the subtree from the tree structure, without materializing it
+    def subtree_size(self):
+        size = 0
+        first, last = self.idx, self.idx + 1
+        for offsets in self.tree.child_offsets[self.layer:]:
+            size += last - first
+            first, last = offsets[first], offsets[last]
+        return size + last - first
+
+# tree of game positions for anytime search: the children of a node come from moves(position),
+# nodes at the depth limit or without moves are leaves scored by evaluate(position) (from the max
+# player's point of view); moves and scores are generated once and kept when the depth limit grows
+class GameTree:
+    def __init__(self, root_position, moves, evaluate, depth_limit=1):
+        self.moves = moves
+        self.evaluate = evaluate
+        self.depth_limit = depth_limit
+
+        self.no_expanded = 0
+        self.no_evaluated = 0
+        # nodes copied by the last snapshot
+        self.no_copied = 0
+
+        self.root = GameTreeNode(self, root_position, True, 0, 0)
+
+    # copies the tree up to the current depth limit into TreeNodes (in the current move order),
+    # generates and evaluates all of it; gives up and returns None once more than max_nodes
+    # nodes were copied or time.perf_counter() passed deadline
+    def snapshot(self, max_nodes=None, deadline=None):
+        root = TreeNode(True)
+        self.no_copied = 1
+        stack = [(self.root, root)]
+        while stack:
+            if max_nodes is not None and self.no_copied > max_nodes:
+                return None
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+
+            game_node, node = stack.pop()
+            children = game_node.children
+            if children:
+                node.children = [TreeNode(not node.is_max) for _ in children]
+                stack.extend(zip(children, node.children))
+                self.no_copied += len(children)
+            else:
+                node.value = game_node.value
+        return root
+
+# TreeNode of a game position, move is the index of the node in moves(parent position)
+class GameTreeNode(TreeNode):
+    def __init__(self, tree, position, is_max, depth, move):
+        self.tree = tree
+        self.position = position
+        self.is_max = is_max
+        self.depth = depth
+        self.move = move
+
+        self.expanded_children = None
+        self.score = None
+        self.search_value = None
+        self.alpha = None
+        self.beta = None
+
+    @property
+    def children(self):
+        if self.depth >= self.tree.depth_limit:
+            return []
+        if self.expanded_children is None:
+            positions = self.tree.moves(self.position)
+            self.expanded_children = [GameTreeNode(self.tree, position, not self.is_max, self.depth + 1, i) for i, position in enumerate(positions)]
+            self.tree.no_expanded += 1
+        return self.expanded_children
+
+    # leaves are evaluated on first access, inner nodes hold the value of the current search
+    @property
+    def value(self):
+        if not self.is_leaf():
+            return self.search_value
+        if self.score is None:
+            self.score = float(self.tree.evaluate(self.position))
+            self.tree.no_evaluated += 1
+        return self.score
+
+    @value.setter
+    def value(self, value):
+        if not self.is_leaf():
+            self.search_value = value
+
+    # searched children first (best for this node first), unsearched ones keep their order
+    def order_children(self):
+        sign = -1 if self.is_max else 1
+        self.expanded_children.sort(key=lambda child: (0, sign * child.value) if child.alpha is not None else (1, 0))
+
+# result of a headless alpha beta search
+class SearchResult:
+    def __init__(self, value, cutoffs, visited, pruned):
+        self.value = value
+        # (parent, cutoff_idx) pairs in the order the simulator records them
+        self.cutoffs = cutoffs
+        # number of nodes the search entered and number of nodes in pruned subtrees
+        self.visited = visited
+        self.pruned = pruned
+
+# runs alpha beta search to the end without per-step undo bookkeeping,
+# applies the same node updates in the same order as AlphaBetaSimulator.forward,
+# so the resulting tree state and cutoffs match stepping through the simulator
+def alpha_beta_search(root_node):
+    root_node.alpha = float('-inf')
+    root_node.beta = float('inf')
+
+    cutoffs, visited, pruned = continue_alpha_beta([root_node], [0])
+    return SearchResult(root_node.value, cutoffs, visited + 1, pruned)
+
+# goes on with alpha beta search from a path of entered nodes (the first one is left last) with the
+# index of the next child to enter of every node on it, until the first node of the path is left;
+# returns the cutoffs, the number of nodes entered and the number of nodes in pruned subtrees
+def continue_alpha_beta(path, next_child):
+    cutoffs = []
+    visited = 0
+    pruned = 0
+
+    # current path with children and index of next unvisited child for every node on it
+    path = list(path)
+    path_children = [node.children for node in path]
+    next_child = list(next_child)
+
+    while path:
+        node = path[-1]
+        children = path_children[-1]
+
+        if children:
+            next_child_idx = next_child[-1]
+
+            # is there a cutoff?
+            if node.alpha >= node.beta:
+                cutoffs.append((node, next_child_idx))
+                for child in children[next_child_idx:]:
+                    pruned += child.subtree_size()
+
+            # is there any unvisited child?
+            elif next_child_idx < len(children):
+                next_child[-1] += 1
+                child = children[next_child_idx]
+                child.alpha_beta_propagate_down(node)
+
+                if not child.is_leaf():
+                    child.value = None
+
+                path.append(child)
+                path_children.append(child.children)
+                next_child.append(0)
+                visited += 1
+                continue
+
+        # node is done, move up
+        path.pop()
+        path_children.pop()
+        next_child.pop()
+
+        if path:
+            path[-1].set_value(node)
+            path[-1].alpha_beta_propagate_up(node)
+
+    return cutoffs, visited, pruned
+
+# result of one deepening iteration of anytime_search, best_move is the index of the best
+# root move in moves(root position) (None if the root has no moves or nothing was searched)
+class IterationResult:
+    def __init__(self, depth, value, best_move, visited, complete, tree=None):
+        self.depth = depth
+        self.value = value
+        self.best_move = best_move
+        self.visited = visited
+        # False if the budget or the deadline ran out during the iteration
+        self.complete = complete
+        # copy of the tree as the iteration searched it (GameTree.snapshot), if asked for
+        self.tree = tree
+
+# result of anytime_search: best is the last complete iteration (None if even depth 1 did not finish),
+# stopped is "depth" (max_depth reached or the whole game searched), "nodes" or "time"
+class AnytimeResult:
+    def __init__(self, iterations, visited, stopped):
+        self.iterations = iterations
+        self.visited = visited
+        self.stopped = stopped
+        complete = [iteration for iteration in iterations if iteration.complete]
+        self.best = complete[-1] if complete else None
+
+# iterative deepening alpha beta over a GameTree: searches with depth limit 1, 2, ... max_depth (None
+# for no limit), every node tries its children in the order of their values from the previous
+# iteration (best first); stops once node_budget nodes were visited in total or time.perf_counter()
+# passed deadline, and returns the results of all iterations; on_iteration(depth, tree) is called
+# before every iteration; with snapshots, every iteration keeps a copy of the tree taken before it is
+# searched, the copied nodes count against node_budget and copying stops at the deadline (the
+# search then stops before that iteration)
+def anytime_search(tree, max_depth=None, node_budget=None, deadline=None, on_iteration=None, snapshots=False):
+    iterations = []
+    visited = 0
+    stopped = "depth"
+    depth = 0
+
+    while max_depth is None or depth < max_depth:
+        depth += 1
+        tree.depth_limit = depth
+        tree.root.reset_search_state()
+        if on_iteration is not None:
+            on_iteration(depth, tree)
+
+        snapshot = None
+        if snapshots:
+            snapshot = tree.snapshot(None if node_budget is None else node_budget - visited, deadline)
+            if snapshot is None:
+                stopped = "time" if deadline is not None and time.perf_counter() >= deadline else "nodes"
+                break
+            visited += tree.no_copied
+
+        root_node = tree.root
+        root_node.alpha = float('-inf')
+        root_node.beta = float('inf')
+        visited += 1
+        iteration_visited = 1
+        # did the search stop at a node with possible moves below the limit?
+        reached_limit = False
+
+        path = [root_node]
+        path_children = [root_node.children]
+        next_child = [0]
+
+        while path:
+            if node_budget is not None and visited >= node_budget:
+                stopped = "nodes"
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                stopped = "time"
+                break
+
+            node = path[-1]
+            children = path_children[-1]
+
+            if children and node.alpha < node.beta and next_child[-1] < len(children):
+                child = children[next_child[-1]]
+                next_child[-1] += 1
+                child.alpha_beta_propagate_down(node)
+
+                if not child.is_leaf():
+                    child.value = None
+                reached_limit = reached_limit or child.depth == depth
+
+                path.append(child)
+                path_children.append(child.children)
+                next_child.append(0)
+                visited += 1
+                iteration_visited += 1
+                continue
+
+            # node is done, move up
+            path.pop()
+            path_children.pop()
+            next_child.pop()
+
+            if children:
+                node.order_children()
+            if path:
+                path[-1].set_value(node)
+                path[-1].alpha_beta_propagate_up(node)
+
+        complete = not path
+        # a finished root has its children ordered, best first
+        best_move = root_node.children[0].move if complete and root_node.children else None
+        iterations.append(IterationResult(depth, root_node.value, best_move, iteration_visited, complete, snapshot))
+
+        if not complete or not reached_limit:
+            break
+
+    return AnytimeResult(iterations, visited, stopped)
+
+# exact minimax value (no pruning) of every node by NodeIndex id, kept up to date when a leaf changes:
+# only the leaf's ancestors are evaluated again, from the cached values of their children,
+# up to the first ancestor whose value stays the same
+class MinimaxValues:
+    def __init__(self, root_node):
+        self.index = NodeIndex(root_node)
+        tree = self.index.tree
+
+        # built from ids and degrees in breadth-first order, where the children of a node have
+        # consecutive ids (other nodes get their ids in that order first)
+        if tree is not None:
+            degrees = array('q', tree.degrees) + array('q', [0]) * (tree.no_nodes - tree.no_internal)
+            is_max = tree.is_max
+            self.values = array('d', [NAN]) * tree.no_internal + array('d', tree.leaf_values)
+        else:
+            nodes = self.index.number_breadth_first()
+            degrees = array('q', [len(node.children) for node in nodes])
+            is_max = bytes(node.is_max for node in nodes)
+            self.values = array('d', [NAN if node.children else node.value for node in nodes])
+        # children of node i are child_offsets[i], ..., child_offsets[i + 1] - 1
+        self.child_offsets = array('q', accumulate(degrees, initial=1))
+        inner = [node_id for node_id, degree in enumerate(degrees) if degree]
+
+        self.parents = array('q', [-1])
+        self.parents.extend(chain.from_iterable(map(repeat, inner, (degrees[node_id] for node_id in inner))))
+
+        # inner nodes are evaluated after their children, counting the leaves below them
+        self.no_leaves = array('q', [0 if degree else 1 for degree in degrees])
+        for node_id in reversed(inner):
+            children = slice(self.child_offsets[node_id], self.child_offsets[node_id + 1])
+            self.values[node_id] = max(self.values[children]) if is_max[node_id] else min(self.values[children])
+            self.no_leaves[node_id] = sum(self.no_leaves[children])
+
+    def value(self, node):
+        return self.values[self.index.id(node)]
+
+    # number of a leaf from left to right (the order of the leaf values input), counting the leaves
+    # below the earlier siblings of the leaf and of every ancestor; -1 for inner nodes
+    def leaf_number(self, node):
+        node_id = self.index.id(node)
+        if self.child_offsets[node_id + 1] > self.child_offsets[node_id]:
+            return -1
+        number = 0
+        parent_id = self.parents[node_id]
+        while parent_id >= 0:
+            number += sum(self.no_leaves[self.child_offsets[parent_id]:node_id])
+            node_id, parent_id = parent_id, self.parents[parent_id]
+        return number
+
+    # nodes from the root down to node
+    def path(self, node):
+        path = [node]
+        node_id = self.parents[self.index.id(node)]
+        while node_id >= 0:
+            path.append(self.index.node(node_id))
+            node_id = self.parents[node_id]
+        path.reverse()
+        return path
+
+    # minimax value of an inner node from the cached values of its children
+    def evaluate(self, node):
+        node_id = self.index.id(node)
+        child_values = self.values[self.child_offsets[node_id]:self.child_offsets[node_id + 1]]
+        return max(child_values) if node.is_max else min(child_values)
+
+    # sets the cached value of a leaf, returns the nodes whose value changed (the leaf first)
+    def update_leaf(self, node, value):
+        node_id = self.index.id(node)
+        changed = []
+        while self.values[node_id] != value:
+            self.values[node_id] = value
+            changed.append(node)
+            node_id = self.parents[node_id]
+            if node_id < 0:
+                break
+            node = self.index.node(node_id)
+            value = self.evaluate(node)
+        return changed
+
+# hash-conses identical subtrees (same shape, same min/max layers and leaf values): every distinct
+# subtree gets one id and inner subtrees are keyed by the ids of their children, so the ids form a DAG
+class SubtreeDAG:
+    def __init__(self, root_node):
+        # (is_max, leaf value) or (is_max, ids of children) -> subtree id
+        self.ids = {}
+        # node -> id of its subtree
+        self.node_ids = {}
+
+        stack = [(root_node, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node.is_leaf():
+                key = (node.is_max, node.value)
+            elif not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+                continue
+            else:
+                key = (node.is_max, tuple(self.node_ids[child] for child in node.children))
+            self.node_ids[node] = self.ids.setdefault(key, len(self.ids))
+
+    def __getitem__(self, node):
+        return self.node_ids[node]
+
+    # number of distinct subtrees and number of nodes
+    def size(self):
+        return len(self.ids), len(self.node_ids)
+
+# bounded transposition table keyed by subtree id, stores the value and bound type of finished
+# searches and evicts the least recently used entry when full
+class TranspositionTable:
+    EXACT = "exact"
+    LOWER = "lower"
+    UPPER = "upper"
+
+    def __init__(self, subtrees, capacity=100000):
+        self.subtrees = subtrees
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self):
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # returns the stored value if it decides the node within the window, None otherwise
+    def lookup(self, node, alpha, beta):
+        key = self.subtrees[node]
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            value, bound = entry
+            if bound == self.EXACT or (bound == self.LOWER and value >= beta) or (bound == self.UPPER and value <= alpha):
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    # stores a (fail-soft) search result of the node searched with the given window
+    def store(self, node, value, alpha, beta):
+        if value <= alpha:
+            bound = self.UPPER
+        elif value >= beta:
+            bound = self.LOWER
+        else:
+            bound = self.EXACT
+
+        key = self.subtrees[node]
+        self.entries[key] = (value, bound)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+# state of one node on the explicit stack of a search pass
+class SearchFrame:
+    def __init__(self, node):
+        self.node = node
+        self.children = node.children
+        # index of the next unsearched child
+        self.next_idx = 0
+        # window the node was searched with (after narrowing by stored bounds)
+        self.alpha = None
+        self.beta = None
+        # node needs no further search (leaf or decided by stored bounds)
+        self.done = False
+        # window for searching the current child again, None to move on to the next child
+        self.research = None
+        # node was answered from the transposition table
+        self.from_table = False
+        # bound the current child was tested against with a null window (None for a full window)
+        self.scout = None
+        self.cutoff = None
+
+# base class of pluggable search engines, an engine yields the same actions the simulator
+# records in forward, so stepping, seeking and rendering work the same for all of them
+class SearchEngine:
+    name = "Alpha-beta"
+
+    # optional TranspositionTable shared by identical subtrees, cleared at the start of every search
+    def __init__(self, table=None):
+        self.table = table
+
+    # generates (action, changed node, cutoff) triples of the whole search
+    def steps(self, root_node):
+        if self.table is not None:
+            self.table.clear()
+        cutoff = yield from self.search_pass(root_node, float('-inf'), float('inf'))
+        yield ('END', cutoff is not None), None, cutoff
+
+    # runs the whole search without a simulator, revisited nodes are counted every time
+    def solve(self, root_node):
+        cutoffs = []
+        visited = 0
+        visited_nodes = set()
+
+        for action, node, cutoff in self.steps(root_node):
+            if action[0] in ('INIT', 'MOVE_DOWN'):
+                visited += 1
+                visited_nodes.add(node)
+            if cutoff is not None:
+                cutoffs.append(cutoff)
+
+        return SearchResult(root_node.value, cutoffs, visited, root_node.subtree_size() - len(visited_nodes))
+
+    # window for the next child, plain alpha beta passes the node's window down
+    def child_window(self, frame):
+        return frame.node.alpha, frame.node.beta
+
+    # window for searching the child that just returned again, None to move on
+    def research_window(self, frame, child):
+        return None
+
+    # enters node with the given window, memory maps nodes to (lower, upper) bounds of earlier passes
+    def enter(self, node, alpha, beta, memory):
+        frame = SearchFrame(node)
+        node.alpha = alpha
+        node.beta = beta
+
+        if node.is_leaf():
+            if node.is_max:
+                node.alpha = node.value
+            else:
+                node.beta = node.value
+            frame.done = True
+        else:
+            node.value = None
+            value = self.table.lookup(node, alpha, beta) if self.table is not None else None
+            bounds = memory.get(node) if memory is not None else None
+            if value is not None:
+                node.value = value
+                frame.done = True
+                frame.from_table = True
+            elif bounds is not None:
+                lower, upper = bounds
+                if lower >= beta or lower == upper:
+                    node.value = lower
+                    frame.done = True
+                elif upper <= alpha:
+                    node.value = upper
+                    frame.done = True
+                else:
+                    node.alpha = max(alpha, lower)
+                    node.beta = min(beta, upper)
+
+        frame.alpha = node.alpha
+        frame.beta = node.beta
+        return frame
+
+    # stores the bound the finished search of an inner node proved
+    def store(self, frame, memory):
+        node = frame.node
+        if self.table is not None:
+            self.table.store(node, node.value, frame.alpha, frame.beta)
+        if memory is None:
+            return
+
+        lower, upper = memory.get(node, (float('-inf'), float('inf')))
+        if node.value <= frame.alpha:
+            upper = node.value
+        elif node.value >= frame.beta:
+            lower = node.value
+        else:
+            lower = upper = node.value
+        memory[node] = (lower, upper)
+
+    # one (fail-soft) alpha beta pass from the root with the given window, uses an explicit
+    # stack so deep trees work, returns the root cutoff (the caller yields END or PASS)
+    def search_pass(self, root_node, alpha, beta, memory=None):
+        prev_state = (root_node.value, root_node.alpha, root_node.beta)
+        stack = [self.enter(root_node, alpha, beta, memory)]
+        yield ('INIT',) + prev_state + (stack[0].from_table,), root_node, None
+
+        while True:
+            frame = stack[-1]
+            node = frame.node
+
+            if not frame.done:
+                # is there a cutoff?
+                if node.alpha >= node.beta:
+                    frame.cutoff = (node, frame.next_idx)
+
+                # is there any unsearched child?
+                elif frame.next_idx < len(frame.children):
+                    child = frame.children[frame.next_idx]
+                    if frame.research is not None:
+                        window, frame.research = frame.research, None
+                    else:
+                        window = self.child_window(frame)
+
+                    prev_state = (child.alpha, child.beta, child.value)
+                    stack.append(self.enter(child, *window, memory))
+                    yield ('MOVE_DOWN', node) + prev_state + (stack[-1].from_table,), child, None
+                    continue
+
+                self.store(frame, memory)
+
+            # node is done, move up
+            stack.pop()
+            if not stack:
+                return frame.cutoff
+
+            parent_frame = stack[-1]
+            parent = parent_frame.node
+            prev_state = (parent.value, parent.alpha, parent.beta)
+            parent.set_value(node)
+            parent.alpha_beta_propagate_up(node)
+
+            parent_frame.research = self.research_window(parent_frame, node)
+            if parent_frame.research is None:
+                parent_frame.next_idx += 1
+
+            yield ('MOVE_UP', node) + prev_state + (frame.cutoff is not None,), parent, frame.cutoff
+
+# principal variation search (NegaScout): the first child gets the full window, the others
+# a null window that only tests whether they improve on it, and are searched again if they do
+class PrincipalVariationEngine(SearchEngine):
+    name = "PVS / NegaScout"
+
+    def child_window(self, frame):
+        node = frame.node
+        if frame.next_idx == 0:
+            frame.scout = None
+            return node.alpha, node.beta
+
+        if node.is_max:
+            frame.scout = node.alpha
+            return node.alpha, math.nextafter(node.alpha, math.inf)
+        frame.scout = node.beta
+        return math.nextafter(node.beta, -math.inf), node.beta
+
+    def research_window(self, frame, child):
+        node = frame.node
+        bound, frame.scout = frame.scout, None
+        if bound is None:
+            return None
+
+        # the scout failed high (low for min nodes) inside the window, so its value is only a bound
+        fail_high = child.value > bound if node.is_max else child.value < bound
+        if fail_high and not child.is_leaf() and node.alpha < node.beta:
+            return node.alpha, node.beta
+        return None
+
+# MTD(f): a sequence of null window alpha beta passes with memory, every pass moves
+# a bound of the root value towards first_guess until lower and upper bound meet
+class MTDFEngine(SearchEngine):
+    name = "MTD(f)"
+
+    def __init__(self, first_guess=0.0, table=None):
+        SearchEngine.__init__(self, table)
+        self.first_guess = first_guess
+
+    def steps(self, root_node):
+        if self.table is not None:
+            self.table.clear()
+        memory = {}
+        lower, upper = float('-inf'), float('inf')
+        guess = self.first_guess
+
+        while True:
+            # tests whether the root value is at least gamma
+            gamma = math.nextafter(guess, math.inf) if guess == lower else guess
+            cutoff = yield from self.search_pass(root_node, math.nextafter(gamma, -math.inf), gamma, memory)
+
+            guess = root_node.value
+            if guess < gamma:
+                upper = guess
+            else:
+                lower = guess
+
+            if lower >= upper:
+                yield ('END', cutoff is not None), None, cutoff
+                return
+            yield ('PASS', cutoff is not None), None, cutoff
+
+# SSS* in its MTD formulation (Plaat et al.): MTD starting from +inf,
+# which expands the same leaves as Stockman's best-first SSS*
+class SSSStarEngine(MTDFEngine):
+    name = "SSS*"
+
+    def __init__(self, table=None):
+        MTDFEngine.__init__(self, float('inf'), table)
+
+# engines selectable in the app, None is the built-in alpha beta stepping
+ENGINES = {
+    "Alpha-beta": None,
+    PrincipalVariationEngine.name: PrincipalVariationEngine,
+    MTDFEngine.name: MTDFEngine,
+    SSSStarEngine.name: SSSStarEngine,
+}
+
+# fail-soft alpha beta over the flat arrays of an ArrayTree (degrees, child_offsets, is_max, leaf values),
+# searches the subtree of node idx with the given window,
+# returns (value, visited nodes, cutoffs as (parent idx, cutoff_idx) pairs)
+def array_alpha_beta(degrees, child_offsets, is_max, leaf_values, idx, alpha, beta):
+    no_internal = len(degrees)
+    if idx >= no_internal:
+        return leaf_values[idx - no_internal], 1, []
+
+    visited = 1
+    cutoffs = []
+    # node, next child, end of its children, alpha, beta and value for every node on the path
+    stack = [[idx, child_offsets[idx], child_offsets[idx + 1], alpha, beta, None]]
+
+    while True:
+        frame = stack[-1]
+        node, child, end, alpha, beta, value = frame
+
+        if alpha < beta and child < end:
+            frame[1] = child + 1
+            visited += 1
+            if child >= no_internal:
+                value = leaf_values[child - no_internal]
+            else:
+                stack.append([child, child_offsets[child], child_offsets[child + 1], alpha, beta, None])
+                continue
+        else:
+            # node is done, move up
+            if alpha >= beta:
+                cutoffs.append((node, child - child_offsets[node]))
+            stack.pop()
+            if not stack:
+                return value, visited, cutoffs
+
+        # update value, alpha and beta of the parent
+        parent = stack[-1]
+        if is_max[parent[0]]:
+            if parent[5] is None or value > parent[5]:
+                parent[5] = value
+            if value > parent[3]:
+                parent[3] = value
+        else:
+            if parent[5] is None or value < parent[5]:
+                parent[5] = value
+            if value < parent[4]:
+                parent[4] = value
+
+# shared memory blocks and arrays of the tree a pool worker searches
+shared_blocks = None
+shared_arrays = None
+
+# copies the arrays of an ArrayTree into shared memory, returns the blocks (to be closed and
+# unlinked by the caller) and (name, format, length) of every array for attach_tree_arrays
+def share_tree_arrays(tree):
+    from multiprocessing import shared_memory
+
+    blocks = []
+    spec = []
+    for arr in (tree.degrees, tree.child_offsets, tree.is_max, tree.leaf_values):
+        view = memoryview(arr)
+        block = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+        block.buf[:view.nbytes] = view.cast('B')
+        blocks.append(block)
+        spec.append((block.name, view.format, len(view)))
+    return blocks, spec
+
+# pool initializer, maps the shared tree arrays into the worker
+def attach_tree_arrays(spec):
+    from multiprocessing import shared_memory
+
+    global shared_blocks, shared_arrays
+    shared_blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in spec]
+    shared_arrays = [block.buf[:length * struct.calcsize(fmt)].cast(fmt) for block, (_, fmt, length) in zip(shared_blocks, spec)]
+
+# pool task, searches one subtree of the shared tree
+def search_shared_subtree(idx, alpha, beta):
+    return array_alpha_beta(*shared_arrays, idx, alpha, beta)
+
+# parallel alpha beta on a process pool (Young Brothers Wait along the leftmost path): the first
+# child of a node is searched before its siblings to set the bounds, then the siblings are searched
+# by the workers with those bounds; subtrees smaller than min_split_size are not split further.
+# Works on ArrayTree nodes, leaves node state untouched and returns the same kind of result as
+# alpha_beta_search (the value is the same, visited nodes may be more)
+def parallel_alpha_beta_search(root_node, workers=None, min_split_size=10000):
+    if not isinstance(root_node, ArrayNode):
+        raise TypeError("parallel search needs an ArrayTree node (compact tree store)")
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    tree = root_node.tree
+    arrays = (tree.degrees, tree.child_offsets, tree.is_max, tree.leaf_values)
+
+    # leftmost path down to the first subtree too small to split
+    path = [root_node.idx]
+    while path[-1] < tree.no_internal and ArrayNode(tree, path[-1]).subtree_size() >= min_split_size:
+        path.append(tree.child_offsets[path[-1]])
+
+    blocks, spec = share_tree_arrays(tree)
+    try:
+        with ProcessPoolExecutor(workers, initializer=attach_tree_arrays, initargs=(spec,)) as pool:
+            # every node on the path is entered with the root window before its first child returns,
+            # so its only bound is the one its first child sets and the path itself never cuts off
+            value, visited, cutoffs = array_alpha_beta(*arrays, path[-1], float('-inf'), float('inf'))
+
+            for node in reversed(path[:-1]):
+                first = tree.child_offsets[node]
+                node_is_max = tree.is_max[node]
+                alpha, beta = (value, float('inf')) if node_is_max else (float('-inf'), value)
+                visited += 1
+
+                # siblings are searched in parallel with the bound set by the first child
+                children = range(first + 1, first + tree.degrees[node])
+                futures = [pool.submit(search_shared_subtree, child, alpha, beta) for child in children]
+
+                for future in futures:
+                    child_value, child_visited, child_cutoffs = future.result()
+                    visited += child_visited
+                    cutoffs.extend(child_cutoffs)
+                    value = max(value, child_value) if node_is_max else min(value, child_value)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    cutoffs = [(ArrayNode(tree, node), cutoff_idx) for node, cutoff_idx in cutoffs]
+    return SearchResult(value, cutoffs, visited, root_node.subtree_size() - visited)
+
+# solves one batch case, a JSON line {"id": ..., "structure": "2|2,2", "leaves": "3,5,2,9"} in the
+# grammar of the app's text input, returns (JSON result line, whether it is an error)
+def solve_case(line_no, line):
+    result = {"line": line_no}
+    try:
+        case = json.loads(line)
+        if not isinstance(case, dict):
+            raise TypeError("case is not a JSON object")
+        if "id" in case:
+            result["id"] = case["id"]
+        if not isinstance(case["structure"], str) or not isinstance(case["leaves"], str):
+            raise TypeError("structure and leaves have to be strings")
+        tree_structure_lst, leaf_values = parse_tree_input(case["structure"], case["leaves"])
+        search = alpha_beta_search(ArrayTree.generate_tree(tree_structure_lst, leaf_values))
+        result.update(value=search.value, visited=search.visited, pruned=search.pruned, cutoffs=len(search.cutoffs))
+    except KeyError as e:
+        result["error"] = f"missing field {e}"
+    except (ValueError, TypeError) as e:
+        result["error"] = str(e)
+    except MemoryError:
+        result["error"] = "out of memory"
+    return json.dumps(result), "error" in result
+
+# solves one case in a process of its own, a case that kills the process (e.g. the system
+# runs out of memory) gives an error result
+def solve_case_isolated(line_no, line):
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    with ProcessPoolExecutor(1) as pool:
+        try:
+            return pool.submit(solve_case, line_no, line).result()
+        except BrokenProcessPool:
+            result = {"line": line_no}
+            case = json.loads(line)
+            if isinstance(case, dict) and "id" in case:
+                result["id"] = case["id"]
+            result["error"] = "case stopped its worker process"
+            return json.dumps(result), True
+
+# pool task, solves a chunk of (line number, line) cases
+def solve_cases(cases):
+    return [solve_case(line_no, line) for line_no, line in cases]
+
+# streams JSONL cases through a process pool and writes the results in input order; at most
+# 2 * workers chunks are in flight, so memory does not grow with the input; a chunk whose case
+# killed a worker is solved again one case per process (only that case gives an error) and the
+# other chunks in flight go to a new pool, returns (cases, errors)
+def run_batch(input_file, output_file, workers=None, chunk_size=64):
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    workers = workers or os.cpu_count()
+    no_cases = 0
+    no_errors = 0
+
+    def chunks():
+        chunk = []
+        for line_no, line in enumerate(input_file, 1):
+            if line.strip():
+                chunk.append((line_no, line))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def write(results):
+        nonlocal no_cases, no_errors
+        for result, is_error in results:
+            output_file.write(result + "\n")
+            no_cases += 1
+            no_errors += is_error
+
+    if workers == 1:
+        for chunk in chunks():
+            write(solve_cases(chunk))
+        return no_cases, no_errors
+
+    pool = ProcessPoolExecutor(workers)
+    # (chunk, future) in input order, the future is None if the pool was broken on submit
+    pending = deque()
+
+    def submit(chunk):
+        try:
+            return pool.submit(solve_cases, chunk)
+        except BrokenProcessPool:
+            return None
+
+    def write_oldest():
+        nonlocal pool
+        chunk, future = pending.popleft()
+        if future is not None:
+            try:
+                write(future.result())
+                return
+            except BrokenProcessPool:
+                pass
+
+        pool.shutdown(cancel_futures=True)
+        pool = ProcessPoolExecutor(workers)
+        for i, (other_chunk, other_future) in enumerate(pending):
+            if other_future is None or not other_future.done() or other_future.exception() is not None:
+                pending[i] = (other_chunk, submit(other_chunk))
+        write([solve_case_isolated(line_no, line) for line_no, line in chunk])
+
+    try:
+        for chunk in chunks():
+            pending.append((chunk, submit(chunk)))
+            if len(pending) >= 2 * workers:
+                write_oldest()
+        while pending:
+            write_oldest()
+    finally:
+        pool.shutdown()
+
+    return no_cases, no_errors
+
+# result of batch_minimax
+class BatchMinimaxResult:
+    def __init__(self, values, node_values):
+        # root value of every row of leaf values
+        self.values = values
+        # value of every node for every row (rows x nodes, breadth-first order with the root first
+        # as in ArrayTree), None unless requested
+        self.node_values = node_values
+
+# minimax values of one tree shape for many leaf vectors (leaf_values is rows x leaves, any 2-D
+# array-like, e.g. np.load(path, mmap_mode="r")): the layers are reduced bottom-up, every node takes
+# the max or min of its children's segment of the layer below, for a chunk of rows at once; chunks
+# hold at most max_bytes of a layer's values, the root values equal the alpha beta search value of
+# every row; the default chunks stay in the CPU cache while their layers are reduced; needs NumPy,
+# which is only imported here
+def batch_minimax(tree_structure_lst, leaf_values, node_values=False, max_bytes=1 << 20):
+    import numpy as np
+
+    leaf_values = np.asarray(leaf_values, dtype=np.float64)
+    no_leaves = sum(tree_structure_lst[-1])
+    if leaf_values.ndim != 2:
+        raise ValueError("leaf values have to be a 2-D array with one row per case")
+    if leaf_values.shape[1] != no_leaves:
+        raise ValueError(f"got {leaf_values.shape[1]} leaf values per row, tree structure needs {no_leaves}")
+
+    # children of every layer's nodes start at these offsets in the layer below; in layers where all
+    # nodes have the same degree d, the i-th children are every d-th column and are reduced with d - 1
+    # elementwise max or min calls (much faster than reducing a short axis)
+    layers = [np.asarray(layer_degrees, dtype=np.int64) for layer_degrees in tree_structure_lst]
+    offsets = [None if degrees.min() == degrees.max() else np.concatenate(([0], np.cumsum(degrees[:-1]))) for degrees in layers]
+    layer_sizes = [1] + [int(degrees.sum()) for degrees in layers]
+    layer_starts = list(accumulate(layer_sizes, initial=0))
+
+    no_rows = leaf_values.shape[0]
+    values = np.empty(no_rows)
+    all_values = np.empty((no_rows, layer_starts[-1])) if node_values else None
+    chunk_rows = max(1, max_bytes // (8 * max(layer_sizes)))
+
+    for start in range(0, no_rows, chunk_rows):
+        end = min(start + chunk_rows, no_rows)
+        layer = leaf_values[start:end]
+        if np.isnan(layer).any():
+            raise ValueError(f"leaf values contain NaN (rows {start} to {end - 1})")
+        if node_values:
+            all_values[start:end, layer_starts[-2]:] = layer
+
+        for depth in range(len(layers) - 1, -1, -1):
+            reduce = np.maximum if depth % 2 == 0 else np.minimum
+            if offsets[depth] is None:
+                degree = int(layers[depth][0])
+                reduced = layer[:, 0::degree].copy()
+                for i in range(1, degree):
+                    reduce(reduced, layer[:, i::degree], out=reduced)
+                layer = reduced
+            else:
+                layer = reduce.reduceat(layer, offsets[depth], axis=1)
+            if node_values:
+                all_values[start:end, layer_starts[depth]:layer_starts[depth + 1]] = layer
+
+        values[start:end] = layer[:, 0]
+
+    return BatchMinimaxResult(values, all_values)
+
+# per-call latency histograms, canvas item counts and search counters of hooked methods,
+# exported as trace events (chrome://tracing, Perfetto)
+class Instrumentation:
+    CANVAS_CREATE = ("create_line", "create_oval", "create_polygon", "create_rectangle", "create_text")
+
+    def __init__(self, max_events=200000):
+        # name -> [calls, total ns, max ns, {log2 of duration in us: calls}]
+        self.histograms = {}
+        # trace events, the oldest are dropped when full
+        self.events = deque(maxlen=max_events)
+        self.start_ns = time.perf_counter_ns()
+        # nesting of hooked calls and canvas items created so far
+        self.depth = 0
+        self.items_created = 0
+        # latest search counters (nodes visited, cutoffs, step log size)
+        self.counters = {}
+        # called after every outermost hooked call
+        self.listener = None
+
+    # runs a hooked method and records its latency and the canvas items it created
+    def call(self, name, method, owner, args, kwargs):
+        items_created = self.items_created
+        self.depth += 1
+        start = time.perf_counter_ns()
+        try:
+            return method(owner, *args, **kwargs)
+        finally:
+            end = time.perf_counter_ns()
+            self.depth -= 1
+            self.record(name, start, end, self.items_created - items_created)
+
+    def record(self, name, start, end, items_created):
+        duration = end - start
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = [0, 0, 0, {}]
+        histogram[0] += 1
+        histogram[1] += duration
+        histogram[2] = max(histogram[2], duration)
+        bucket = (duration // 1000).bit_length()
+        histogram[3][bucket] = histogram[3].get(bucket, 0) + 1
+
+        self.events.append({"name": name, "ph": "X", "ts": (start - self.start_ns) / 1000, "dur": duration / 1000,
+                            "pid": os.getpid(), "tid": 0, "args": {"items_created": items_created}})
+
+    # records counters of the search (shown as a counter track in the trace)
+    def record_counters(self, **counters):
+        self.counters = counters
+        self.events.append({"name": "search", "ph": "C", "ts": (time.perf_counter_ns() - self.start_ns) / 1000,
+                            "pid": os.getpid(), "tid": 0, "args": counters})
+
+    # counts items created on the canvas until unwatch_canvas
+    def watch_canvas(self, canvas):
+        for name in self.CANVAS_CREATE:
+            create = getattr(canvas, name)
+
+            def counting_create(*args, create=create, **kwargs):
+                self.items_created += 1
+                return create(*args, **kwargs)
+
+            setattr(canvas, name, counting_create)
+
+    def unwatch_canvas(self, canvas):
+        for name in self.CANVAS_CREATE:
+            if name in vars(canvas):
+                delattr(canvas, name)
+
+    # (calls, mean, p50, p99, max) of a hooked method in ms, percentiles are histogram bucket bounds
+    def summary(self, name):
+        calls, total, longest, buckets = self.histograms[name]
+
+        def percentile(q):
+            seen = 0
+            for bucket in sorted(buckets):
+                seen += buckets[bucket]
+                if seen >= q * calls:
+                    return min(2 ** bucket / 1000, longest / 1e6)
+            return longest / 1e6
+
+        return calls, total / calls / 1e6, percentile(0.5), percentile(0.99), longest / 1e6
+
+    def histogram_data(self):
+        return {name: {"calls": calls, "total_ms": total / 1e6, "max_ms": longest / 1e6,
+                       "buckets_us": {str(2 ** bucket): count for bucket, count in sorted(buckets.items())}}
+                for name, (calls, total, longest, buckets) in self.histograms.items()}
+
+    # writes trace events and histograms as a JSON trace file
+    def export(self, path):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms",
+                       "otherData": {"histograms": self.histogram_data(), "items_created": self.items_created}}, f)
+
+# hooks a method into the owner's instrumentation, costs one attribute check while
+# the owner's instrumentation is None; counters records the search counters after the call
+def instrumented(name, counters=False):
+    def decorate(method):
+        @functools.wraps(method)
+        def hooked(self, *args, **kwargs):
+            instrumentation = self.instrumentation
+            if instrumentation is None:
+                return method(self, *args, **kwargs)
+
+            result = instrumentation.call(name, method, self, args, kwargs)
+            if counters:
+                instrumentation.record_counters(**self.search_counters())
+            if instrumentation.depth == 0 and instrumentation.listener is not None:
+                instrumentation.listener()
+            return result
+        return hooked
+    return decorate
+
+# receives the simulator state after every drawn step (the App redraws the tree)
+class SimulatorObserver:
+    def render(self, root_node, marked_node=None, cutoffs=None, is_prop_up=None, changed=None):
+        pass
+
+# opcodes of the step log, OP_FROM_TABLE flags steps entering a node answered from the transposition table
+OP_INIT, OP_MOVE_DOWN, OP_MOVE_UP, OP_END, OP_PASS = range(5)
+OPCODES = {'INIT': OP_INIT, 'MOVE_DOWN': OP_MOVE_DOWN, 'MOVE_UP': OP_MOVE_UP, 'END': OP_END, 'PASS': OP_PASS}
+OP_FROM_TABLE = 0x80
+OP_MASK = 0x7f
+# 1 for the opcodes (with flags) of steps entering a node, as a bytes.translate table
+ENTRY_OPS = bytes(op & OP_MASK in (OP_INIT, OP_MOVE_DOWN) for op in range(256))
+
+# (value, alpha, beta) as stored in the step log, None as NaN
+def nan_state(values):
+    return [NAN if value is None else value for value in values]
+
+def node_state(node):
+    return nan_state((node.value, node.alpha, node.beta))
+
+def set_node_state(node, state):
+    node.value, node.alpha, node.beta = (None if value != value else value for value in state)
+
+NAN_STATE = (NAN, NAN, NAN)
+
+# integer ids of the nodes of a tree, the step log refers to nodes by them; ArrayNode ids are
+# its breadth-first idx, other nodes get ids in order of first use (only visited nodes get one)
+class NodeIndex:
+    def __init__(self, root_node):
+        self.root_node = root_node
+        self.tree = root_node.tree if isinstance(root_node, ArrayNode) else None
+        self.nodes = []
+        self.ids = {}
+
+    # id of a node, -1 for None
+    def id(self, node):
+        if node is None:
+            return -1
+        if self.tree is not None:
+            return node.idx
+        node_id = self.ids.get(node)
+        if node_id is None:
+            node_id = self.ids[node] = len(self.nodes)
+            self.nodes.append(node)
+        return node_id
+
+    def node(self, node_id):
+        if node_id < 0:
+            return None
+        if self.tree is not None:
+            return ArrayNode(self.tree, node_id)
+        return self.nodes[node_id]
+
+    # all nodes in breadth-first order (files refer to nodes by their breadth-first index)
+    def breadth_first(self):
+        nodes = [self.root_node]
+        i = 0
+        while i < len(nodes):
+            nodes.extend(nodes[i].children)
+            i += 1
+        return nodes
+
+    # breadth_first, with the nodes given their ids in that order (only for an index without ids yet)
+    def number_breadth_first(self):
+        nodes = self.breadth_first()
+        if self.tree is None:
+            self.nodes = nodes
+            self.ids = dict(zip(nodes, range(len(nodes))))
+        return nodes
+
+    # number of tree nodes and translations of an id array to breadth-first indexes and back
+    def size(self):
+        return self.tree.no_nodes if self.tree is not None else len(self.breadth_first())
+
+    def to_breadth_first(self, ids):
+        if self.tree is not None:
+            return ids
+        position = {node: i for i, node in enumerate(self.breadth_first())}
+        return array('q', [-1 if node_id < 0 else position[self.nodes[node_id]] for node_id in ids])
+
+    def from_breadth_first(self, indexes):
+        if self.tree is not None:
+            return indexes
+        nodes = self.breadth_first()
+        return array('q', [-1 if i < 0 else self.id(nodes[i]) for i in indexes])
+
+# steps of a simulated search (the undo log) as typed parallel arrays: opcode with flags, id of the
+# node the step changes (-1 for none), id of the other node of a move (parent of MOVE_DOWN, child
+# of MOVE_UP), cutoff child index (-1 for none), and value, alpha and beta of the changed node
+# before and after the step (3 float64 entries per step each)
+class StepLog:
+    # file header: magic, little endian arrays, number of steps, number of tree nodes, engine name length
+    MAGIC = b"ABSTEPS1"
+    HEADER = struct.Struct("<8s?qqH")
+
+    def __init__(self):
+        self.ops = bytearray()
+        self.nodes = array('q')
+        self.others = array('q')
+        self.cutoffs = array('i')
+        self.before = array('d')
+        self.after = array('d')
+
+    def __len__(self):
+        return len(self.ops)
+
+    def append(self, op, node_id, other_id, cutoff_idx, before, after):
+        self.ops.append(op)
+        self.nodes.append(node_id)
+        self.others.append(other_id)
+        self.cutoffs.append(cutoff_idx)
+        self.before.extend(before)
+        self.after.extend(after)
+
+    def arrays(self):
+        return (self.nodes, self.others, self.cutoffs, self.before, self.after)
+
+    # log sharing all arrays except the node ids
+    def with_nodes(self, nodes, others):
+        log = StepLog()
+        log.ops, log.cutoffs, log.before, log.after = self.ops, self.cutoffs, self.before, self.after
+        log.nodes, log.others = nodes, others
+        return log
+
+    def nbytes(self):
+        return len(self.ops) + sum(len(arr) * arr.itemsize for arr in self.arrays())
+
+    # appends the steps of log from step start up to step end
+    def extend(self, log, start=0, end=None):
+        self.ops += log.ops[start:end]
+        for arr, other in zip(self.arrays(), log.arrays()):
+            size = 3 if arr.typecode == 'd' else 1
+            arr.extend(other[start * size:None if end is None else end * size])
+
+    # (node id, step) of every step from step start on that enters a node
+    def entries(self, start=0):
+        return compress(zip(self.nodes[start:], count(start)), self.ops[start:].translate(ENTRY_OPS))
+
+    # drops all steps from step s on
+    def truncate(self, s):
+        del self.ops[s:]
+        for arr in self.arrays():
+            del arr[s * (3 if arr.typecode == 'd' else 1):]
+
+    # writes the log as a binary file: header, engine name (UTF-8), then every array in native byte order
+    def save(self, path, no_nodes, engine_name):
+        name = engine_name.encode()
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, sys.byteorder == "little", len(self), no_nodes, len(name)))
+            f.write(name)
+            f.write(self.ops)
+            for arr in self.arrays():
+                arr.tofile(f)
+
+    # reads a file written by save, returns (log, number of tree nodes, engine name)
+    def load(path):
+        log = StepLog()
+        with open(path, "rb") as f:
+            header = f.read(StepLog.HEADER.size)
+            if len(header) != StepLog.HEADER.size or header[:8] != StepLog.MAGIC:
+                raise ValueError(f"{path} is not a step file")
+            _, little_endian, no_steps, no_nodes, name_length = StepLog.HEADER.unpack(header)
+            engine_name = f.read(name_length).decode()
+
+            log.ops = bytearray(f.read(no_steps))
+            try:
+                for arr in log.arrays():
+                    arr.fromfile(f, no_steps * (3 if arr.typecode == 'd' else 1))
+            except (EOFError, ValueError):
+                raise ValueError(f"{path} is truncated")
+            if len(log.ops) != no_steps:
+                raise ValueError(f"{path} is truncated")
+
+        if little_endian != (sys.byteorder == "little"):
+            for arr in log.arrays():
+                arr.byteswap()
+        return log, no_nodes, engine_name
+
+class AlphaBetaSimulator:
+    # Instrumentation hooked methods report to (None when disabled)
+    instrumentation = None
+
+    def __init__(self, observer, root_node, snapshot_interval=1000, engine=None):
+        # SimulatorObservers notified after every drawn step
+        self.observers = [] if observer is None else [observer]
+        self.root_node = root_node
+
+        # SearchEngine producing the steps, None steps plain alpha beta below
+        self.engine = engine
+        self.engine_steps = None
+
+        # every step computed so far, the first self.step of them are taken (backward steps undo them)
+        self.log = StepLog()
+        self.index = NodeIndex(root_node)
+        # logged steps with a cutoff and steps answered from the transposition table, in order,
+        # so seek takes them over in bulk
+        self.cutoff_steps = array('q')
+        self.table_steps = array('q')
+        # current path after the steps in snapshot_steps (at most snapshot_interval steps apart), used
+        # by seek (more frequent snapshots use more memory but replay fewer steps)
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_steps = array('q', [0])
+        self.snapshots = [()]
+        # maps node id to the logged step that first entered the node (entries of dropped steps are
+        # left behind, first_step checks them)
+        self.first_steps = {}
+        # MinimaxValues of the tree if the caller keeps them, only their parents are read (to find
+        # the ancestors of a changed leaf after a fast all_forward), built when needed otherwise
+        self.minimax = None
+        # number of steps of the whole search (None until known)
+        self.total_steps = None
+
+        self.clear_state()
+
+    # resets search bookkeeping (node values are left untouched)
+    def clear_state(self):
+        self.curr_node = None
+        self.curr_path = []
+        self.over = False
+
+        # number of steps taken
+        self.step = 0
+
+        # maps node to index of next unvisited child (only kept up to date for the nodes on the
+        # current path, a node gets its entry again when a step enters it)
+        self.next_child = {}
+        
+        # stores current cutoffs as (parent, cutoff_idx) pairs
+        self.cutoffs = []
+
+        # maps node to its lowest cutoff child index (read by the renderer)
+        self.cutoff_index = {}
+        # cutoff_index entry of the node before each cutoff (engines may cut a node more than once)
+        self.cutoff_prev = []
+
+        # maps nodes answered from a transposition table at the current step to how often they were
+        self.table_hits = {}
+
+        # set when all_forward skipped the step log, it is rebuilt on the next backward step
+        self.trace_pending = False
+
+    @instrumented("forward", counters=True)
+    def forward(self, draw=True):
+        if self.over:
+            return
+
+        # only the previous and the new current node can change in one step
+        prev_curr_node = self.curr_node
+
+        if self.step < len(self.log):
+            # steps computed before are redone from the log
+            self.redo_step(self.step, set())
+            self.move_path(self.curr_path, self.step)
+            self.curr_node = self.curr_path[-1] if self.curr_path else None
+            self.over = self.log.ops[self.step] & OP_MASK == OP_END
+            self.step += 1
+        elif self.engine is not None:
+            self.engine_forward()
+        else:
+            self.search_forward()
+
+        if draw:
+            self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index, is_prop_up=self.last_op() == OP_MOVE_UP, changed=(prev_curr_node, self.curr_node))
+
+    # computes the next step of plain alpha beta
+    def search_forward(self):
+        node = self.curr_node
+
+        if node is None:
+            before = node_state(self.root_node)
+            self.root_node.alpha = float('-inf')
+            self.root_node.beta = float('inf')
+            self.next_child[self.root_node] = 0
+            self.curr_path.append(self.root_node)
+            self.record_step(OP_INIT, self.root_node, None, -1, before)
+
+        elif node.is_leaf():
+            self.move_up(node, -1)
+
+        else:
+            # determine next child's index
+            next_child_idx = self.next_child.get(node, 0)
+
+            # is there a cutoff?
+            cutoff = node.alpha >= node.beta
+            if cutoff:
+                self.add_cutoff(node, next_child_idx)
+
+            # is there any unvisited child?
+            if next_child_idx < len(node.children) and not cutoff:
+                self.next_child[node] = next_child_idx + 1
+                child = node.children[next_child_idx]
+                self.next_child[child] = 0
+                before = node_state(child)
+
+                # propagate alpha and beta
+                child.alpha_beta_propagate_down(node)
+                self.curr_path.append(child)
+                self.record_step(OP_MOVE_DOWN, child, node, -1, before)
+
+            elif node == self.root_node:
+                self.curr_path.pop()
+                self.record_step(OP_END, None, None, next_child_idx if cutoff else -1, NAN_STATE)
+
+            else:
+                self.move_up(node, next_child_idx if cutoff else -1)
+
+    # moves from node up to its parent, which takes over node's value
+    def move_up(self, node, cutoff_idx):
+        self.curr_path.pop()
+        parent = self.curr_path[-1]
+        before = node_state(parent)
+
+        # update value, alpha and beta
+        parent.set_value(node)
+        parent.alpha_beta_propagate_up(node)
+        self.record_step(OP_MOVE_UP, parent, node, cutoff_idx, before)
+
+    # takes the next step from the engine
+    def engine_forward(self):
+        if self.engine_steps is None:
+            self.engine_steps = self.engine.steps(self.root_node)
+            # a loaded log is continued where it ends (the engine repeats the same steps)
+            for _ in range(len(self.log)):
+                next(self.engine_steps)
+
+        action, node, cutoff = next(self.engine_steps)
+        op = OPCODES[action[0]]
+        cutoff_idx = -1
+        if cutoff is not None:
+            self.add_cutoff(*cutoff)
+            cutoff_idx = cutoff[1]
+
+        from_table = False
+        if op == OP_INIT:
+            before, other = action[1:4], None
+        elif op == OP_MOVE_DOWN:
+            before, other = (action[4], action[2], action[3]), action[1]
+        elif op == OP_MOVE_UP:
+            before, other = action[2:5], action[1]
+        else:
+            before, other = NAN_STATE, None
+
+        if op in (OP_INIT, OP_MOVE_DOWN):
+            from_table = action[-1]
+            if from_table:
+                self.table_hits[node] = self.table_hits.get(node, 0) + 1
+            self.curr_path.append(node)
+        else:
+            self.curr_path.pop()
+
+        self.record_step(op, node, other, cutoff_idx, nan_state(before), from_table)
+
+    # appends the step just taken to the log, node is the node whose state it changed
+    def record_step(self, op, node, other, cutoff_idx, before, from_table=False):
+        after = NAN_STATE if node is None else node_state(node)
+        if op in (OP_INIT, OP_MOVE_DOWN) and self.first_step(node) is None:
+            self.first_steps[self.index.id(node)] = self.step
+        self.log.append(op | OP_FROM_TABLE if from_table else op, self.index.id(node), self.index.id(other), cutoff_idx, before, after)
+        if cutoff_idx >= 0:
+            self.cutoff_steps.append(self.step)
+        if from_table:
+            self.table_steps.append(self.step)
+
+        self.step += 1
+        self.curr_node = self.curr_path[-1] if self.curr_path else None
+        self.over = op == OP_END
+
+        if self.step - self.snapshot_steps[-1] >= self.snapshot_interval:
+            self.snapshot_steps.append(self.step)
+            self.snapshots.append(tuple(self.curr_path))
+        if op == OP_END:
+            self.total_steps = self.step
+
+    # applies the change of the current path of step s to path
+    def move_path(self, path, s):
+        op = self.log.ops[s] & OP_MASK
+        if op in (OP_INIT, OP_MOVE_DOWN):
+            path.append(self.index.node(self.log.nodes[s]))
+        else:
+            path.pop()
+
+    # current path after the given number of steps, replayed from the nearest snapshot
+    def path_at(self, step):
+        i = bisect_right(self.snapshot_steps, step) - 1
+        path = list(self.snapshots[i])
+        for s in range(self.snapshot_steps[i], step):
+            self.move_path(path, s)
+        return path
+
+    # opcode of the last step taken, None before the first step
+    def last_op(self):
+        return self.log.ops[self.step - 1] & OP_MASK if self.step > 0 else None
+
+    # (alpha or beta of the current node before the last step, value of the child it took over)
+    # if the last step moved up, to show how the bound was updated
+    def move_up_equation(self):
+        if self.trace_pending or self.last_op() != OP_MOVE_UP:
+            return None
+        s = self.step - 1
+        parent = self.index.node(self.log.nodes[s])
+        child = self.index.node(self.log.others[s])
+        return self.log.before[3 * s + (1 if parent.is_max else 2)], child.value
+
+    @instrumented("backward", counters=True)
+    def backward(self, draw=True):
+        if self.trace_pending:
+            self.rebuild_trace()
+
+        if self.step == 0:
+            return
+
+        prev_curr_node = self.curr_node
+        self.step -= 1
+        s = self.step
+        self.undo_step(s, set())
+
+        op = self.log.ops[s] & OP_MASK
+        if op in (OP_INIT, OP_MOVE_DOWN):
+            self.curr_path.pop()
+        elif op == OP_MOVE_UP:
+            self.curr_path.append(self.index.node(self.log.others[s]))
+        else:
+            self.curr_path.append(self.root_node)
+        self.curr_node = self.curr_path[-1] if self.curr_path else None
+        self.over = False
+
+        if draw:
+            self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index, changed=(prev_curr_node, self.curr_node))
+
+    # up to no_steps forward steps drawn as one (auto-play drops the frames in between), stops early
+    # once time.perf_counter() passes deadline; returns the number of steps taken
+    @instrumented("advance", counters=True)
+    def advance(self, no_steps, deadline=None):
+        # a step only changes the previous and the new current node
+        changed = {self.curr_node}
+        taken = 0
+        while taken < no_steps and not self.over:
+            if deadline is not None and taken and time.perf_counter() > deadline:
+                break
+            self.forward(draw=False)
+            changed.add(self.curr_node)
+            taken += 1
+
+        self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index, is_prop_up=self.last_op() == OP_MOVE_UP, changed=changed)
+        return taken
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def notify(self, marked_node=None, cutoffs=None, is_prop_up=None, changed=None):
+        for observer in self.observers:
+            observer.render(self.root_node, marked_node=marked_node, cutoffs=cutoffs, is_prop_up=is_prop_up, changed=changed)
+
+    # returns number of steps of the whole search, must be called before the first step
+    def count_steps(self):
+        if self.total_steps is None:
+            if self.engine is not None:
+                self.total_steps = sum(1 for _ in self.engine.steps(self.root_node))
+                self.root_node.reset_search_state()
+                return self.total_steps
+
+            result = alpha_beta_search(self.root_node)
+            self.root_node.reset_search_state()
+            # every visited node is entered and left once
+            self.total_steps = 2 * result.visited
+        return self.total_steps
+
+    def current_step(self):
+        return self.total_steps if self.trace_pending else self.step
+
+    # nodes visited (every entered node was left again, except the ones on the current path),
+    # cutoffs and step log size at the current step
+    def search_counters(self):
+        return {
+            "visited": (self.current_step() + len(self.curr_path)) // 2,
+            "cutoffs": len(self.cutoffs),
+            "step_log_kb": self.log.nbytes() // 1024,
+        }
+
+    # jumps to the given step: every node changed in between gets its state from its last step
+    # before the target (or its first one after it, going back) in the step log, cutoffs and table
+    # hits are taken over from their steps, and only the current path is replayed from the nearest
+    # snapshot (at most snapshot_interval steps)
+    @instrumented("seek", counters=True)
+    def seek(self, step, draw=True, changed=None):
+        if self.trace_pending:
+            self.rebuild_trace()
+
+        # nodes whose drawn state changes, collected into the given set if there is one
+        if changed is None:
+            changed = set()
+
+        # steps that were never computed are computed from the last computed one (a computed
+        # step only changes the previous and the new current node), which ends at the step
+        if step > len(self.log) and self.total_steps != len(self.log):
+            self.seek(len(self.log), draw=False, changed=changed)
+            changed.add(self.curr_node)
+            while self.step < step and not self.over:
+                self.forward(draw=False)
+                changed.add(self.curr_node)
+
+            if draw:
+                self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index, changed=changed)
+            return
+
+        step = max(0, min(step, len(self.log)))
+        curr_step = self.step
+        if step == curr_step:
+            return
+        changed.add(self.curr_node)
+        log = self.log
+
+        # state of every node changed in between, from the step that changed it last going
+        # forward (state after it) or first going back (state before it)
+        if step > curr_step:
+            states = log.after
+            last_steps = dict(zip(log.nodes[curr_step:step], range(curr_step, step)))
+        else:
+            states = log.before
+            last_steps = dict(zip(log.nodes[step:curr_step][::-1], range(curr_step - 1, step - 1, -1)))
+        last_steps.pop(-1, None)
+        self.restore_states(states, last_steps, changed)
+
+        # cutoffs are a stack in step order
+        no_cutoffs = bisect_left(self.cutoff_steps, step)
+        while len(self.cutoffs) > no_cutoffs:
+            changed.add(self.cutoffs[-1][0])
+            self.remove_cutoff()
+        for s in self.cutoff_steps[len(self.cutoffs):no_cutoffs]:
+            cutoff_node = self.cutoff_node(s)
+            self.add_cutoff(cutoff_node, log.cutoffs[s])
+            changed.add(cutoff_node)
+
+        first, last = bisect_left(self.table_steps, curr_step), bisect_left(self.table_steps, step)
+        for s in self.table_steps[min(first, last):max(first, last)]:
+            node = self.index.node(log.nodes[s])
+            if step > curr_step:
+                self.table_hits[node] = self.table_hits.get(node, 0) + 1
+            else:
+                self.remove_table_hit(node)
+
+        self.step = step
+        self.curr_path = self.path_at(step)
+        self.curr_node = self.curr_path[-1] if self.curr_path else None
+        self.over = self.last_op() == OP_END
+        changed.add(self.curr_node)
+        self.update_next_child()
+
+        if draw:
+            self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index, changed=changed)
+
+    # changes the value of a leaf, then draws the current step: the steps before the search first
+    # entered the leaf stay; plain alpha beta searches again from there only as far as the leaf
+    # changes the search (research_steps), engines search again up to the current step and drop
+    # the later steps (as does plain alpha beta if the leaf is entered after the current step);
+    # after a fast all_forward, the final state is searched again headless (research_state)
+    @instrumented("set_leaf_value", counters=True)
+    def set_leaf_value(self, leaf, value):
+        if self.engine is not None and self.engine.table is not None:
+            raise ValueError("leaves cannot be changed while identical subtrees are shared")
+
+        if self.trace_pending:
+            self.research_state(leaf, value)
+            self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index)
+            return
+
+        s = self.first_step(leaf)
+        changed = {leaf}
+        target = None if self.over else self.step
+        if s is not None and (target is None or target > s) and self.engine is None and leaf is not self.root_node:
+            self.research_steps(leaf, value, s, target, changed)
+        else:
+            if s is not None:
+                if target is None or target > s:
+                    self.seek(s, draw=False, changed=changed)
+                self.drop_steps(s)
+            elif not self.over:
+                # the steps still to come may enter the leaf
+                self.total_steps = None
+            leaf.value = value
+
+            while (target is None or self.step < target) and not self.over:
+                changed.add(self.curr_node)
+                self.forward(draw=False)
+            changed.add(self.curr_node)
+
+        self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index, is_prop_up=self.last_op() == OP_MOVE_UP, changed=changed)
+
+    # searches plain alpha beta again from step s, which entered the changed leaf, and then goes to
+    # the current step target (None for the end): the leaf's ancestors get their state from step s
+    # back and the nodes the old steps changed below an ancestor are reset when the new steps come
+    # back to it from the path; once an ancestor is left with its parent in the same state as the
+    # old steps left it, the later old steps are taken over, so only the subtrees whose bounds
+    # changed are searched again (and at least up to the current step)
+    def research_steps(self, leaf, value, s, target, changed):
+        old = self.log
+        end = len(old) if target is None else target
+        path = self.path_at(s) + [leaf]
+        ids = [self.index.id(node) for node in path]
+        # steps that left the nodes on the path in the old steps
+        exits = [self.exit_step(node) for node in path]
+
+        # an ancestor is first changed again by the step leaving the next node on the path,
+        # its state at the current step is kept in case the old steps after that are taken over
+        saved = [node_state(node) for node in path]
+        for node, e in zip(path, exits[1:]):
+            if e is not None and e < end:
+                set_node_state(node, old.before[3 * e:3 * e + 3])
+        set_node_state(leaf, old.before[3 * s:3 * s + 3])
+        leaf.value = value
+        changed.update(path)
+
+        # the new steps are recorded from step s on, with the cutoffs they make
+        old_path, old_over, old_total = self.curr_path, self.over, self.total_steps
+        old_cutoffs, old_cutoff_prev, old_cutoff_index = self.cutoffs, self.cutoff_prev, self.cutoff_index
+        old_cutoff_steps, old_snapshot_steps, old_snapshots = self.cutoff_steps, self.snapshot_steps, self.snapshots
+        no_cutoffs = bisect_left(old_cutoff_steps, s)
+        no_snapshots = bisect_right(old_snapshot_steps, s)
+
+        self.log = log = StepLog()
+        log.extend(old, 0, s)
+        self.cutoff_steps = old_cutoff_steps[:no_cutoffs]
+        self.snapshot_steps, self.snapshots = old_snapshot_steps[:no_snapshots], old_snapshots[:no_snapshots]
+        self.cutoffs, self.cutoff_prev, self.cutoff_index = [], [], {}
+        self.step = s
+        self.curr_path = path[:-1]
+        self.curr_node = path[-2]
+        self.over = False
+        self.total_steps = None
+        self.update_next_child()
+
+        # path[level] is the deepest node on the path the new steps did not leave yet, nothing is
+        # taken over once the old steps never left it
+        level = len(path) - 1
+        converged = None
+        while not self.over and (self.step < end or exits[level] is not None):
+            self.search_forward()
+            t = self.step - 1
+            if log.ops[t] != OP_MOVE_UP or log.others[t] != ids[level]:
+                continue
+
+            e = exits[level]
+            level -= 1
+            if e is not None and log.after[3 * t:3 * t + 3] == old.after[3 * e:3 * e + 3]:
+                converged = e
+                break
+            # the later children of path[level] were entered by the old steps with other bounds
+            if e is not None:
+                stop = end if exits[level] is None else min(exits[level], end)
+                node_steps = dict(zip(old.nodes[e + 1:stop][::-1], range(stop - 1, e, -1)))
+                node_steps.pop(-1, None)
+                node_steps.pop(ids[level], None)
+                self.restore_states(old.before, node_steps, changed)
+        changed.update(map(self.index.node, set(log.nodes[s:self.step])))
+        changed.discard(None)
+
+        # the cutoffs of the old steps searched again are taken back (the ones the current step took)
+        no_taken = len(old_cutoffs)
+        first_kept = no_taken if converged is None else bisect_left(old_cutoff_steps, converged + 1)
+        removed = slice(no_cutoffs, min(first_kept, no_taken))
+        for (node, _), prev_idx in zip(reversed(old_cutoffs[removed]), reversed(old_cutoff_prev[removed])):
+            if prev_idx is None:
+                del old_cutoff_index[node]
+            else:
+                old_cutoff_index[node] = prev_idx
+            changed.add(node)
+        old_cutoff_index.update(self.cutoff_index)
+        changed.update(self.cutoff_index)
+        cutoffs = old_cutoffs[:no_cutoffs] + self.cutoffs
+        cutoff_prev = old_cutoff_prev[:no_cutoffs] + self.cutoff_prev
+        self.cutoff_index = old_cutoff_index
+
+        if converged is not None:
+            # old steps after the converged one, shifted to follow the new steps
+            t = self.step - 1
+            shift = t - converged
+            log.extend(old, converged + 1)
+            self.first_steps.update(log.entries(t + 1))
+            self.cutoff_steps.extend(map(add, old_cutoff_steps[first_kept:], repeat(shift)))
+            if self.snapshot_steps[-1] != t + 1:
+                self.snapshot_steps.append(t + 1)
+                self.snapshots.append(tuple(self.curr_path))
+            i = bisect_right(old_snapshot_steps, converged + 1)
+            self.snapshot_steps.extend(map(add, old_snapshot_steps[i:], repeat(shift)))
+            self.snapshots.extend(old_snapshots[i:])
+            self.total_steps = None if old_total is None else old_total + shift
+
+            if converged < end:
+                # the nodes outside the subtree searched again are as the current step left them,
+                # which is the same step shifted
+                for node, state in zip(path[:level + 1], saved):
+                    set_node_state(node, state)
+                cutoffs += old_cutoffs[first_kept:no_taken]
+                cutoff_prev += old_cutoff_prev[first_kept:no_taken]
+                self.step = end + shift
+                self.curr_path = old_path
+                self.over = old_over
+
+        self.cutoffs, self.cutoff_prev = cutoffs, cutoff_prev
+        self.curr_node = self.curr_path[-1] if self.curr_path else None
+        self.update_next_child()
+        if target is not None:
+            self.seek(target, draw=False, changed=changed)
+
+    # searches again after a fast all_forward, which left only the final state: the leaf's
+    # ancestors get back their state from when the search entered the leaf (from the values of
+    # the children before it), then the search goes on headless from the leaf and stops at the
+    # first ancestor left with the value it had; the later children of the ancestors left with
+    # another value are reset and searched again with the new bounds
+    def research_state(self, leaf, value):
+        if leaf.alpha is None and leaf.beta is None:
+            # the search never entered the leaf
+            leaf.value = value
+            return
+
+        total_steps = self.total_steps
+        s = self.first_step(leaf)
+        if s is not None:
+            self.drop_steps(s)
+        if self.minimax is None:
+            self.minimax = MinimaxValues(self.root_node)
+        path = self.minimax.path(leaf)
+        positions = [self.child_position(parent, child) for parent, child in zip(path, path[1:])]
+        saved = [node_state(node) for node in path]
+        old_values = [node.value for node in path]
+
+        for i, node in enumerate(path[:-1]):
+            if i == 0:
+                node.alpha = float('-inf')
+                node.beta = float('inf')
+            else:
+                node.alpha_beta_propagate_down(path[i - 1])
+            node.value = None
+            for child in node.children[:positions[i]]:
+                node.set_value(child)
+                node.alpha_beta_propagate_up(child)
+        leaf.value = value
+        if len(path) > 1:
+            leaf.alpha_beta_propagate_down(path[-2])
+
+        # nodes whose cutoffs are taken back, new cutoffs and change of the number of visited nodes
+        removed = set()
+        new_cutoffs = []
+        visited = 0
+        for i in range(len(path) - 1, 0, -1):
+            child, node = path[i], path[i - 1]
+            if child.value == old_values[i]:
+                # the rest of the search is the same
+                for ancestor, state in zip(path[:i], saved):
+                    set_node_state(ancestor, state)
+                break
+
+            node.set_value(child)
+            node.alpha_beta_propagate_up(child)
+            removed.add(node)
+            stack = node.children[positions[i - 1] + 1:]
+            while stack:
+                other = stack.pop()
+                if other.alpha is None and other.beta is None:
+                    continue
+                visited -= 1
+                removed.add(other)
+                other.alpha = None
+                other.beta = None
+                if not other.is_leaf():
+                    other.value = None
+                    stack.extend(other.children)
+
+            cutoffs, entered, _ = continue_alpha_beta([node], [positions[i - 1] + 1])
+            new_cutoffs.extend(cutoffs)
+            visited += entered
+
+        removed.intersection_update(self.cutoff_index)
+        if removed:
+            for node in removed:
+                del self.cutoff_index[node]
+            self.cutoffs = [cutoff for cutoff in self.cutoffs if cutoff[0] not in removed]
+            self.cutoff_prev = [None] * len(self.cutoffs)
+        for node, cutoff_idx in new_cutoffs:
+            self.add_cutoff(node, cutoff_idx)
+        self.total_steps = total_steps + 2 * visited
+
+    # gives every node in node_steps (node id -> step) its state at that step in states
+    # (log.before or log.after), and adds the nodes to changed
+    def restore_states(self, states, node_steps, changed):
+        tree = self.index.tree
+        if tree is not None:
+            # array trees store None as NaN as well, the states are copied as they are (leaf values
+            # never change during a search)
+            for node_id, s in node_steps.items():
+                if node_id < tree.no_internal:
+                    tree.values[node_id] = states[3 * s]
+                tree.alpha[node_id] = states[3 * s + 1]
+                tree.beta[node_id] = states[3 * s + 2]
+            changed.update(map(ArrayNode, repeat(tree), node_steps))
+        else:
+            for node_id, s in node_steps.items():
+                node = self.index.nodes[node_id]
+                set_node_state(node, states[3 * s:3 * s + 3])
+                changed.add(node)
+
+    # next_child of the nodes on the current path for plain alpha beta: children up to the next
+    # node on the path were entered, and up to the child the last step came from by the current node
+    def update_next_child(self):
+        if self.engine is None:
+            path = self.curr_path
+            for parent, child in zip(path, path[1:]):
+                self.next_child[parent] = self.child_position(parent, child) + 1
+            if path:
+                self.next_child[path[-1]] = self.entered_children(path[-1], self.step)
+
+    # forgets the steps from step s on (the current step must not be after s)
+    def drop_steps(self, s):
+        self.log.truncate(s)
+        del self.cutoff_steps[bisect_left(self.cutoff_steps, s):]
+        del self.table_steps[bisect_left(self.table_steps, s):]
+        i = bisect_right(self.snapshot_steps, s)
+        del self.snapshot_steps[i:]
+        del self.snapshots[i:]
+        self.engine_steps = None
+        self.total_steps = None
+
+    # position of child among the children of parent
+    def child_position(self, parent, child):
+        if self.index.tree is not None:
+            return child.idx - self.index.tree.child_offsets[parent.idx]
+        return parent.children.index(child)
+
+    # number of children plain alpha beta entered of node, the current node before step s
+    # (the child the step before came back from, if it moved up to node)
+    def entered_children(self, node, s):
+        log = self.log
+        if s > 0 and log.ops[s - 1] & OP_MASK == OP_MOVE_UP and log.nodes[s - 1] == self.index.id(node):
+            return self.child_position(node, self.index.node(log.others[s - 1])) + 1
+        return 0
+
+    # logged step that first entered node, None if no logged step did
+    def first_step(self, node):
+        node_id = self.index.id(node)
+        s = self.first_steps.get(node_id)
+        log = self.log
+        if s is not None and s < len(log) and log.nodes[s] == node_id and ENTRY_OPS[log.ops[s]]:
+            return s
+        return None
+
+    # logged step that left node in plain alpha beta, None if no logged step did: a leaf is left
+    # right after it is entered, other nodes right after the last child they entered is left
+    def exit_step(self, node):
+        s = self.first_step(node)
+        depth = 0
+        while s is not None and not node.is_leaf():
+            for child in reversed(node.children):
+                s = self.first_step(child)
+                if s is not None:
+                    break
+            node = child
+            depth += 1
+        if s is None or s + depth + 1 >= len(self.log):
+            return None
+        return s + depth + 1
+
+    # node left by step s (the one whose child cutoff_idx its cutoff cut)
+    def cutoff_node(self, s):
+        if self.log.ops[s] & OP_MASK == OP_MOVE_UP:
+            return self.index.node(self.log.others[s])
+        return self.root_node
+
+    # restores node state from before step s
+    def undo_step(self, s, changed):
+        log = self.log
+        op = log.ops[s]
+        node = self.index.node(log.nodes[s])
+
+        if op & OP_FROM_TABLE:
+            self.remove_table_hit(node)
+        if node is not None:
+            set_node_state(node, log.before[3 * s:3 * s + 3])
+        if op & OP_MASK == OP_MOVE_DOWN and self.engine is None:
+            self.next_child[self.index.node(log.others[s])] -= 1
+        elif op & OP_MASK in (OP_MOVE_UP, OP_END) and self.engine is None:
+            # the node left is the current node again
+            left = self.cutoff_node(s)
+            self.next_child[left] = self.entered_children(left, s)
+
+        if log.cutoffs[s] >= 0:
+            self.remove_cutoff()
+            changed.add(self.cutoff_node(s))
+        changed.add(node)
+
+    # sets node state after step s
+    def redo_step(self, s, changed):
+        log = self.log
+        op = log.ops[s]
+        node = self.index.node(log.nodes[s])
+
+        if node is not None:
+            set_node_state(node, log.after[3 * s:3 * s + 3])
+        if op & OP_MASK == OP_MOVE_DOWN and self.engine is None:
+            parent = self.index.node(log.others[s])
+            self.next_child[parent] = self.next_child.get(parent, 0) + 1
+        if op & OP_MASK in (OP_INIT, OP_MOVE_DOWN) and self.engine is None:
+            self.next_child[node] = 0
+        if op & OP_FROM_TABLE:
+            self.table_hits[node] = self.table_hits.get(node, 0) + 1
+
+        if log.cutoffs[s] >= 0:
+            cutoff_node = self.cutoff_node(s)
+            self.add_cutoff(cutoff_node, log.cutoffs[s])
+            changed.add(cutoff_node)
+        changed.add(node)
+
+    # adds a cutoff, the renderer keeps showing the lowest cutoff index of a node
+    def add_cutoff(self, node, cutoff_idx):
+        prev_idx = self.cutoff_index.get(node)
+        self.cutoffs.append((node, cutoff_idx))
+        self.cutoff_prev.append(prev_idx)
+        self.cutoff_index[node] = cutoff_idx if prev_idx is None else min(prev_idx, cutoff_idx)
+
+    def remove_table_hit(self, node):
+        if self.table_hits[node] == 1:
+            del self.table_hits[node]
+        else:
+            self.table_hits[node] -= 1
+
+    # removes the last cutoff
+    def remove_cutoff(self):
+        node, _ = self.cutoffs.pop()
+        prev_idx = self.cutoff_prev.pop()
+        if prev_idx is None:
+            del self.cutoff_index[node]
+        else:
+            self.cutoff_index[node] = prev_idx
+
+    # replays the search with undo bookkeeping, so backward steps work after a fast all_forward
+    def rebuild_trace(self):
+        self.root_node.reset_search_state()
+        self.clear_state()
+
+        while not self.over:
+            self.forward(draw=False)
+
+    # name stored with saved steps, steps only load into a simulator running the same search
+    def engine_name(self):
+        if self.engine is None:
+            return "Alpha-beta"
+        return self.engine.name if self.engine.table is None else f"{self.engine.name} + table"
+
+    # writes the steps computed so far to a binary file (see StepLog.save), nodes are
+    # stored by breadth-first index
+    def save_steps(self, path):
+        if self.trace_pending:
+            self.rebuild_trace()
+        log = self.log.with_nodes(self.index.to_breadth_first(self.log.nodes), self.index.to_breadth_first(self.log.others))
+        log.save(path, self.index.size(), self.engine_name())
+
+    # replaces the computed steps by the ones saved in a file and goes back to step 0,
+    # the steps are then replayed from the file instead of searched again
+    def load_steps(self, path):
+        log, no_nodes, engine_name = StepLog.load(path)
+        if engine_name != self.engine_name():
+            raise ValueError(f"steps were saved with {engine_name}, not {self.engine_name()}")
+        if no_nodes != self.index.size():
+            raise ValueError(f"steps were saved for a tree of {no_nodes} nodes, not {self.index.size()}")
+        if len(log) and (max(log.nodes) >= no_nodes or max(log.others) >= no_nodes or max(log.ops) & OP_MASK > OP_PASS):
+            raise ValueError(f"{path} is corrupted")
+
+        self.root_node.reset_search_state()
+        self.clear_state()
+        self.log = log.with_nodes(self.index.from_breadth_first(log.nodes), self.index.from_breadth_first(log.others))
+        self.engine_steps = None
+        self.total_steps = len(log) if len(log) and log.ops[-1] & OP_MASK == OP_END else None
+
+        # snapshots of the current path, cutoff and table steps for seek, first steps of the nodes
+        self.snapshot_steps = array('q', [0])
+        self.snapshots = [()]
+        path = []
+        for s in range(len(log)):
+            self.move_path(path, s)
+            if s + 1 - self.snapshot_steps[-1] >= self.snapshot_interval:
+                self.snapshot_steps.append(s + 1)
+                self.snapshots.append(tuple(path))
+        self.cutoff_steps = array('q', (s for s, cutoff_idx in enumerate(log.cutoffs) if cutoff_idx >= 0))
+        self.table_steps = array('q', (s for s, op in enumerate(log.ops) if op & OP_FROM_TABLE))
+        self.first_steps = dict(reversed(list(self.log.entries())))
+
+    @instrumented("all_backward", counters=True)
+    def all_backward(self):
+        if self.trace_pending:
+            # nothing to undo step by step, just reset the search
+            self.root_node.reset_search_state()
+            self.clear_state()
+
+        self.seek(0, draw=False)
+        self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index)
+
+
+    @instrumented("all_forward", counters=True)
+    def all_forward(self, fast=True):
+        if fast and not self.over and self.engine is None:
+            # headless search reaches the same final state without recording steps
+            result = alpha_beta_search(self.root_node)
+
+            self.clear_state()
+            self.over = True
+            self.trace_pending = True
+            self.total_steps = 2 * result.visited
+            for node, cutoff_idx in result.cutoffs:
+                self.add_cutoff(node, cutoff_idx)
+
+        while not self.over:
+            self.forward(draw=False)
+        self.notify(marked_node=self.curr_node, cutoffs=self.cutoff_index)
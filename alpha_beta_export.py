@@ -0,0 +1,485 @@
+# drawing geometry and node styles shared by the app and the image export, and export of the tree
+# (at a simulator step, or a sequence of steps) to SVG and PNG files without Tk: items are generated
+# one by one in the order the app draws them and written as they come, PNG is rasterized in strips
+# or tiles with a small built-in font, so memory does not grow with the image
+
+import math
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from alpha_beta_engine import OP_MOVE_UP, TreeLayout
+
+# separators reach SEPARATOR_PADDING beyond the outer leaves (twice that for the dashed lines),
+# layer labels sit LABEL_PADDING right of the rightmost leaf
+SEPARATOR_PADDING = 75
+LABEL_PADDING = 60
+
+# glyphs of the bitmap font are 7 pixels high at least, smaller labels are left out of PNG images (as
+# the app collapses layers that get too dense)
+MIN_TEXT_SIZE = 7
+
+# Tk colors used by the app as RGB
+COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "gold": (255, 215, 0),
+    "olivedrab1": (192, 255, 62),
+    "light sky blue": (135, 206, 250),
+    "IndianRed1": (255, 106, 106),
+}
+
+# vertices of the triangle of a node (pointing up for max nodes, down for min nodes)
+def triangle_vertices(is_max, x, y, radius):
+    if is_max:
+        return [x, y - 0.866 * radius, x - radius, y + radius, x + radius, y + radius]
+    return [x - radius, y - radius, x + radius, y - radius, x, y + 0.866 * radius]
+
+# end points of the cutoff mark crossing the middle of an edge
+def perpendicular_line(x1, y1, x2, y2, length=10):
+    # perpendicular direction, normalized
+    perp_dx = -(y2 - y1)
+    perp_dy = x2 - x1
+    perp_length = (perp_dx ** 2 + perp_dy ** 2) ** 0.5
+    perp_dx /= perp_length
+    perp_dy /= perp_length
+
+    x_center = x1 + (x2 - x1) / 2
+    y_center = y1 + (y2 - y1) / 2
+    return x_center + perp_dx * length, y_center + perp_dy * length, x_center - perp_dx * length, y_center - perp_dy * length
+
+# dashed separator lines between the layers ((x1, x2, y) each) and layer labels ((x, y, text) each)
+def layer_separators(layout):
+    min_x, max_x = layout.min_x - SEPARATOR_PADDING, layout.max_x + SEPARATOR_PADDING
+    list_y = layout.layer_ys
+    lines = [(min_x - SEPARATOR_PADDING, max_x + SEPARATOR_PADDING, (list_y[i - 1] + list_y[i]) / 2) for i in range(1, len(list_y))]
+    labels = [(max_x + LABEL_PADDING, layer_y, "MAX" if i % 2 == 0 else "MIN") for i, layer_y in enumerate(list_y)]
+    return lines, labels
+
+# fill color, text color, value text and alpha beta text of a node at the simulator's current step
+def node_style_of(node, marked_node, is_prop_up, simulator=None):
+    is_marked = node == marked_node
+    color = "olivedrab1" if is_marked else ("light sky blue" if node.is_max else "IndianRed1")
+    # nodes answered from the transposition table
+    if not is_marked and simulator is not None and node in simulator.table_hits:
+        color = "gold"
+    text_color = "red" if is_marked else "black"
+    # the node a child just moved up to shows how its bound was updated
+    equation = simulator.move_up_equation() if is_prop_up and is_marked and simulator is not None else None
+    return color, text_color, node.value_string(), node.alpha_beta_string(equation)
+
+# image of a tree: search state of the simulator (if any) at its current step, node positions of the
+# layout scaled by scale and moved so that the whole tree with its labels starts at (0, 0)
+class TreeScene:
+    def __init__(self, root_node, layout, simulator=None, radius=30, scale=1.0):
+        self.root_node = root_node
+        self.layout = layout
+        self.simulator = simulator
+        self.radius = radius
+        self.scale = scale
+
+        if simulator is not None:
+            self.marked_node = simulator.curr_node
+            self.cutoffs = simulator.cutoff_index
+            self.is_prop_up = simulator.last_op() == OP_MOVE_UP
+        else:
+            self.marked_node, self.cutoffs, self.is_prop_up = None, None, None
+
+        # alpha beta labels of the root reach 2.5 radius above it, dashed separators 2 paddings beyond
+        # the outer leaves and layer labels a bit further
+        self.origin_x = layout.min_x - 2 * SEPARATOR_PADDING
+        self.origin_y = layout.min_y - 2.5 * radius
+        self.width = round((layout.max_x + SEPARATOR_PADDING + LABEL_PADDING + 30 - self.origin_x) * scale)
+        self.height = round((layout.max_y + 1.5 * radius - self.origin_y) * scale)
+        self.layer_ys = [self.point(0, layer_y)[1] for layer_y in layout.layer_ys]
+
+        # dashed separators and layer labels in image coordinates
+        lines, labels = layer_separators(layout)
+        self.separators = [(self.point(x1, y)[0], self.point(x2, y)[0], self.point(x1, y)[1]) for x1, x2, y in lines]
+        self.separator_ys = [y for _, _, y in self.separators]
+        self.layer_labels = [self.point(x, y) + (text,) for x, y, text in labels]
+        # computed for the first region drawn
+        self.layers = None
+
+    def point(self, x, y):
+        return (x - self.origin_x) * self.scale, (y - self.origin_y) * self.scale
+
+    # drawing items in image coordinates, in the order the app draws them: ("line", x1, y1, x2, y2,
+    # width, color, dashed), ("polygon", vertices, color) or ("text", x, y, text, size, color);
+    # with a region (left, top, right, bottom), subtrees and items outside of it are skipped, texts
+    # smaller than min_text_size are left out
+    def items(self, region=None, min_text_size=0):
+        s = self.scale
+        radius = self.radius * s
+        text_size = 13 * s
+        # nodes with their labels reach this far around their position
+        reach_x, reach_up, reach_down = 3 * radius, 2.5 * radius, radius
+
+        def visible(left, top, right, bottom):
+            return region is None or (left <= region[2] and right >= region[0] and top <= region[3] and bottom >= region[1])
+
+        lines, labels = self.separators, self.layer_labels
+        # separators and labels go from top to bottom, only those at the height of the region are checked
+        if region is not None:
+            lines = lines[bisect_left(self.separator_ys, region[1] - 1):bisect_right(self.separator_ys, region[3] + 1)]
+            labels = labels[bisect_left(self.layer_ys, region[1] - 10 * s):bisect_right(self.layer_ys, region[3] + 10 * s)]
+        for x1, x2, y in lines:
+            if visible(x1, y - 1, x2, y + 1):
+                yield "line", x1, y, x2, y, 1, "black", True
+        for x, y, text in labels:
+            if 16 * s >= min_text_size and visible(x - 20 * s, y - 10 * s, x + 20 * s, y + 10 * s):
+                yield "text", x, y, text, 16 * s, "black"
+
+        # depth-first, edges on the way down and nodes on the way up (as in App.draw_nodes); with a region
+        # the walk starts at the nodes of the layer above the first one reaching into it (their edges
+        # come down from there) which can reach the region horizontally, in the same left to right order
+        if region is None:
+            stack = [(self.root_node, None, False, False, 0, 0)]
+        else:
+            layers = self.layer_extents()
+            depth = max(0, bisect_left(self.layer_ys, region[1] - reach_down) - 1)
+            nodes, _, lefts, rights = layers[depth]
+            first = bisect_left(rights, region[0] - reach_x)
+            last = bisect_right(lefts, region[2] + reach_x)
+            stack = [(nodes[i], None, False, False, depth, i) for i in range(last - 1, first - 1, -1)]
+
+        while stack:
+            node, parent_point, cutoff, expanded, depth, i = stack.pop()
+            x, y = self.point(node.x, node.y)
+
+            if expanded:
+                if visible(x - reach_x, y - reach_up, x + reach_x, y + reach_down):
+                    color, text_color, value_text, alpha_beta_text = node_style_of(node, self.marked_node, self.is_prop_up, self.simulator)
+                    yield "polygon", triangle_vertices(node.is_max, x, y, radius), color
+                    if text_size >= min_text_size:
+                        yield "text", x, y + (0.2 if node.is_max else -0.2) * radius, value_text, text_size, text_color
+                        yield "text", x, y - 1.5 * radius, alpha_beta_text, text_size, text_color
+                continue
+
+            if region is not None and not self.subtree_visible(depth, i, region, reach_x, reach_up, parent_point):
+                continue
+
+            if parent_point is not None:
+                parent_x, parent_y = parent_point
+                if visible(min(parent_x, x), parent_y, max(parent_x, x), y):
+                    yield "line", parent_x, parent_y, x, y, 1, "black", False
+                    if cutoff:
+                        yield ("line",) + perpendicular_line(parent_x, parent_y, x, y, 10 * s) + (max(1, 4 * s), "red", False)
+
+            stack.append((node, None, False, True, depth, i))
+            # edges to the children start at the node, below the region nothing of them is visible
+            if region is not None and y > region[3]:
+                continue
+            cutoff_idx = self.cutoffs.get(node) if self.cutoffs else None
+            children = node.children
+            first_child = self.layers[depth][1][i] if region is not None else 0
+            for k in range(len(children) - 1, -1, -1):
+                stack.append((children[k], (x, y), cutoff_idx is not None and cutoff_idx <= k, False, depth + 1, first_child + k))
+
+    # nodes of every layer from left to right with the index of their first child in the next layer and
+    # the horizontal extent of their subtrees in image coordinates (from the leftmost to the rightmost
+    # leaf), computed once
+    def layer_extents(self):
+        if self.layers is not None:
+            return self.layers
+
+        layers = []
+        nodes = [self.root_node]
+        while nodes:
+            first_children = array('q', accumulate((len(node.children) for node in nodes), initial=0))
+            layers.append([nodes, first_children, None, None])
+            nodes = [child for node in nodes for child in node.children]
+
+        # bottom-up, the extent of an inner node spans the extents of its first and last child
+        child_lefts = child_rights = None
+        for layer in reversed(layers):
+            nodes, first_children = layer[0], layer[1]
+            lefts, rights = array('d'), array('d')
+            for i, node in enumerate(nodes):
+                if first_children[i] == first_children[i + 1]:
+                    x = self.point(node.x, node.y)[0]
+                    lefts.append(x)
+                    rights.append(x)
+                else:
+                    lefts.append(child_lefts[first_children[i]])
+                    rights.append(child_rights[first_children[i + 1] - 1])
+            layer[2], layer[3] = child_lefts, child_rights = lefts, rights
+
+        self.layers = layers
+        return layers
+
+    # can anything of the subtree of the i-th node of the layer (or the edge from its parent) lie inside
+    # the region?
+    def subtree_visible(self, depth, i, region, reach_x, reach_up, parent_point):
+        _, _, lefts, rights = self.layers[depth]
+        left, right, top = lefts[i] - reach_x, rights[i] + reach_x, self.layer_ys[depth] - reach_up
+        if parent_point is not None:
+            left, right, top = min(left, parent_point[0]), max(right, parent_point[0]), min(top, parent_point[1])
+        return left <= region[2] and right >= region[0] and top <= region[3]
+
+def svg_escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def svg_color(color):
+    return "#%02x%02x%02x" % COLORS[color]
+
+# writes the scene as SVG, element by element
+def write_svg(f, scene):
+    f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{scene.width}" height="{scene.height}" viewBox="0 0 {scene.width} {scene.height}">\n')
+    f.write(f'<rect width="100%" height="100%" fill="white"/>\n')
+
+    for item in scene.items():
+        if item[0] == "line":
+            _, x1, y1, x2, y2, width, color, dashed = item
+            dash = f' stroke-dasharray="{4 * scene.scale:g},{2 * scene.scale:g}"' if dashed else ""
+            f.write(f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" stroke="{svg_color(color)}" stroke-width="{width:g}"{dash}/>\n')
+        elif item[0] == "polygon":
+            _, vertices, color = item
+            points = " ".join(f"{vertices[i]:.1f},{vertices[i + 1]:.1f}" for i in range(0, len(vertices), 2))
+            f.write(f'<polygon points="{points}" fill="{svg_color(color)}"/>\n')
+        else:
+            _, x, y, text, size, color = item
+            if not text:
+                continue
+            lines = text.split("\n")
+            # multi-line texts are centered as a block like Tk's anchor
+            first_y = y - (len(lines) - 1) * size * 0.6
+            spans = "".join(f'<tspan x="{x:.1f}" y="{first_y + i * size * 1.2:.1f}">{svg_escape(line)}</tspan>' for i, line in enumerate(lines))
+            f.write(f'<text font-family="Arial" font-weight="bold" font-size="{size:g}" text-anchor="middle" dominant-baseline="central" fill="{svg_color(color)}">{spans}</text>\n')
+
+    f.write("</svg>\n")
+
+# 5x7 bitmap glyphs of the characters node texts use, unknown characters are drawn as '?'
+GLYPHS = {
+    "0": "01110 10001 10011 10101 11001 10001 01110", "1": "00100 01100 00100 00100 00100 00100 01110",
+    "2": "01110 10001 00001 00010 00100 01000 11111", "3": "11110 00001 00001 01110 00001 00001 11110",
+    "4": "00010 00110 01010 10010 11111 00010 00010", "5": "11111 10000 11110 00001 00001 10001 01110",
+    "6": "00110 01000 10000 11110 10001 10001 01110", "7": "11111 00001 00010 00100 01000 01000 01000",
+    "8": "01110 10001 10001 01110 10001 10001 01110", "9": "01110 10001 10001 01111 00001 00010 01100",
+    "-": "00000 00000 00000 11111 00000 00000 00000", "+": "00000 00100 00100 11111 00100 00100 00000",
+    ".": "00000 00000 00000 00000 00000 01100 01100", ",": "00000 00000 00000 00000 01100 00100 01000",
+    ":": "00000 01100 01100 00000 01100 01100 00000", "=": "00000 00000 11111 00000 11111 00000 00000",
+    "(": "00010 00100 01000 01000 01000 00100 00010", ")": "01000 00100 00010 00010 00010 00100 01000",
+    " ": "00000 00000 00000 00000 00000 00000 00000", "?": "01110 10001 00001 00010 00100 00000 00100",
+    "a": "00000 00000 01110 00001 01111 10001 01111", "e": "00000 00000 01110 10001 11111 10000 01110",
+    "f": "00110 01001 01000 11100 01000 01000 01000", "i": "00100 00000 01100 00100 00100 00100 01110",
+    "m": "00000 00000 11010 10101 10101 10001 10001", "n": "00000 00000 10110 11001 10001 10001 10001",
+    "x": "00000 00000 10001 01010 00100 01010 10001", "A": "01110 10001 10001 11111 10001 10001 10001",
+    "I": "01110 00100 00100 00100 00100 00100 01110", "M": "10001 11011 10101 10101 10001 10001 10001",
+    "N": "10001 11001 10101 10011 10001 10001 10001", "X": "10001 10001 01010 00100 01010 10001 10001",
+    "∞": "00000 00000 01010 10101 10101 01010 00000", "α": "00000 00000 01001 10101 10010 10010 01101", "β": "01110 10001 10010 10110 10001 10001 10110",
+}
+# (start, end) runs of set pixels in a glyph row
+def glyph_runs(row):
+    runs = []
+    start = None
+    for i, bit in enumerate(row + "0"):
+        if bit == "1" and start is None:
+            start = i
+        elif bit == "0" and start is not None:
+            runs.append((start, i))
+            start = None
+    return runs
+
+GLYPH_RUNS = {char: [glyph_runs(row) for row in rows.split()] for char, rows in GLYPHS.items()}
+
+# rectangle of pixels (RGB rows) covering the image region from (left, top), items are rasterized
+# with scanline spans clipped to it
+class Raster:
+    def __init__(self, left, top, width, height):
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(b"\xff" * (3 * width * height))
+
+    # fills pixels x1 <= x < x2 of image row y
+    def span(self, y, x1, x2, color):
+        y -= self.top
+        if y < 0 or y >= self.height:
+            return
+        x1 = max(x1 - self.left, 0)
+        x2 = min(x2 - self.left, self.width)
+        if x1 < x2:
+            start = 3 * (y * self.width + x1)
+            self.pixels[start:start + 3 * (x2 - x1)] = bytes(color) * (x2 - x1)
+
+    # fills a polygon by pixel centers (even-odd rule), a center on the right edge is inside, one on
+    # the left edge is not; every span is at least min_width pixels wide
+    def polygon(self, vertices, color, min_width=0):
+        points = list(zip(vertices[0::2], vertices[1::2]))
+        ys = vertices[1::2]
+        first = max(int(min(ys)), self.top)
+        last = min(int(max(ys)) + 1, self.top + self.height)
+
+        for y in range(first, last):
+            center_y = y + 0.5
+            xs = []
+            for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+                if (y1 <= center_y) != (y2 <= center_y):
+                    xs.append(x1 + (center_y - y1) * (x2 - x1) / (y2 - y1))
+            xs.sort()
+            for i in range(0, len(xs) - 1, 2):
+                x1, x2 = math.floor(xs[i] + 0.5), math.floor(xs[i + 1] + 0.5)
+                if x2 - x1 < min_width:
+                    x1 = math.floor((xs[i] + xs[i + 1]) / 2 - min_width / 2 + 0.5)
+                    x2 = x1 + min_width
+                self.span(y, x1, x2, color)
+
+    # line of the given width (1 pixel at least) as a filled quad, horizontal lines as spans (dashed
+    # ones in pieces of 4 on, 2 off; only separators are dashed)
+    def line(self, x1, y1, x2, y2, width, color, dashed=False, scale=1.0):
+        if y1 == y2:
+            first = math.floor(y1 - width / 2 + 0.5)
+            last = max(math.floor(y1 + width / 2 + 0.5), first + 1)
+            rows = range(max(first, self.top), min(last, self.top + self.height))
+            x1, x2 = min(x1, x2), max(x1, x2)
+            if not dashed:
+                for y in rows:
+                    self.span(y, math.floor(x1), max(math.ceil(x2), math.floor(x1) + 1), color)
+                return
+
+            on, off = 4 * scale, 2 * scale
+            x = x1 + max(0, (self.left - x1) // (on + off)) * (on + off)
+            end = min(x2, self.left + self.width)
+            while x < end:
+                for y in rows:
+                    self.span(y, round(x), round(min(x + on, x2)), color)
+                x += on + off
+            return
+
+        dx, dy = x2 - x1, y2 - y1
+        length = (dx * dx + dy * dy) ** 0.5 or 1.0
+        # half a pixel wide at least, so thin lines are not lost between pixel centers
+        half = max(width, 1) / 2
+        nx, ny = -dy / length * half, dx / length * half
+        if abs(dx) >= abs(dy):
+            ny = ny if abs(ny) >= 0.5 else (0.5 if ny >= 0 else -0.5)
+        else:
+            nx = nx if abs(nx) >= 0.5 else (0.5 if nx >= 0 else -0.5)
+        # steep lines cross every row they span with a pixel at least
+        self.polygon([x1 + nx, y1 + ny, x2 + nx, y2 + ny, x2 - nx, y2 - ny, x1 - nx, y1 - ny], color,
+                     1 if abs(dx) < abs(dy) else 0)
+
+    # text centered at (x, y), size is the line height in pixels
+    def text(self, x, y, text, size, color):
+        unit = max(1, round(size / 9))
+        lines = text.split("\n")
+        line_height = 9 * unit
+        top = round(y - len(lines) * line_height / 2 + unit)
+
+        for line in lines:
+            if top > self.top + self.height or top + 7 * unit < self.top:
+                top += line_height
+                continue
+            left = round(x - (6 * len(line) - 1) * unit / 2)
+            for char in line:
+                for row, runs in enumerate(GLYPH_RUNS.get(char, GLYPH_RUNS["?"])):
+                    for start, end in runs:
+                        for dy in range(unit):
+                            self.span(top + row * unit + dy, left + start * unit, left + end * unit, color)
+                left += 6 * unit
+            top += line_height
+
+    # rasterizes the scene items inside this rectangle
+    def draw(self, scene):
+        region = (self.left, self.top, self.left + self.width, self.top + self.height)
+        for item in scene.items(region, MIN_TEXT_SIZE):
+            if item[0] == "line":
+                _, x1, y1, x2, y2, width, color, dashed = item
+                self.line(x1, y1, x2, y2, width, COLORS[color], dashed, scene.scale)
+            elif item[0] == "polygon":
+                self.polygon(item[1], COLORS[item[2]])
+            elif item[3]:
+                _, x, y, text, size, color = item
+                self.text(x, y, text, size, COLORS[color])
+
+    def rows(self):
+        row_bytes = 3 * self.width
+        for y in range(self.height):
+            yield self.pixels[y * row_bytes:(y + 1) * row_bytes]
+
+def png_chunk(f, chunk_type, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(chunk_type)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(chunk_type + data)))
+
+# writes an 8 bit RGB PNG, rows are compressed as they come
+def write_png(f, width, height, rows):
+    f.write(b"\x89PNG\r\n\x1a\n")
+    png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+    compressor = zlib.compressobj(6)
+    for row in rows:
+        data = compressor.compress(b"\x00" + row)
+        if data:
+            png_chunk(f, b"IDAT", data)
+    png_chunk(f, b"IDAT", compressor.flush())
+    png_chunk(f, b"IEND", b"")
+
+# rows of the whole scene, rasterized in strips of at most strip_bytes pixel bytes (and 64 rows)
+def scene_rows(scene, strip_bytes=1 << 24):
+    strip_height = max(1, min(64, strip_bytes // (3 * scene.width)))
+    for top in range(0, scene.height, strip_height):
+        raster = Raster(0, top, scene.width, min(strip_height, scene.height - top))
+        raster.draw(scene)
+        yield from raster.rows()
+
+# writes the tree (at the simulator's current step) as SVG or PNG, by the extension of path; the layout
+# is computed if not given; PNG images are rasterized in strips of the full width, or with tile_size
+# as separate tiles of at most tile_size x tile_size pixels (path is then formatted with row and col,
+# e.g. "tree_{row}_{col}.png"); returns the paths written
+def export_image(path, root_node, layout=None, simulator=None, radius=30, scale=1.0, tile_size=None):
+    if layout is None:
+        layout = TreeLayout(root_node, 90, 150, 90, 150)
+    scene = TreeScene(root_node, layout, simulator, radius, scale)
+
+    if path.lower().endswith(".svg"):
+        with open(path, "w", encoding="utf-8") as f:
+            write_svg(f, scene)
+        return [path]
+    if not path.lower().endswith(".png"):
+        raise ValueError(f"{path}: expected a .svg or .png file")
+
+    if tile_size is None:
+        with open(path, "wb") as f:
+            write_png(f, scene.width, scene.height, scene_rows(scene))
+        return [path]
+    if "{row" not in path or "{col" not in path:
+        raise ValueError(f"{path}: tiles need {{row}} and {{col}} in the file name")
+
+    paths = []
+    for row, top in enumerate(range(0, scene.height, tile_size)):
+        for col, left in enumerate(range(0, scene.width, tile_size)):
+            raster = Raster(left, top, min(tile_size, scene.width - left), min(tile_size, scene.height - top))
+            raster.draw(scene)
+            tile_path = path.format(row=row, col=col)
+            with open(tile_path, "wb") as f:
+                write_png(f, raster.width, raster.height, raster.rows())
+            paths.append(tile_path)
+    return paths
+
+# exports every every-th step of the simulator's search (and the last one) as a frame, path is
+# formatted with the step (e.g. "frame_{step:06d}.svg"); steps are computed as needed and the
+# simulator returns to its current step afterwards; returns the paths written
+def export_frames(simulator, path, every=1, layout=None, radius=30, scale=1.0):
+    if "{step" not in path:
+        raise ValueError(f"{path}: frames need {{step}} in the file name")
+    if layout is None:
+        layout = TreeLayout(simulator.root_node, 90, 150, 90, 150)
+    curr_step = simulator.current_step()
+
+    paths = []
+    step = 0
+    while True:
+        simulator.seek(step, draw=False)
+        paths.extend(export_image(path.format(step=simulator.step), simulator.root_node, layout, simulator, radius, scale))
+        if simulator.over:
+            break
+        step += every
+
+    simulator.seek(curr_step, draw=False)
+    return paths
@@ -0,0 +1,1132 @@
+# Tk app of the alpha beta visualizer
+
+import time
+import tkinter as tk
+import tkinter.font as tkFont
+from tkinter import filedialog, messagebox
+from array import array
+from bisect import bisect_left, bisect_right
+
+from alpha_beta_engine import (ENGINES, AlphaBetaSimulator, ArrayTree, InputError, Instrumentation, MinimaxValues, SearchEngine,
+                               SimulatorObserver, SubtreeDAG, TranspositionTable, TreeCache, TreeLayout, TreeNode, alpha_beta_search,
+                               anytime_search, instrumented, map_array_file, parse_leaf_values, parse_tree_input,
+                               validate_binary_input)
+from alpha_beta_export import export_image, layer_separators, node_style_of, perpendicular_line, triangle_vertices
+
+class MovableCanvas(tk.Canvas):
+    def __init__(self, master=None, **kwargs):
+        tk.Canvas.__init__(self, master, **kwargs)
+        self.bind('<ButtonPress-1>', lambda ev: self.scan_mark(ev.x, ev.y))
+        self.bind('<B1-Motion>', self.drag)
+        self.bind("<MouseWheel>", self.zoom)
+
+        # with culling, zooming changes view_scale and the owner redraws the visible region
+        # (notified by <<ViewChanged>>) instead of scaling all items
+        self.culling = False
+        self.view_scale = 1.0
+
+    def drag(self, ev):
+        self.scan_dragto(ev.x, ev.y, gain=1)
+        if self.culling:
+            self.event_generate("<<ViewChanged>>")
+
+    def zoom(self, ev):
+        x = self.canvasx(ev.x)
+        y = self.canvasy(ev.y)
+        scale = 1.001 ** ev.delta
+
+        if self.culling:
+            self.view_scale *= scale
+            # scroll so that the point under the mouse stays in place
+            self.scan_mark(0, 0)
+            self.scan_dragto(round(-x * (scale - 1)), round(-y * (scale - 1)), gain=1)
+            self.event_generate("<<ViewChanged>>")
+        else:
+            self.scale(tk.ALL, x, y, scale, scale)
+
+class App(SimulatorObserver):
+    # Instrumentation hooked methods report to (None when disabled)
+    instrumentation = None
+
+    # game_tree is a GameTree searched by anytime_search with the given search_limits
+    # (max_depth, node_budget, time_limit in seconds)
+    def __init__(self, structure_path=None, leaves_path=None, game_tree=None, search_limits=None):
+        # main window
+        self.root = tk.Tk()
+        self.root.title("Alpha Beta Pruning")         
+
+        window_width = 1024    
+        window_height = 768 
+        self.node_radius = 30 
+
+        self.tree_structure_lst = None
+        self.leaf_values_lst = None
+        # (degrees, leaf values) loaded from binary files, used instead of the text input
+        self.binary_input = None
+        # copy of the game tree of every anytime search iteration by label, used instead of the text input
+        self.iteration_trees = None
+
+        self.simulator = None
+        # step counts and engine stats texts of the iteration trees (the tree cache keeps them for
+        # the other trees), so resetting the tree or switching engines does not search it again
+        self.iteration_results = {}
+        # range of the timeline slider, updated once the number of steps is known again after a leaf edit
+        self.timeline_steps = 0
+        # minimax values of the current tree (kept with its results) and the open leaf entry
+        self.minimax = None
+        self.leaf_editor = None
+        # steps between simulator snapshots used by the timeline slider
+        self.snapshot_interval = 1000
+        # entries of the transposition table used with shared subtrees
+        self.table_size = 100000
+        # built trees and their layouts by structure (up to max_nodes nodes in all), so resetting
+        # or generating a tree of a known shape does not build and lay it out again
+        self.tree_cache = TreeCache(max_nodes=2000000)
+
+        # auto-play: pending after() job, start time and steps played since then,
+        # steps of more than max_lag seconds behind the clock are dropped instead of caught up
+        self.play_job = None
+        self.play_start = 0.0
+        self.play_steps = 0
+        self.play_rate = 10.0
+        self.max_lag = 0.25
+        # seconds of steps per frame at most, so the mainloop keeps handling drag and zoom events
+        self.frame_budget = 0.01
+
+        # fixed margin
+        self.margin_x = 90
+        self.margin_y = 150
+        self.layout = None
+
+        # viewport culling: nodes of each layer sorted by x, cached subtree summaries,
+        # arguments of the last render (redrawn when the view changes)
+        self.layers = None
+        self.summaries = {}
+        self.last_render = None
+        self.redraw_pending = None
+        # layers whose nodes are closer than lod_spacing pixels are collapsed into summary glyphs,
+        # texts are hidden below text_min_scale
+        self.lod_spacing = 12
+        self.text_min_scale = 0.5
+
+        # canvas items and last drawn state of each node (used for incremental redraws)
+        self.node_items = {}
+        self.edge_items = {}
+        self.cutoff_items = {}
+        self.node_state = {}
+        self.cutoff_state = {}
+        self.marked_node = None
+        # node of every drawn polygon, to find the node under the mouse
+        self.item_nodes = {}
+
+        self.root.geometry(f"{window_width}x{window_height}")
+        self.create_widgets()
+
+        if structure_path and leaves_path:
+            self.root.after_idle(self.load_binary_input, structure_path, leaves_path)
+        if game_tree is not None:
+            self.root.after_idle(self.search_game, game_tree, *(search_limits or ()))
+
+        self.root.mainloop()
+
+    def create_widgets(self): 
+        self.widget_frame = tk.Frame(self.root)
+        self.widget_frame.pack(fill=tk.X)
+
+        # tree structure input
+        self.tree_structure_label = tk.Label(self.widget_frame, text="Enter tree structure:", font=tkFont.Font(size=10))
+        self.tree_structure_label.grid(row=0, column=0, padx=10, pady=10, sticky=tk.W)
+
+        self.tree_structure = tk.StringVar()
+
+        self.tree_structure_input = tk.Entry(self.widget_frame, textvariable=self.tree_structure, font=tkFont.Font(size=10), width=40)
+        self.tree_structure_input.grid(row=0, column=1, padx=(0, 10), pady=10)
+        # default value
+        self.tree_structure_input.insert(tk.END, "2|2,2|2,2,2,2")
+
+        def_bg = self.tree_structure_input.cget("bg")
+        self.tree_structure.trace_add("write", lambda *args: self.tree_structure_input.config(bg=def_bg))
+
+        # leaf values input
+        self.leaf_values_label = tk.Label(self.widget_frame, text="Enter leaf values:", font=tkFont.Font(size=10))
+        self.leaf_values_label.grid(row=1, column=0, padx=10, pady=(0, 10), sticky=tk.W)
+
+        self.leaf_values = tk.StringVar()
+
+        self.leaf_values_input = tk.Entry(self.widget_frame, textvariable=self.leaf_values, font=tkFont.Font(size=10), width=40)
+        self.leaf_values_input.grid(row=1, column=1, padx=(0, 10), pady=(0, 10))
+        # default value
+        self.leaf_values_input.insert(tk.END, "11,-20,12,-10,-12,-5,-6,2")
+
+        self.leaf_values.trace_add("write", lambda *args: self.leaf_values_input.config(bg=def_bg))
+
+        # generate tree button
+        self.generate_tree_btn = tk.Button(self.widget_frame, text="Generate tree", command=self.validate_input, font=tkFont.Font(size=10))
+        self.generate_tree_btn.grid(row=0, column=2, padx=10, pady=10, sticky=tk.E+tk.W)
+
+        # reset button
+        self.reset_btn = tk.Button(self.widget_frame, text="Reset current tree", command=self.prepare_simulator, font=tkFont.Font(size=10))
+        self.reset_btn.grid(row=1, column=2, padx=10, pady=(0, 10), sticky=tk.E+tk.W)
+
+        # load binary input button
+        self.load_binary_btn = tk.Button(self.widget_frame, text="Load binary files", command=self.load_binary_input, font=tkFont.Font(size=10))
+        self.load_binary_btn.grid(row=0, column=7, padx=(0, 10), sticky=tk.E+tk.W)
+
+        # status bar with instrumentation data (packed before the canvas to keep its space)
+        self.status_frame = tk.Frame(self.root)
+        self.status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.instrument = tk.BooleanVar(value=False)
+        self.instrument_btn = tk.Checkbutton(self.status_frame, text="Instrumentation", variable=self.instrument, command=self.toggle_instrumentation, font=tkFont.Font(size=10))
+        self.instrument_btn.pack(side=tk.LEFT, padx=10)
+
+        self.export_trace_btn = tk.Button(self.status_frame, text="Export trace", command=self.export_trace, font=tkFont.Font(size=10))
+        self.export_trace_btn.pack(side=tk.RIGHT, padx=10, pady=(0, 5))
+
+        # tree at the current step as an SVG or PNG file
+        self.export_image_btn = tk.Button(self.status_frame, text="Export image", command=self.save_image, font=tkFont.Font(size=10))
+        self.export_image_btn.pack(side=tk.RIGHT, padx=(10, 0), pady=(0, 5))
+
+        # search steps saved to / replayed from a binary file
+        self.load_steps_btn = tk.Button(self.status_frame, text="Load steps", command=self.load_steps, font=tkFont.Font(size=10))
+        self.load_steps_btn.pack(side=tk.RIGHT, padx=(10, 0), pady=(0, 5))
+
+        self.save_steps_btn = tk.Button(self.status_frame, text="Save steps", command=self.save_steps, font=tkFont.Font(size=10))
+        self.save_steps_btn.pack(side=tk.RIGHT, padx=(10, 0), pady=(0, 5))
+
+        self.status = tk.Label(self.status_frame, text="", anchor=tk.W, font=tkFont.Font(size=9))
+        self.status.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        # canvas
+        self.canvas = MovableCanvas(self.root, bg="white")
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind("<<ViewChanged>>", self.view_changed)
+        self.canvas.bind("<Configure>", self.view_changed)
+        self.canvas.bind("<Double-Button-1>", self.edit_leaf)
+
+        # simulation controls
+        self.one_step_label = tk.Label(self.widget_frame, text="One forward / backward step:", font=tkFont.Font(size=10))
+        self.one_step_label.grid(row=0, column=3, padx=(20, 10), pady=10, sticky=tk.W)
+
+        self.backward_button = tk.Button(self.widget_frame, text="<<", font=tkFont.Font(size=10))
+        self.backward_button.grid(row=0, column=4, pady=10, sticky=tk.E+tk.W)
+
+        self.forward_button = tk.Button(self.widget_frame, text=">>", font=tkFont.Font(size=10))
+        self.forward_button.grid(row=0, column=5, pady=10, sticky=tk.E+tk.W)
+
+        self.all_steps_label = tk.Label(self.widget_frame, text="All forward / backward steps:", font=tkFont.Font(size=10))
+        self.all_steps_label.grid(row=1, column=3, padx=(20, 10), pady=(0, 10), sticky=tk.W)
+
+        self.all_backward_button = tk.Button(self.widget_frame, text="<<<", font=tkFont.Font(size=10))
+        self.all_backward_button.grid(row=1, column=4, pady=(0, 10), sticky=tk.E+tk.W)
+
+        self.all_forward_button = tk.Button(self.widget_frame, text=">>>", font=tkFont.Font(size=10))
+        self.all_forward_button.grid(row=1, column=5, pady=(0, 10), sticky=tk.E+tk.W)
+
+        # instructions
+        self.instruction_btn = tk.Button(self.widget_frame, text="Instructions", command=self.show_instructions, font=tkFont.Font(size=10))
+        self.instruction_btn.grid(row=0, column=6, padx=(50, 10))
+
+        # incremental redraw toggle
+        self.incremental_render = tk.BooleanVar(value=True)
+        self.incremental_render_btn = tk.Checkbutton(self.widget_frame, text="Incremental redraw", variable=self.incremental_render, font=tkFont.Font(size=10))
+        self.incremental_render_btn.grid(row=1, column=6, padx=(50, 10))
+
+        # compact (array-backed) tree store toggle
+        self.compact_tree = tk.BooleanVar(value=False)
+        self.compact_tree_btn = tk.Checkbutton(self.widget_frame, text="Compact tree store", variable=self.compact_tree, font=tkFont.Font(size=10))
+        self.compact_tree_btn.grid(row=1, column=7, padx=(0, 10))
+
+        # viewport culling toggle
+        self.culling = tk.BooleanVar(value=False)
+        self.culling_btn = tk.Checkbutton(self.widget_frame, text="Viewport culling", variable=self.culling, command=self.toggle_culling, font=tkFont.Font(size=10))
+        self.culling_btn.grid(row=1, column=8, padx=(0, 10))
+
+        # identical subtrees toggle (searched through a transposition table)
+        self.share_subtrees = tk.BooleanVar(value=False)
+        self.share_subtrees_btn = tk.Checkbutton(self.widget_frame, text="Share identical subtrees", variable=self.share_subtrees, command=self.prepare_simulator, font=tkFont.Font(size=10))
+        self.share_subtrees_btn.grid(row=0, column=8, padx=(0, 10))
+
+        # timeline slider
+        self.timeline_label = tk.Label(self.widget_frame, text="Step:", font=tkFont.Font(size=10))
+        self.timeline_label.grid(row=2, column=0, padx=10, pady=(0, 10), sticky=tk.W)
+
+        self.timeline = tk.Scale(self.widget_frame, from_=0, to=0, orient=tk.HORIZONTAL, command=self.seek, font=tkFont.Font(size=10))
+        self.timeline.grid(row=2, column=1, columnspan=7, padx=(0, 10), pady=(0, 10), sticky=tk.E+tk.W)
+
+        # auto-play controls
+        self.play_frame = tk.Frame(self.widget_frame)
+        self.play_frame.grid(row=2, column=8, padx=(0, 10), pady=(0, 10), sticky=tk.W)
+
+        self.play_button = tk.Button(self.play_frame, text="Play", command=self.toggle_play, width=5, font=tkFont.Font(size=10))
+        self.play_button.pack(side=tk.LEFT)
+
+        self.play_rate_var = tk.StringVar(value="10")
+        self.play_rate_input = tk.Spinbox(self.play_frame, from_=1, to=1000000, textvariable=self.play_rate_var, width=7, font=tkFont.Font(size=10))
+        self.play_rate_input.pack(side=tk.LEFT, padx=(10, 5))
+
+        self.play_rate_label = tk.Label(self.play_frame, text="steps/s", font=tkFont.Font(size=10))
+        self.play_rate_label.pack(side=tk.LEFT)
+
+        # search engine selection (changing it resets the current tree)
+        self.engine_label = tk.Label(self.widget_frame, text="Engine:", font=tkFont.Font(size=10))
+        self.engine_label.grid(row=3, column=0, padx=10, pady=(0, 10), sticky=tk.W)
+
+        self.engine_name = tk.StringVar(value="Alpha-beta")
+        self.engine_menu = tk.OptionMenu(self.widget_frame, self.engine_name, *ENGINES, command=lambda name: self.prepare_simulator())
+        self.engine_menu.config(font=tkFont.Font(size=10))
+        self.engine_menu.grid(row=3, column=1, padx=(0, 10), pady=(0, 10), sticky=tk.W)
+
+        # nodes visited and cutoffs of the selected engine next to plain alpha beta
+        self.engine_stats = tk.Label(self.widget_frame, text="", font=tkFont.Font(size=10))
+        self.engine_stats.grid(row=3, column=2, columnspan=7, padx=(0, 10), pady=(0, 10), sticky=tk.W)
+
+    def validate_input(self):
+        try:
+            tree_structure_lst, leaf_values = parse_tree_input(self.tree_structure.get(), self.leaf_values.get())
+        except InputError as e:
+            print(f'input is not valid! {e}')
+            self.invalid_input(e.field != "structure", e.position)
+            return
+
+        print('input is valid!')
+        self.tree_structure_lst = tree_structure_lst
+        self.leaf_values_lst = leaf_values
+        self.binary_input = None
+        self.iteration_trees = None
+        self.iteration_results = {}
+        self.prepare_simulator()
+
+    # loads tree structure and leaf values from memory-mapped binary files (asks for files if not given)
+    def load_binary_input(self, structure_path=None, leaves_path=None):
+        filetypes = [("NumPy arrays", "*.npy"), ("All files", "*")]
+        if structure_path is None:
+            structure_path = filedialog.askopenfilename(title="Tree structure (int32 degrees)", filetypes=filetypes)
+        if structure_path and leaves_path is None:
+            leaves_path = filedialog.askopenfilename(title="Leaf values (float64)", filetypes=filetypes)
+        if not structure_path or not leaves_path:
+            return
+
+        try:
+            degrees = map_array_file(structure_path, "i")
+            leaf_values = map_array_file(leaves_path, "d")
+            validate_binary_input(degrees, leaf_values)
+        except (OSError, ValueError) as e:
+            print(f'input is not valid! {e}')
+            messagebox.showerror("Invalid input", str(e))
+            return
+
+        print('input is valid!')
+        self.binary_input = (degrees, leaf_values)
+        self.iteration_trees = None
+        self.iteration_results = {}
+        self.prepare_simulator()
+
+    def show_instructions(self):
+        instruction = tk.Toplevel(self.root)
+        instruction.title("Program Instructions")
+        # instruction.geometry("500x400")
+
+        instruction_text = (
+            "Generate Tree:\n"
+            "To create a tree, provide both the tree structure and leaf values.\n\n"
+            "Tree Structure:\n"
+            "Define the number of children for nodes in each layer. For instance, use the format\n"
+            "'n|m1,m2,m3' where 'n' is the number of children for the root node, and 'm1,m2,m3'\n"
+            "represent the number of children for the nodes in the next layer. Example: '3|3,3,3'\n"
+            "signifies that the root node has 3 children, and each of those children has 3 children\n"
+            "as well.\n\n"
+            "Leaf Values:\n"
+            "Input a list of numbers (possibly decimals) separated by commas. For the previously\n"
+            "mentioned tree structure, an example would be: '-11,4,3,1.5,1,-5.3,7,-10,20'.\n\n"
+            "Shorthands: 'b^d' is a uniform tree with b children per node and depth d (e.g. '3^4'),\n"
+            "'2*1000' repeats a degree or leaf value 1000 times, 'range' numbers the leaves 0, 1, 2, ...\n"
+            "and 'seed:42' draws random integer leaf values (-128 to 127) from seed 42.\n\n"
+            "Ensure that the input is semantically valid; otherwise, the tree cannot be generated\n"
+            "and the cursor is placed at the first error.\n\n"
+            "Binary Input:\n"
+            "Use 'Load binary files' to select a structure file (degrees of internal nodes in\n"
+            "breadth-first order, int32) and a leaf values file (float64), raw or '.npy'.\n\n"
+            "Alpha Beta Pruning Simulation:\n"
+            "After generating a tree, simulate Alpha Beta pruning by clicking on '<<' and '>>'.\n"
+            "Drag the 'Step' slider to jump to any step of the simulation.\n"
+            "'Play' steps forward automatically at the given steps per second; if drawing cannot\n"
+            "keep up, several steps are drawn as one.\n\n"
+            "Search Engines:\n"
+            "Select 'PVS / NegaScout', 'MTD(f)' or 'SSS*' under 'Engine' to step through another\n"
+            "search. Nodes visited and cutoffs are shown next to those of plain alpha beta; nodes\n"
+            "searched again (re-searches, MTD passes) are counted every time.\n"
+            "With 'Share identical subtrees', identical subtrees are resolved by a transposition\n"
+            "table; nodes answered from the table are shown in gold.\n\n"
+            "Handling Large Trees:\n"
+            "If the input generates a tree that is too large for the canvas, drag the tree around\n"
+            "to view different parts of the tree. You can also use mouse-wheel for zooming.\n"
+            "Enable 'Viewport culling' to only draw the visible part of the tree; dense parts are\n"
+            "then shown as grey glyphs with subtree size and range of leaf values.\n\n"
+            "Instrumentation:\n"
+            "Enable 'Instrumentation' (bottom left) to show call latencies, canvas items and search\n"
+            "counters in the status bar; 'Export trace' saves them as a trace file for chrome://tracing.\n\n"
+            "Editing Leaves:\n"
+            "Double click a leaf to change its value, press Enter to apply it or Escape to cancel.\n"
+            "Only the leaf's ancestors are evaluated again; the steps before the search reached the\n"
+            "leaf are kept and the rest is searched again up to the current step.\n\n"
+            "Saving Steps:\n"
+            "'Save steps' writes the steps computed so far to a file; 'Load steps' replays them on the\n"
+            "same tree with the same engine without computing the search again.\n\n"
+            "Exporting Images:\n"
+            "'Export image' saves the whole tree at the current step (values, alpha beta values and\n"
+            "cutoffs) as an SVG or PNG file, independent of zoom and the visible part of the canvas.\n\n"
+            "Games:\n"
+            "Started with '--game', the app runs an anytime search on the game and lists every\n"
+            "deepening iteration under 'Iteration'; select one to step through its search tree."
+        )
+
+        label = tk.Label(instruction, text=instruction_text, justify="left", pady=10)
+        label.grid(row=0, column=0, pady=10, padx=10)
+
+    # marks the invalid field and puts the cursor on the error position
+    def invalid_input(self, tree_str_valid, position=None):
+        entry = self.tree_structure_input if not tree_str_valid else self.leaf_values_input
+        entry.config(bg="IndianRed1")
+        if position is not None:
+            entry.icursor(position)
+            entry.xview(max(0, position - 10))
+            entry.focus_set()
+
+    @instrumented("prepare_simulator")
+    def prepare_simulator(self):
+        if self.binary_input is not None:
+            degrees, leaf_values = self.binary_input
+            # same kind as compact trees of the text input, the degrees determine the tree
+            root_node, self.layout = self.tree_cache.get("array", [degrees], leaf_values, lambda: ArrayTree(degrees, leaf_values).root, self.new_layout)
+        elif self.iteration_trees is not None:
+            root_node = self.iteration_trees[self.iteration_name.get()]
+            root_node.reset_search_state()
+            if self.layout is None or self.layout.root_node is not root_node:
+                self.layout = self.new_layout(root_node)
+        elif not self.tree_structure_lst or not self.leaf_values_lst:
+            return
+        else:
+            kind, generate_tree = ("array", ArrayTree.generate_tree) if self.compact_tree.get() else ("nodes", TreeNode.generate_tree)
+            root_node, self.layout = self.tree_cache.get(kind, self.tree_structure_lst, self.leaf_values_lst,
+                                                         lambda: generate_tree(self.tree_structure_lst, self.leaf_values_lst), self.new_layout)
+
+        # a cached layout was centered before, it only moves if the canvas width changed
+        offset_x = root_node.x - self.canvas.winfo_width() / 2
+        if offset_x:
+            self.layout.center(offset_x, 0)
+
+        # the tree drawn last (reset) keeps its canvas items and view, only the search state is cleared
+        same_tree = self.last_render is not None and self.last_render[0] is root_node
+        if not same_tree:
+            self.canvas.xview_moveto(0)
+            self.canvas.yview_moveto(0)
+            self.canvas.view_scale = 1.0
+            self.layers = None
+        self.summaries = {}
+
+        # draw initial tree
+        self.stop_play()
+        self.close_leaf_editor()
+        self.simulator = None
+        self.last_render = (root_node, None, None, None)
+        if self.culling.get():
+            self.draw_visible(root_node)
+        elif same_tree and self.incremental_render.get() and self.node_items:
+            self.update_tree()
+        else:
+            self.draw_tree(root_node, self.node_radius)
+
+        engine_cls = ENGINES[self.engine_name.get()]
+        if self.share_subtrees.get():
+            # identical subtrees are resolved by lookup, plain alpha beta runs as an engine for that
+            table = TranspositionTable(SubtreeDAG(root_node), self.table_size)
+            engine = (engine_cls or SearchEngine)(table=table)
+        else:
+            engine = engine_cls() if engine_cls is not None else None
+        results = self.tree_results(root_node)
+        self.show_engine_stats(root_node, engine, results)
+        # leaf edits keep the minimax values up to date, so they are built once per tree and leaf values
+        self.minimax = results.get("minimax")
+        if self.minimax is None:
+            self.minimax = results["minimax"] = MinimaxValues(root_node)
+
+        alpha_beta_simulator = AlphaBetaSimulator(self, root_node, self.snapshot_interval, engine)
+        alpha_beta_simulator.instrumentation = self.instrumentation
+        alpha_beta_simulator.minimax = self.minimax
+        if engine is None or engine.table is None:
+            key = ("steps", self.engine_name.get())
+            if key not in results:
+                results[key] = alpha_beta_simulator.count_steps()
+            alpha_beta_simulator.total_steps = results[key]
+        self.set_timeline_steps(alpha_beta_simulator.count_steps())
+        self.timeline.set(0)
+        self.simulator = alpha_beta_simulator
+
+        # set buttons for controlling simulation
+        self.backward_button.config(command=alpha_beta_simulator.backward)
+        self.forward_button.config(command=alpha_beta_simulator.forward)
+
+        self.all_backward_button.config(command=alpha_beta_simulator.all_backward)
+        self.all_forward_button.config(command=alpha_beta_simulator.all_forward)
+
+    # node drawn at the window point (x, y), None if there is none
+    def node_at(self, x, y):
+        x, y = self.canvas.canvasx(x), self.canvas.canvasy(y)
+        if not self.culling.get():
+            for item in self.canvas.find_overlapping(x, y, x, y):
+                if item in self.item_nodes:
+                    return self.item_nodes[item]
+            return None
+
+        # with culling, drawn nodes are found in the layer index (in tree coordinates)
+        if self.layers is None:
+            return None
+        scale = self.canvas.view_scale
+        x, y = x / scale, y / scale
+        for layer_y, nodes, xs, _, _, _, spacing in self.layers:
+            if abs(layer_y - y) <= self.node_radius and spacing * scale >= self.lod_spacing:
+                i = bisect_left(xs, x - self.node_radius)
+                if i < len(xs) and xs[i] <= x + self.node_radius:
+                    return nodes[i]
+        return None
+
+    # opens an entry for the value of the leaf under the mouse (double click)
+    def edit_leaf(self, ev):
+        node = self.node_at(ev.x, ev.y)
+        if node is None or not node.is_leaf() or self.simulator is None:
+            return
+
+        self.close_leaf_editor()
+        value = tk.StringVar(value=node.value_string())
+        entry = tk.Entry(self.canvas, textvariable=value, width=8, justify=tk.CENTER, font=tkFont.Font(size=10))
+        def_bg = entry.cget("bg")
+        value.trace_add("write", lambda *args: entry.config(bg=def_bg))
+        entry.bind("<Return>", lambda ev: self.commit_leaf_edit(node))
+        entry.bind("<Escape>", lambda ev: self.close_leaf_editor())
+        entry.bind("<FocusOut>", lambda ev: self.close_leaf_editor())
+
+        window = self.canvas.create_window(self.canvas.canvasx(ev.x), self.canvas.canvasy(ev.y), window=entry)
+        self.leaf_editor = (entry, window)
+        entry.select_range(0, tk.END)
+        entry.focus_set()
+
+    def close_leaf_editor(self):
+        if self.leaf_editor is not None:
+            entry, window = self.leaf_editor
+            self.leaf_editor = None
+            self.canvas.delete(window)
+            entry.destroy()
+
+    def commit_leaf_edit(self, node):
+        entry, _ = self.leaf_editor
+        try:
+            value = parse_leaf_values(entry.get(), 1)[0]
+        except InputError as e:
+            print(f'input is not valid! {e}')
+            entry.config(bg="IndianRed1")
+            return
+
+        self.close_leaf_editor()
+        self.set_leaf_value(node, value)
+
+    # changes a leaf in place: minimax values are updated along the leaf's path and the simulator
+    # only searches again from the step that first entered the leaf
+    @instrumented("set_leaf_value")
+    def set_leaf_value(self, node, value):
+        old_value = node.value
+        root_node = self.simulator.root_node
+
+        # keep the input in sync, so resetting the tree keeps the edit (array trees share it already)
+        if self.binary_input is None and self.iteration_trees is None and not self.compact_tree.get():
+            self.leaf_values_lst[self.minimax.leaf_number(node)] = value
+        changed = self.minimax.update_leaf(node, value)
+
+        # the cached tree gets the input leaves again on reset, its step counts and engine stats
+        # are found again for the edited tree (the minimax values are up to date)
+        self.tree_cache.leaves_changed(root_node)
+        self.iteration_results.pop(root_node, None)
+        self.tree_results(root_node)["minimax"] = self.minimax
+        if self.share_subtrees.get():
+            # identical subtrees change with the leaf, so the shared ones are found again
+            node.value = value
+            self.prepare_simulator()
+            return
+
+        self.summaries = {}
+        self.stop_play()
+        self.simulator.set_leaf_value(node, value)
+
+        self.engine_stats.config(text=f"leaf {old_value:g} -> {value:g}: minimax value {self.minimax.value(root_node):g}, {len(changed)} nodes re-evaluated")
+
+    # runs anytime search on a game tree, keeps a copy of the tree every iteration searched
+    # (in that iteration's move order) and shows the best complete iteration; the copies are
+    # made within the node budget and the time limit
+    def search_game(self, game_tree, max_depth=None, node_budget=None, time_limit=None):
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        result = anytime_search(game_tree, max_depth, node_budget, deadline, snapshots=True)
+        if not result.iterations:
+            print(f"search stopped by {result.stopped} before the first iteration")
+            messagebox.showerror("Game search", f"The {'time limit' if result.stopped == 'time' else 'node budget'} is too small to copy the tree of depth 1.")
+            return
+
+        labels = []
+        for iteration in result.iterations:
+            if iteration.complete:
+                print(f"depth {iteration.depth}: value {iteration.value:g}, best move {iteration.best_move}, {iteration.visited} nodes visited")
+                labels.append(f"Depth {iteration.depth}")
+            else:
+                print(f"depth {iteration.depth}: stopped after {iteration.visited} nodes visited")
+                labels.append(f"Depth {iteration.depth} (stopped)")
+        print(f"search stopped by {result.stopped}, {result.visited} nodes visited")
+
+        self.iteration_trees = dict(zip(labels, (iteration.tree for iteration in result.iterations)))
+        self.iteration_results = {}
+        self.binary_input = None
+        selected = labels[result.iterations.index(result.best)] if result.best is not None else labels[-1]
+        self.iteration_name = tk.StringVar(value=selected)
+
+        # iteration selection (row 4 only exists once a game was searched)
+        self.iteration_label = tk.Label(self.widget_frame, text="Iteration:", font=tkFont.Font(size=10))
+        self.iteration_label.grid(row=4, column=0, padx=10, pady=(0, 10), sticky=tk.W)
+
+        self.iteration_menu = tk.OptionMenu(self.widget_frame, self.iteration_name, *labels, command=lambda name: self.prepare_simulator())
+        self.iteration_menu.config(font=tkFont.Font(size=10))
+        self.iteration_menu.grid(row=4, column=1, padx=(0, 10), pady=(0, 10), sticky=tk.W)
+
+        best = result.best
+        text = f"search stopped by {result.stopped} after {result.visited} nodes visited"
+        if best is not None:
+            text = f"best (depth {best.depth}): value {best.value:g}, move {best.best_move}    " + text
+        self.iteration_stats = tk.Label(self.widget_frame, text=text, font=tkFont.Font(size=10))
+        self.iteration_stats.grid(row=4, column=2, columnspan=7, padx=(0, 10), pady=(0, 10), sticky=tk.W)
+
+        self.prepare_simulator()
+
+    def new_layout(self, root_node):
+        return TreeLayout(root_node, self.margin_x, self.margin_y, self.margin_x, self.margin_y)
+
+    # results derived from searching the tree, kept until its leaves change
+    def tree_results(self, root_node):
+        results = self.tree_cache.results(root_node)
+        if results is None:
+            results = self.iteration_results.setdefault(root_node, {})
+        return results
+
+    # runs plain alpha beta and the selected engine headless and shows how much work each did
+    # (without a transposition table the text is kept in the tree's results per engine, with one
+    # the searches also fill the fresh table and run every time)
+    def show_engine_stats(self, root_node, engine, kept):
+        key = ("stats", self.engine_name.get())
+        if key in kept and (engine is None or engine.table is None):
+            self.engine_stats.config(text=kept[key])
+            return
+
+        results = [("Alpha-beta", alpha_beta_search(root_node))]
+        root_node.reset_search_state()
+        if engine is not None:
+            name = engine.name if engine.table is None else f"{engine.name} + table"
+            results.append((name, engine.solve(root_node)))
+            root_node.reset_search_state()
+
+        text = "    ".join(f"{name}: {result.visited} nodes visited, {len(result.cutoffs)} cutoffs" for name, result in results)
+        if engine is not None and engine.table is not None:
+            table = engine.table
+            no_subtrees, no_nodes = table.subtrees.size()
+            text += f"    table: {table.hits} hits, {table.misses} misses, {table.evictions} evictions ({no_subtrees} distinct subtrees of {no_nodes} nodes)"
+        else:
+            kept[key] = text
+        self.engine_stats.config(text=text)
+
+    # starts a new recording of latencies, canvas items and search counters, or stops it
+    def toggle_instrumentation(self):
+        if self.instrument.get():
+            self.instrumentation = Instrumentation()
+            self.instrumentation.listener = self.update_status
+            self.instrumentation.watch_canvas(self.canvas)
+            self.status.config(text="recording...")
+        else:
+            self.instrumentation.unwatch_canvas(self.canvas)
+            self.instrumentation = None
+            self.status.config(text="")
+
+        if self.simulator is not None:
+            self.simulator.instrumentation = self.instrumentation
+
+    # shows the latest latencies and counters in the status bar
+    def update_status(self):
+        instrumentation = self.instrumentation
+        parts = []
+        for name in ("forward", "backward", "seek", "render", "draw_tree", "update_tree", "draw_visible", "prepare_simulator"):
+            if name in instrumentation.histograms:
+                calls, mean, p50, p99, longest = instrumentation.summary(name)
+                parts.append(f"{name}: {mean:.1f} ms (p50 {p50:.1f}, p99 {p99:.1f}, max {longest:.1f}, {calls}x)")
+
+        parts.append(f"items: {len(self.canvas.find_all())} ({instrumentation.items_created} created)")
+        parts.extend(f"{name}: {value}" for name, value in instrumentation.counters.items())
+        self.status.config(text="  |  ".join(parts))
+
+    # saves the recorded trace events as JSON (opens in chrome://tracing or Perfetto)
+    def export_trace(self):
+        if self.instrumentation is None:
+            messagebox.showinfo("Export trace", "Enable 'Instrumentation' first.")
+            return
+
+        path = filedialog.asksaveasfilename(title="Export trace", defaultextension=".json", filetypes=[("Trace events", "*.json")])
+        if path:
+            self.instrumentation.export(path)
+
+    # writes the tree at the current step to an image file, drawn without the canvas
+    def save_image(self):
+        if self.simulator is None:
+            return
+
+        path = filedialog.asksaveasfilename(title="Export image", defaultextension=".svg", filetypes=[("SVG images", "*.svg"), ("PNG images", "*.png")])
+        if not path:
+            return
+
+        self.stop_play()
+        try:
+            export_image(path, self.simulator.root_node, self.layout, self.simulator, self.node_radius)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Export image", str(e))
+
+    def toggle_play(self):
+        if self.play_job is not None:
+            self.stop_play()
+        elif self.simulator is not None and not self.simulator.over:
+            self.play_button.config(text="Pause")
+            self.play_start = time.perf_counter()
+            self.play_steps = 0
+            self.play_job = self.root.after_idle(self.play_frame_step)
+
+    def stop_play(self):
+        if self.play_job is not None:
+            self.root.after_cancel(self.play_job)
+            self.play_job = None
+            self.play_button.config(text="Play")
+
+    # draws one frame of auto-play with all steps due by now, then waits until the next step is due
+    def play_frame_step(self):
+        try:
+            rate = float(self.play_rate_var.get())
+        except ValueError:
+            rate = self.play_rate
+        rate = max(rate, 1e-3)
+
+        now = time.perf_counter()
+        if rate != self.play_rate:
+            # restart the clock so a new rate does not count the steps played before
+            self.play_rate = rate
+            self.play_start = now
+            self.play_steps = 0
+
+        due = int((now - self.play_start) * rate) - self.play_steps
+        if due > self.max_lag * rate:
+            # too far behind (the steps themselves are slower than the rate), drop the backlog
+            due = max(1, int(self.max_lag * rate))
+            self.play_start = now - (self.play_steps + due) / rate
+
+        if due > 0:
+            # steps not taken within the frame budget are dropped as well
+            taken = self.simulator.advance(due, now + self.frame_budget)
+            self.play_start += (due - taken) / rate
+            self.play_steps += taken
+            if self.simulator.over:
+                self.play_job = None
+                self.play_button.config(text="Play")
+                return
+
+        # at least 1 ms, so drag and zoom events are handled between frames
+        delay = (self.play_start + (self.play_steps + 1) / rate - time.perf_counter()) * 1000
+        self.play_job = self.root.after(max(1, int(delay)), self.play_frame_step)
+
+    # saves the steps computed so far, so the search can be replayed without computing it again
+    def save_steps(self):
+        if self.simulator is None:
+            return
+
+        path = filedialog.asksaveasfilename(title="Save steps", defaultextension=".steps", filetypes=[("Search steps", "*.steps")])
+        if path:
+            self.simulator.save_steps(path)
+
+    # replays steps saved for the current tree and engine
+    def load_steps(self):
+        if self.simulator is None:
+            return
+
+        path = filedialog.askopenfilename(title="Load steps", filetypes=[("Search steps", "*.steps"), ("All files", "*")])
+        if not path:
+            return
+
+        self.stop_play()
+        try:
+            self.simulator.load_steps(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load steps", str(e))
+            return
+
+        self.set_timeline_steps(self.simulator.count_steps())
+        self.render(self.simulator.root_node, cutoffs=self.simulator.cutoff_index)
+
+    def set_timeline_steps(self, no_steps):
+        self.timeline_steps = no_steps
+        self.timeline.config(to=no_steps)
+
+    # jumps to the step selected on the timeline slider; the slider also calls this (from an idle
+    # callback) after render moved it, that step is already taken and seeking to it would replay a
+    # pending trace
+    def seek(self, step):
+        step = int(float(step))
+        if self.simulator is not None and step != self.simulator.current_step():
+            self.simulator.seek(step)
+
+    # redraws the tree after a simulation step, only touching changed nodes if incremental redraw is enabled
+    @instrumented("render")
+    def render(self, root_node, marked_node=None, cutoffs=None, is_prop_up=None, changed=None):
+        self.last_render = (root_node, marked_node, cutoffs, is_prop_up)
+
+        if self.culling.get():
+            self.draw_visible(root_node, marked_node, cutoffs, is_prop_up)
+        elif self.incremental_render.get() and self.node_items:
+            self.update_tree(marked_node, cutoffs, is_prop_up, changed)
+        else:
+            self.draw_tree(root_node, self.node_radius, marked_node=marked_node, cutoffs=cutoffs, is_prop_up=is_prop_up)
+
+        # keep timeline slider in sync with the simulator
+        if self.simulator is not None:
+            total_steps = self.simulator.total_steps
+            if total_steps is not None and total_steps != self.timeline_steps:
+                self.set_timeline_steps(total_steps)
+            self.timeline.set(self.simulator.current_step())
+
+    def toggle_culling(self):
+        self.canvas.culling = self.culling.get()
+        self.canvas.view_scale = 1.0
+
+        if self.last_render is not None:
+            root_node, marked_node, cutoffs, is_prop_up = self.last_render
+            if self.culling.get():
+                self.draw_visible(root_node, marked_node, cutoffs, is_prop_up)
+            else:
+                self.draw_tree(root_node, self.node_radius, marked_node=marked_node, cutoffs=cutoffs, is_prop_up=is_prop_up)
+
+    # schedules a redraw of the visible region after scrolling, zooming or resizing
+    def view_changed(self, ev=None):
+        if self.culling.get() and self.last_render is not None and self.redraw_pending is None:
+            self.redraw_pending = self.root.after_idle(self.redraw_view)
+
+    def redraw_view(self):
+        self.redraw_pending = None
+        self.draw_visible(*self.last_render)
+
+    # groups nodes by layer from left to right, with their x coordinates, parents,
+    # indices within parents, index of the first child in the next layer and average spacing
+    def build_layer_index(self, root_node):
+        self.layers = []
+        nodes, parents, child_idx = [root_node], [None], array('i', [0])
+
+        while nodes:
+            xs = array('d', (node.x for node in nodes))
+            spacing = (xs[-1] - xs[0]) / (len(nodes) - 1) if len(nodes) > 1 else float('inf')
+
+            next_nodes, next_parents, next_child_idx = [], [], array('i')
+            first_child = array('q', [0])
+            for node in nodes:
+                children = node.children
+                next_nodes.extend(children)
+                next_parents.extend([node] * len(children))
+                next_child_idx.extend(range(len(children)))
+                first_child.append(len(next_nodes))
+
+            self.layers.append((nodes[0].y, nodes, xs, parents, child_idx, first_child, spacing))
+            nodes, parents, child_idx = next_nodes, next_parents, next_child_idx
+
+    # draws only the part of the tree inside the visible canvas region, dense layers are collapsed
+    # into summary glyphs, so the number of items depends on the window size and not on the tree size
+    @instrumented("draw_visible")
+    def draw_visible(self, root_node, marked_node=None, cutoffs=None, is_prop_up=None):
+        if self.layers is None:
+            self.build_layer_index(root_node)
+
+        self.canvas.delete("all")
+        # incremental updates need items of all nodes, so they are not used together with culling
+        self.node_items = {}
+
+        scale = self.canvas.view_scale
+        radius = self.node_radius * scale
+        show_text = scale >= self.text_min_scale
+
+        # visible region in tree coordinates, extended by margins so edges leaving the view are kept
+        left = self.canvas.canvasx(0) / scale - self.margin_x
+        right = self.canvas.canvasx(self.canvas.winfo_width()) / scale + self.margin_x
+        top = self.canvas.canvasy(0) / scale - self.margin_y
+        bottom = self.canvas.canvasy(self.canvas.winfo_height()) / scale + self.margin_y
+
+        self.draw_visible_separators(scale, top, bottom)
+
+        # range of visible nodes in the previous layer
+        prev_range = None
+
+        for depth, (y, nodes, xs, parents, child_idx, first_child, spacing) in enumerate(self.layers):
+            if spacing * scale < self.lod_spacing:
+                self.draw_glyphs(depth - 1, scale, left, right, top, bottom, show_text)
+                break
+
+            if y < top or y > bottom:
+                prev_range = None
+                continue
+
+            visible_lo, visible_hi = bisect_left(xs, left), bisect_right(xs, right)
+            lo, hi = visible_lo, visible_hi
+
+            # children of visible parents are drawn as well, so that their edges are complete
+            if prev_range is not None:
+                prev_first_child = self.layers[depth - 1][5]
+                lo = min(lo, prev_first_child[prev_range[0]])
+                hi = max(hi, prev_first_child[prev_range[1]])
+            prev_range = (visible_lo, visible_hi) if visible_lo < visible_hi else None
+
+            for i in range(lo, hi):
+                node, parent = nodes[i], parents[i]
+
+                # connect node with parent and draw cutoff line
+                if parent is not None:
+                    node_x, node_y = node.x * scale, node.y * scale
+                    parent_x, parent_y = parent.x * scale, parent.y * scale
+                    self.canvas.create_line(parent_x, parent_y, node_x, node_y, width=1, fill="black")
+
+                    cutoff_idx = self.lowest_cutoff(parent, cutoffs)
+                    if cutoff_idx is not None and cutoff_idx <= child_idx[i]:
+                        self.draw_perpendicular_line(parent_x, parent_y, node_x, node_y)
+
+            for i in range(lo, hi):
+                node = nodes[i]
+                state = self.node_style(node, marked_node, is_prop_up)
+                self.create_node_items(node, node.x * scale, node.y * scale, radius, state, show_text=show_text)
+
+    # draws one glyph per subtree below the given layer, showing subtree size and range of leaf values
+    def draw_glyphs(self, depth, scale, left, right, top, bottom, show_text):
+        y, nodes, xs, _, _, _, spacing = self.layers[depth]
+        glyph_top, glyph_bottom = self.layers[depth + 1][0], self.layers[-1][0]
+        if glyph_top > bottom or glyph_bottom < top:
+            return
+
+        radius = self.node_radius * scale
+        # subtrees are roughly as wide as the spacing between their roots
+        lo, hi = bisect_left(xs, left - spacing), bisect_right(xs, right + spacing)
+
+        for node in nodes[lo:hi]:
+            size, min_value, max_value, min_x, max_x = self.subtree_summary(node)
+            x1, x2 = min_x * scale - radius, max_x * scale + radius
+            y1, y2 = glyph_top * scale - radius, glyph_bottom * scale + radius
+
+            self.canvas.create_line(node.x * scale, node.y * scale, (x1 + x2) / 2, y1, width=1, fill="black")
+            self.canvas.create_rectangle(x1, y1, x2, y2, fill="gray85", outline="gray50")
+            if show_text and x2 - x1 > 60:
+                text = f"{size} nodes\n{min_value:g} .. {max_value:g}"
+                self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=text, font=("Arial", 10), fill="black")
+
+    # returns number of descendants, min and max leaf value and x range of the node's subtree
+    def subtree_summary(self, node):
+        if node not in self.summaries:
+            size, min_value, max_value = 0, float('inf'), float('-inf')
+            stack = list(node.children)
+            while stack:
+                descendant = stack.pop()
+                size += 1
+                if descendant.is_leaf():
+                    min_value = min(min_value, descendant.value)
+                    max_value = max(max_value, descendant.value)
+                else:
+                    stack.extend(descendant.children)
+
+            leftmost = rightmost = node
+            while not leftmost.is_leaf():
+                leftmost = leftmost.children[0]
+            while not rightmost.is_leaf():
+                rightmost = rightmost.children[-1]
+
+            self.summaries[node] = (size, min_value, max_value, leftmost.x, rightmost.x)
+        return self.summaries[node]
+
+    # draws separators and layer types of visible layers
+    def draw_visible_separators(self, scale, top, bottom):
+        padding = 75
+        text_padding = 60
+
+        # separators of dense layers would only cover the tree
+        if self.margin_y * scale < self.lod_spacing:
+            return
+
+        min_x, max_x = self.layout.min_x - padding, self.layout.max_x + padding
+        list_y = self.layout.layer_ys
+
+        for i in range(bisect_left(list_y, top), bisect_right(list_y, bottom)):
+            layer_y = list_y[i]
+
+            if i > 0:
+                y_line = (list_y[i - 1] + layer_y) / 2 * scale
+                self.canvas.create_line((min_x - padding) * scale, y_line, (max_x + padding) * scale, y_line, dash=(4, 2), fill="black")
+
+            text = "MAX" if i % 2 == 0 else "MIN"
+            self.canvas.create_text((max_x + text_padding) * scale, layer_y * scale, text=text, font=("Arial", 12, "bold"), fill="black")
+
+    # draws tree on canvas
+    @instrumented("draw_tree")
+    def draw_tree(self, root_node, radius, parent_x=None, parent_y=None, marked_node=None, cutoffs=None, cutoff=False, is_prop_up=None):
+        # clear canvas
+        if parent_x is None and parent_y is None:
+            self.canvas.delete("all")
+
+            self.node_items = {}
+            self.edge_items = {}
+            self.cutoff_items = {}
+            self.node_state = {}
+            self.cutoff_state = {}
+            self.marked_node = marked_node
+            self.item_nodes = {}
+
+        self.draw_separators(root_node)
+        self.draw_nodes(root_node, radius, parent_x, parent_y, marked_node, cutoffs, cutoff, is_prop_up)
+
+    # draws nodes on canvas
+    @instrumented("draw_nodes")
+    def draw_nodes(self, node, radius, parent_x=None, parent_y=None, marked_node=None, cutoffs=None, cutoff=False, is_prop_up=None):
+        # depth-first traversal without recursion: edges are drawn on the way down and
+        # nodes on the way up (expanded), so that nodes are drawn over their edges
+        stack = [(node, parent_x, parent_y, cutoff, False)]
+
+        while stack:
+            node, parent_x, parent_y, cutoff, expanded = stack.pop()
+            tag = self.node_tag(node)
+
+            if expanded:
+                state = self.node_style(node, marked_node, is_prop_up)
+                items = self.node_items[node] = self.create_node_items(node, node.x, node.y, radius, state, tags=tag)
+                self.item_nodes[items[0]] = node
+                self.node_state[node] = state
+                continue
+
+            # connect node with parent
+            if parent_x is not None and parent_y is not None:
+                self.edge_items[node] = self.canvas.create_line(parent_x, parent_y, node.x, node.y, width=1, fill="black", tags=tag)
+
+            # draw cutoff line 
+            if cutoff:
+                self.cutoff_items[node] = self.draw_perpendicular_line(parent_x, parent_y, node.x, node.y, tags=tag)
+
+            cutoff_idx = self.lowest_cutoff(node, cutoffs)
+            self.cutoff_state[node] = cutoff_idx
+
+            stack.append((node, None, None, False, True))
+
+            children = node.children
+            for i in range(len(children) - 1, -1, -1):
+                # determine if there is a cutoff
+                cutoff = cutoff_idx is not None and cutoff_idx <= i
+
+                stack.append((children[i], node.x, node.y, cutoff, False))
+
+    # draws node as triangle with its value and alpha beta values, returns the created items
+    def create_node_items(self, node, x, y, radius, state, tags=None, show_text=True):
+        color, text_color, value_text, alpha_beta_text = state
+        vertices = triangle_vertices(node.is_max, x, y, radius)
+        
+        polygon = self.canvas.create_polygon(vertices, fill=color, tags=tags)
+
+        if not show_text:
+            return polygon, None, None
+        
+        # draw node value
+        text_yoffset = (0.2 if node.is_max else -0.2) * radius 
+        value_item = self.canvas.create_text(x, y + text_yoffset, text=value_text, font=("Arial", 10, "bold"), fill=text_color, tags=tags)
+        
+        # draw alpha beta values
+        alpha_beta_item = self.canvas.create_text(x, y - 1.5 * radius, text=alpha_beta_text, font=("Arial", 10, "bold"), fill=text_color, tags=tags)
+
+        return polygon, value_item, alpha_beta_item
+
+    # updates canvas items of nodes whose drawn state changed, without recreating the tree
+    @instrumented("update_tree")
+    def update_tree(self, marked_node=None, cutoffs=None, is_prop_up=None, changed=None):
+        if changed is None:
+            nodes = self.node_items.keys()
+        else:
+            nodes = {node for node in changed if node is not None}
+            # previously marked node has to lose its highlight
+            if self.marked_node is not None:
+                nodes.add(self.marked_node)
+            if marked_node is not None:
+                nodes.add(marked_node)
+
+        for node in nodes:
+            state = self.node_style(node, marked_node, is_prop_up)
+            prev_state = self.node_state[node]
+
+            if state != prev_state:
+                polygon, value_item, alpha_beta_item = self.node_items[node]
+                color, text_color, value_text, alpha_beta_text = state
+
+                if color != prev_state[0]:
+                    self.canvas.itemconfig(polygon, fill=color)
+                if (text_color, value_text) != (prev_state[1], prev_state[2]):
+                    self.canvas.itemconfig(value_item, text=value_text, fill=text_color)
+                if (text_color, alpha_beta_text) != (prev_state[1], prev_state[3]):
+                    self.canvas.itemconfig(alpha_beta_item, text=alpha_beta_text, fill=text_color)
+
+                self.node_state[node] = state
+
+            self.update_cutoffs(node, self.lowest_cutoff(node, cutoffs))
+
+        self.marked_node = marked_node
+
+    # adds or removes cutoff marks on node's child edges
+    def update_cutoffs(self, node, cutoff_idx):
+        if self.cutoff_state[node] == cutoff_idx:
+            return
+        self.cutoff_state[node] = cutoff_idx
+
+        for i, child in enumerate(node.children):
+            cutoff = cutoff_idx is not None and cutoff_idx <= i
+
+            if cutoff and child not in self.cutoff_items:
+                # edge might have been moved by zooming, so use its current coordinates
+                edge = self.edge_items[child]
+                x1, y1, x2, y2 = self.canvas.coords(edge)
+                self.cutoff_items[child] = self.draw_perpendicular_line(x1, y1, x2, y2, tags=self.node_tag(child))
+                self.canvas.tag_raise(self.cutoff_items[child], edge)
+            elif not cutoff and child in self.cutoff_items:
+                self.canvas.delete(self.cutoff_items.pop(child))
+
+    # returns fill color, text color, value text and alpha beta text of a node
+    # (shared with the image export)
+    def node_style(self, node, marked_node, is_prop_up):
+        return node_style_of(node, marked_node, is_prop_up, self.simulator)
+
+    # returns lowest cutoff child index of a node (None if there is no cutoff),
+    # cutoffs map nodes to their lowest cutoff child index
+    def lowest_cutoff(self, node, cutoffs):
+        return cutoffs.get(node) if cutoffs else None
+
+    # canvas tag shared by all items of a node
+    def node_tag(self, node):
+        return f"node{hash(node)}"
+
+    # draws cutoff mark across the middle of an edge
+    def draw_perpendicular_line(self, x1, y1, x2, y2, length=10, tags=None):
+        return self.canvas.create_line(*perpendicular_line(x1, y1, x2, y2, length), width=4, fill="red", tags=tags)
+
+    # draws dotted separators between tree layers
+    @instrumented("draw_separators")
+    def draw_separators(self, root_node):
+        # bounds and layer positions are cached by the layout
+        lines, labels = layer_separators(self.layout)
+
+        # draw separator between each layer
+        for x1, x2, y_line in lines:
+            self.canvas.create_line(x1, y_line, x2, y_line, dash=(4, 2), fill="black")
+
+        # draw layer type
+        for x, layer_y, text in labels:
+            self.canvas.create_text(x, layer_y, text=text, font=("Arial", 12, "bold"), fill="black")
@@ -0,0 +1,45 @@
+# compares batch_minimax (NumPy, all leaf vectors at once) with one alpha beta search per leaf
+# vector on a uniform tree, checks that the root values match; needs NumPy
+#
+# usage: python benchmarks/bench_batch.py [depth] [branching] [rows]
+
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("bench_batch.py needs NumPy (pip install numpy)")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from alpha_beta import ArrayTree, alpha_beta_search, batch_minimax
+
+# searched rows are timed on a sample and extrapolated to all rows
+SEARCHED_ROWS = 20
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    branching = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    no_rows = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+
+    tree_structure_lst = [[branching] * branching ** d for d in range(depth)]
+    leaf_values = np.random.default_rng(42).integers(-1000, 1000, (no_rows, branching ** depth)).astype(np.float64)
+
+    start = time.perf_counter()
+    result = batch_minimax(tree_structure_lst, leaf_values)
+    batch_time = time.perf_counter() - start
+
+    sample = min(no_rows, SEARCHED_ROWS)
+    start = time.perf_counter()
+    for row in range(sample):
+        root_node = ArrayTree.generate_tree(tree_structure_lst, leaf_values[row].tolist())
+        assert alpha_beta_search(root_node).value == result.values[row]
+    search_time = (time.perf_counter() - start) / sample * no_rows
+
+    print(f"{no_rows} rows of {branching ** depth} leaves")
+    print(f"batch_minimax: {batch_time:.2f} s, alpha beta search per row: {search_time:.2f} s (from {sample} rows), speedup {search_time / batch_time:.1f}x")
+
+if __name__ == "__main__":
+    main()
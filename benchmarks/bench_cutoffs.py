@@ -0,0 +1,55 @@
+# measures full redraw time against number of cutoffs, comparing the per-node
+# cutoff index with the old scan over the whole cutoffs list
+#
+# usage: python benchmarks/bench_cutoffs.py
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from alpha_beta import AlphaBetaSimulator, TreeLayout, TreeNode
+from headless import BenchApp
+
+# old lookup: scans all (parent, cutoff_idx) pairs for every node
+class ScanApp(BenchApp):
+    def lowest_cutoff(self, node, cutoffs):
+        lowest = None
+        for cutoff_pair in cutoffs or []:
+            if cutoff_pair[0] == node and (lowest is None or cutoff_pair[1] < lowest):
+                lowest = cutoff_pair[1]
+        return lowest
+
+def build_tree(branching, depth, seed):
+    rnd = random.Random(seed)
+    tree_structure_lst = [[branching] * branching ** d for d in range(depth)]
+    leaf_values = [float(rnd.randint(-100, 100)) for _ in range(branching ** depth)]
+
+    root_node = TreeNode.generate_tree(tree_structure_lst, leaf_values)
+    return root_node, TreeLayout(root_node, 90, 150, 90, 150)
+
+def time_redraw(app, root_node, cutoffs):
+    start = time.perf_counter()
+    app.draw_tree(root_node, app.node_radius, cutoffs=cutoffs)
+    return time.perf_counter() - start
+
+def main():
+    print(f"{'tree':>8} {'nodes':>8} {'cutoffs':>8} {'index [ms]':>12} {'scan [ms]':>12}")
+
+    for branching, depth in [(2, 6), (3, 6), (4, 6), (5, 6), (6, 6)]:
+        root_node, layout = build_tree(branching, depth, seed=42)
+        nodes = sum(branching ** d for d in range(depth + 1))
+
+        simulator = AlphaBetaSimulator(None, root_node)
+        while not simulator.over:
+            simulator.forward(draw=False)
+
+        index_time = time_redraw(BenchApp(layout), root_node, simulator.cutoff_index)
+        scan_time = time_redraw(ScanApp(layout), root_node, simulator.cutoffs)
+
+        print(f"{branching}^{depth:<6} {nodes:>8} {len(simulator.cutoffs):>8} {index_time * 1000:>12.1f} {scan_time * 1000:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# compares serial alpha beta with the process pool search (parallel_alpha_beta_search)
+# on a random uniform tree, reports speedup and extra nodes searched
+#
+# usage: python benchmarks/bench_parallel.py [depth] [branching] [max_workers]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from alpha_beta import ArrayTree, array_alpha_beta, parallel_alpha_beta_search
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    branching = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+    rnd = random.Random(42)
+
+    tree_structure_lst = [[branching] * branching ** d for d in range(depth)]
+    leaf_values = [float(rnd.randint(-1000, 1000)) for _ in range(branching ** depth)]
+    tree = ArrayTree.generate_tree(tree_structure_lst, leaf_values).tree
+
+    start = time.perf_counter()
+    value, visited, _ = array_alpha_beta(tree.degrees, tree.child_offsets, tree.is_max, tree.leaf_values, 0, float('-inf'), float('inf'))
+    serial_time = time.perf_counter() - start
+
+    print(f"{tree.no_nodes} nodes, value {value:g}, serial: {serial_time:.2f} s, {visited} nodes visited")
+    print(f"{'workers':>8} {'time [s]':>9} {'speedup':>8} {'visited':>10} {'extra nodes':>12}")
+
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        result = parallel_alpha_beta_search(tree.root, workers)
+        elapsed = time.perf_counter() - start
+        assert result.value == value
+
+        print(f"{workers:>8} {elapsed:>9.2f} {serial_time / elapsed:>8.2f} {result.visited:>10} {result.visited - visited:>12}")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# times tree building, layout, drawing and search stages on seeded synthetic trees,
+# with peak memory per stage, and writes the results as JSON so two runs can be compared
+#
+# usage: python benchmarks/bench_suite.py [--output results.json] [--compare old.json]
+#                                         [--repeat 3] [--seed 42] [--quick] [--no-memory]
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from alpha_beta import AlphaBetaSimulator, TreeLayout, TreeNode
+from headless import BenchApp
+from trees import make_tree
+
+TREES = ["uniform:2:12", "uniform:4:6", "uniform:8:4", "random:7:5"]
+QUICK_TREES = ["uniform:2:8", "uniform:4:4", "random:5:4"]
+ORDERINGS = ["best", "random", "worst"]
+
+# every stage prepares its input (not timed) and returns the function to time
+def stage_generate_tree(tree_structure_lst, leaf_values):
+    return lambda: TreeNode.generate_tree(tree_structure_lst, leaf_values)
+
+def stage_set_position(tree_structure_lst, leaf_values):
+    root_node = TreeNode.generate_tree(tree_structure_lst, leaf_values)
+    return lambda: root_node.set_position(90, 150, 90, 150)
+
+def stage_draw_tree(tree_structure_lst, leaf_values):
+    root_node = TreeNode.generate_tree(tree_structure_lst, leaf_values)
+    app = BenchApp(TreeLayout(root_node, 90, 150, 90, 150))
+    return lambda: app.draw_tree(root_node, app.node_radius)
+
+def drawn_simulator(tree_structure_lst, leaf_values):
+    root_node = TreeNode.generate_tree(tree_structure_lst, leaf_values)
+    app = BenchApp(TreeLayout(root_node, 90, 150, 90, 150))
+    app.draw_tree(root_node, app.node_radius)
+    app.simulator = AlphaBetaSimulator(app, root_node)
+    return app.simulator
+
+# every step of the search, rendered incrementally
+def stage_forward(tree_structure_lst, leaf_values):
+    simulator = drawn_simulator(tree_structure_lst, leaf_values)
+
+    def run():
+        while not simulator.over:
+            simulator.forward()
+    return run
+
+def stage_all_forward(tree_structure_lst, leaf_values):
+    simulator = drawn_simulator(tree_structure_lst, leaf_values)
+    return simulator.all_forward
+
+STAGES = {
+    "generate_tree": stage_generate_tree,
+    "set_position": stage_set_position,
+    "draw_tree": stage_draw_tree,
+    "forward": stage_forward,
+    "all_forward": stage_all_forward,
+}
+
+# best time of repeat runs, and peak memory of one more run under tracemalloc
+def measure(stage, tree, repeat, memory):
+    times = []
+    for _ in range(repeat):
+        run = stage(*tree)
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        run = stage(*tree)
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return min(times), peak
+
+def run_suite(tree_specs, repeat, seed, memory):
+    results = []
+    print(f"{'tree':>14} {'ordering':>8} {'nodes':>8} {'stage':>14} {'time [ms]':>10} {'peak [MB]':>10}")
+
+    for spec in tree_specs:
+        for ordering in ORDERINGS:
+            tree = make_tree(spec, ordering, seed)
+            nodes = 1 + sum(sum(layer_degrees) for layer_degrees in tree[0])
+
+            for name, stage in STAGES.items():
+                seconds, peak = measure(stage, tree, repeat, memory)
+                results.append({"tree": spec, "ordering": ordering, "nodes": nodes, "stage": name, "seconds": seconds, "peak_bytes": peak})
+
+                peak_str = "-" if peak is None else f"{peak / 2 ** 20:.1f}"
+                print(f"{spec:>14} {ordering:>8} {nodes:>8} {name:>14} {seconds * 1000:>10.1f} {peak_str:>10}")
+
+    return results
+
+# prints time and memory ratios (new / old) of the stages both runs measured
+def compare(old_results, new_results):
+    old = {(r["tree"], r["ordering"], r["stage"]): r for r in old_results}
+
+    print(f"{'tree':>14} {'ordering':>8} {'stage':>14} {'old [ms]':>10} {'new [ms]':>10} {'time':>7} {'memory':>7}")
+    for r in new_results:
+        o = old.get((r["tree"], r["ordering"], r["stage"]))
+        if o is None:
+            continue
+        time_ratio = r["seconds"] / o["seconds"] if o["seconds"] else float('nan')
+        memory_ratio = r["peak_bytes"] / o["peak_bytes"] if r["peak_bytes"] and o["peak_bytes"] else float('nan')
+        print(f"{r['tree']:>14} {r['ordering']:>8} {r['stage']:>14} {o['seconds'] * 1000:>10.1f} {r['seconds'] * 1000:>10.1f} {time_ratio:>6.2f}x {memory_ratio:>6.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark suite for tree building, layout, drawing and search")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the best time is kept")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--quick", action="store_true", help="only small trees")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory measurement")
+    args = parser.parse_args()
+
+    tree_specs = QUICK_TREES if args.quick else TREES
+    results = run_suite(tree_specs, args.repeat, args.seed, not args.no_memory)
+
+    if args.output:
+        meta = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        }
+        with open(args.output, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            old_results = json.load(f)["results"]
+        print()
+        compare(old_results, results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# compares build time and memory of TreeNode trees with the array-backed ArrayTree
+#
+# usage: python benchmarks/bench_tree_store.py [max_depth]
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from alpha_beta import ArrayTree, TreeNode
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    root_node = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return root_node, elapsed, peak
+
+def main():
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 18
+    rnd = random.Random(42)
+
+    print(f"{'leaves':>10} {'TreeNode [s]':>13} {'TreeNode [MB]':>14} {'ArrayTree [s]':>14} {'ArrayTree [MB]':>15}")
+
+    for depth in range(10, max_depth + 1, 2):
+        tree_structure_lst = [[2] * 2 ** d for d in range(depth)]
+        leaf_values = [float(rnd.randint(-100, 100)) for _ in range(2 ** depth)]
+
+        _, node_time, node_peak = measure(lambda: TreeNode.generate_tree(tree_structure_lst, leaf_values))
+        _, array_time, array_peak = measure(lambda: ArrayTree.generate_tree(tree_structure_lst, leaf_values))
+
+        print(f"{2 ** depth:>10} {node_time:>13.2f} {node_peak / 2 ** 20:>14.1f} {array_time:>14.2f} {array_peak / 2 ** 20:>15.1f}")
+
+if __name__ == "__main__":
+    main()
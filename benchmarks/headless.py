@@ -0,0 +1,99 @@
+# canvas and app stand-ins shared by the benchmarks, so no display is needed
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from alpha_beta_gui import App
+
+# canvas stand-in that only hands out item ids, counts them and keeps their coordinates
+class NullCanvas:
+    def __init__(self, width=1024, height=640):
+        self.item_coords = {}
+        self.last_item = 0
+        self.no_items = 0
+        self.width = width
+        self.height = height
+        self.culling = False
+        self.view_scale = 1.0
+
+    def create_item(self, *args, **kwargs):
+        self.last_item += 1
+        self.no_items += 1
+        self.item_coords[self.last_item] = args
+        return self.last_item
+
+    create_line = create_polygon = create_rectangle = create_text = create_item
+
+    def delete(self, *args):
+        if "all" in args:
+            self.item_coords = {}
+            self.no_items = 0
+
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+    def coords(self, item, *args):
+        if args:
+            self.item_coords[item] = args
+        return list(self.item_coords[item])
+
+    def tag_raise(self, *args):
+        pass
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def canvasx(self, x):
+        return x
+
+    def canvasy(self, y):
+        return y
+
+    def xview_moveto(self, fraction):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+# value holder standing in for tk variables and the timeline slider
+class Setting:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def config(self, **kwargs):
+        pass
+
+# App drawing on a NullCanvas, without a Tk window
+class BenchApp(App):
+    def __init__(self, layout=None, incremental=True):
+        self.canvas = NullCanvas()
+        self.node_radius = 30
+        self.margin_x = 90
+        self.margin_y = 150
+        self.layout = layout
+
+        self.simulator = None
+        self.timeline = Setting(0)
+        self.timeline_steps = 0
+        self.culling = Setting(False)
+        self.incremental_render = Setting(incremental)
+        self.last_render = None
+
+        self.node_items = {}
+        self.edge_items = {}
+        self.cutoff_items = {}
+        self.node_state = {}
+        self.cutoff_state = {}
+        self.marked_node = None
+        self.item_nodes = {}
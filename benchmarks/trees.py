@@ -0,0 +1,67 @@
+# seeded synthetic trees for the benchmarks, in the app's input format
+# (tree_structure_lst with the degrees of every layer, leaf values in breadth-first order)
+
+import random
+from itertools import accumulate
+
+# every internal node has the same number of children
+def uniform_structure(branching, depth):
+    return [[branching] * branching ** d for d in range(depth)]
+
+# degrees drawn uniformly from 1..max_branching
+def random_structure(depth, max_branching, rnd):
+    tree_structure_lst = []
+    width = 1
+    for _ in range(depth):
+        tree_structure_lst.append([rnd.randint(1, max_branching) for _ in range(width)])
+        width = sum(tree_structure_lst[-1])
+    return tree_structure_lst
+
+def random_leaves(no_leaves, rnd):
+    return [float(rnd.randint(-1000, 1000)) for _ in range(no_leaves)]
+
+# reorders children so that the best move of every node comes first ("best", most pruning) or
+# last ("worst", no pruning at all); "random" keeps the order; the minimax value does not change
+def order_tree(tree_structure_lst, leaf_values, ordering):
+    if ordering == "random":
+        return tree_structure_lst, leaf_values
+
+    offsets = [list(accumulate(layer_degrees, initial=0)) for layer_degrees in tree_structure_lst]
+
+    # minimax value of every node, bottom-up (layer 0 is the max layer)
+    values = [leaf_values]
+    for l in range(len(tree_structure_lst) - 1, -1, -1):
+        child_values = values[0]
+        best = max if l % 2 == 0 else min
+        values.insert(0, [best(child_values[offsets[l][i]:offsets[l][i + 1]]) for i in range(len(tree_structure_lst[l]))])
+
+    # rebuild the layers top-down with sorted children, order holds original indices in the new order
+    ordered_structure = []
+    order = [0]
+    for l, layer_degrees in enumerate(tree_structure_lst):
+        # max nodes prefer high values, min nodes low values
+        descending = (l % 2 == 0) == (ordering == "best")
+        next_order = []
+        for i in order:
+            children = range(offsets[l][i], offsets[l][i + 1])
+            next_order.extend(sorted(children, key=values[l + 1].__getitem__, reverse=descending))
+        ordered_structure.append([layer_degrees[i] for i in order])
+        order = next_order
+
+    return ordered_structure, [leaf_values[i] for i in order]
+
+# builds a tree from a spec like "uniform:4:6" (branching, depth) or "random:6:5" (depth, max branching)
+def make_tree(spec, ordering, seed):
+    rnd = random.Random(seed)
+    kind, *params = spec.split(":")
+    if kind == "uniform":
+        branching, depth = map(int, params)
+        tree_structure_lst = uniform_structure(branching, depth)
+    elif kind == "random":
+        depth, max_branching = map(int, params)
+        tree_structure_lst = random_structure(depth, max_branching, rnd)
+    else:
+        raise ValueError(f"unknown tree kind: {kind}")
+
+    leaf_values = random_leaves(sum(tree_structure_lst[-1]), rnd)
+    return order_tree(tree_structure_lst, leaf_values, ordering)
@@ -0,0 +1,172 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from alpha_beta_engine import AlphaBetaSimulator, ArrayTree, InputError, TreeNode, parse_leaf_values, parse_tree_input
+
+STORES = [TreeNode.generate_tree, ArrayTree.generate_tree]
+
+# (value, alpha, beta) of every node, depth first
+def node_states(root_node):
+    states = []
+    stack = [root_node]
+    while stack:
+        node = stack.pop()
+        states.append((node.value, node.alpha, node.beta))
+        stack.extend(node.children)
+    return states
+
+@pytest.mark.parametrize("leaves, column", [("nan,1,2,3", 1), ("1, -NaN,2,3", 4), ("1,2,3,+nan*1", 7)])
+def test_nan_leaf_is_rejected(leaves, column):
+    with pytest.raises(InputError) as e:
+        parse_tree_input("2|2,2", leaves)
+    assert e.value.field == "leaves" and e.value.position == column - 1
+
+def test_nan_leaf_edit_is_rejected():
+    with pytest.raises(InputError):
+        parse_leaf_values("nan", 1)
+
+# infinite leaves are kept through undo and seeks, only None is stored as NaN
+@pytest.mark.parametrize("generate_tree", STORES)
+def test_infinite_leaves_survive_undo(generate_tree):
+    tree_structure_lst, leaf_values = parse_tree_input("2|2,2", "inf,-inf,3,inf")
+    root_node = generate_tree(tree_structure_lst, leaf_values)
+    simulator = AlphaBetaSimulator(None, root_node, 4)
+    start = node_states(root_node)
+
+    simulator.all_forward(fast=False)
+    end = node_states(root_node)
+    assert root_node.value == 3
+
+    simulator.seek(0, draw=False)
+    assert node_states(root_node) == start
+    simulator.seek(simulator.count_steps(), draw=False)
+    assert node_states(root_node) == end
+
+# counts the steps seek replays one by one
+class CountingSimulator(AlphaBetaSimulator):
+    replayed = 0
+
+    def move_path(self, path, s):
+        self.replayed += 1
+        AlphaBetaSimulator.move_path(self, path, s)
+
+    def undo_step(self, s, changed):
+        self.replayed += 1
+        AlphaBetaSimulator.undo_step(self, s, changed)
+
+    def redo_step(self, s, changed):
+        self.replayed += 1
+        AlphaBetaSimulator.redo_step(self, s, changed)
+
+# node states come from the step log in bulk, only the current path is replayed from the nearest snapshot
+@pytest.mark.parametrize("generate_tree", STORES)
+def test_seek_replays_at_most_snapshot_interval(generate_tree):
+    tree_structure_lst, leaf_values = parse_tree_input("3^5", "seed:5")
+    root_node = generate_tree(tree_structure_lst, leaf_values)
+    simulator = CountingSimulator(None, root_node, 20)
+    simulator.all_forward(fast=False)
+    total = simulator.step
+
+    states = {}
+    simulator.seek(0, draw=False)
+    for step in range(total + 1):
+        states[step] = node_states(root_node)
+        simulator.forward(draw=False)
+
+    for start, target in [(total, 0), (0, total), (0, total // 2), (total // 2, 7), (7, total - 3), (total - 3, total - 30)]:
+        simulator.seek(start, draw=False)
+        simulator.replayed = 0
+        simulator.seek(target, draw=False)
+        assert simulator.replayed <= simulator.snapshot_interval
+        assert simulator.step == target and node_states(root_node) == states[target]
+
+    # stepping on after a seek takes the same steps as before
+    simulator.seek(total // 3, draw=False)
+    while simulator.step < total:
+        simulator.forward(draw=False)
+        assert node_states(root_node) == states[simulator.step]
+    while simulator.step > total // 4:
+        simulator.backward(draw=False)
+        assert node_states(root_node) == states[simulator.step]
+
+# counts the steps plain alpha beta searches (instead of replaying them)
+class SearchCountingSimulator(AlphaBetaSimulator):
+    searched = 0
+
+    def search_forward(self):
+        self.searched += 1
+        AlphaBetaSimulator.search_forward(self)
+
+def leaves(root_node):
+    nodes = []
+    stack = [root_node]
+    while stack:
+        node = stack.pop()
+        if node.is_leaf():
+            nodes.append(node)
+        stack.extend(reversed(node.children))
+    return nodes
+
+# a leaf edit leaves the simulator as if the edited tree was searched up to the same step
+@pytest.mark.parametrize("generate_tree", STORES)
+@pytest.mark.parametrize("position", ["end", "middle", "fast end"])
+def test_leaf_edit_matches_new_search(generate_tree, position):
+    tree_structure_lst, leaf_values = parse_tree_input("3^5", "seed:3")
+    root_node = generate_tree(tree_structure_lst, leaf_values)
+    simulator = AlphaBetaSimulator(None, root_node, 20)
+    simulator.all_forward(fast=position == "fast end")
+    if position == "middle":
+        simulator.seek(simulator.step // 2, draw=False)
+    step = simulator.current_step()
+
+    edited = list(leaf_values)
+    for i in [0, 40, 100, 7]:
+        edited[i] += 5
+        simulator.set_leaf_value(leaves(root_node)[i], edited[i])
+
+        expected_root = generate_tree(tree_structure_lst, edited)
+        expected = AlphaBetaSimulator(None, expected_root, 20)
+        if position == "middle":
+            expected.seek(step, draw=False)
+            assert simulator.step == step
+        else:
+            expected.all_forward(fast=False)
+            assert simulator.current_step() == expected.step
+        assert node_states(root_node) == node_states(expected_root)
+        assert len(simulator.cutoffs) == len(expected.cutoffs)
+
+    # the steps taken over from before the edit are the ones the edited tree takes
+    simulator.all_forward(fast=False)
+    expected.all_forward(fast=False)
+    simulator.seek(0, draw=False)
+    expected.seek(0, draw=False)
+    while not simulator.over:
+        simulator.forward(draw=False)
+        expected.forward(draw=False)
+        assert node_states(root_node) == node_states(expected_root)
+    assert expected.over
+
+# the search stops once an ancestor of the edited leaf is left as before
+def test_leaf_edit_searches_until_unchanged():
+    tree_structure_lst, leaf_values = parse_tree_input("3|2,2,2", "3,5,2,9,1,4")
+    root_node = TreeNode.generate_tree(tree_structure_lst, leaf_values)
+    simulator = SearchCountingSimulator(None, root_node, 1000)
+    simulator.all_forward(fast=False)
+    total = simulator.step
+
+    # the min node above keeps 3, only entering and leaving the leaf is searched again
+    simulator.searched = 0
+    simulator.set_leaf_value(leaves(root_node)[1], 6)
+    assert simulator.searched == 2 and simulator.over and simulator.step == total
+
+    # a new value of the first min node changes the bounds of the later ones, so
+    # everything from the edited leaf on is searched again (the second min node
+    # now enters both its leaves)
+    simulator.searched = 0
+    simulator.set_leaf_value(leaves(root_node)[0], 1)
+    assert simulator.step == total + 2 and root_node.value == 2
+    assert simulator.searched == simulator.step - simulator.first_step(leaves(root_node)[0])